@@ -5,23 +5,127 @@ Library Python untuk melakukan pencarian di berbagai mesin pencari
 (Google, Bing, DuckDuckGo, Yahoo, Mojeek, Brave) dengan interface OOP yang sederhana.
 """
 
-from .engines.google import GoogleSearch
-from .engines.bing import BingSearch
-from .engines.duckduckgo import DuckDuckGoSearch
-from .engines.yahoo import YahooSearch
-from .engines.mojeek import MojeekSearch
-from .engines.brave import BraveSearch
-from .base import SearchEngine, SearchResult, PageContent
-from .cache import FileCache, MemoryCache, CacheInterface
-from .rate_limiter import RateLimiter
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from .exceptions import (
     SearchEngineException,
     NetworkException,
     ParseException,
     RateLimitException,
-    BlockedException
+    BlockedException,
+    ProxyPoolExhaustedException
 )
-from .helpers import quick_search, search_all_engines, get_available_engines, SearchAllResult, visit_url
+
+# Nama publik -> modul; di-import saat pertama diakses (PEP 562) agar
+# `import SearchEngine` tidak memuat engine, bs4 maupun requests.
+_LAZY_ATTRIBUTES = {
+    "GoogleSearch": ".engines.google",
+    "BingSearch": ".engines.bing",
+    "DuckDuckGoSearch": ".engines.duckduckgo",
+    "YahooSearch": ".engines.yahoo",
+    "MojeekSearch": ".engines.mojeek",
+    "BraveSearch": ".engines.brave",
+    "SearchEngine": ".base",
+    "SearchResult": ".base",
+    "SearchResponse": ".base",
+    "PageContent": ".base",
+    "CompactResult": ".results",
+    "ResultSet": ".results",
+    "ResultView": ".results",
+    "compact_results": ".results",
+    "write_ndjson": ".serialization",
+    "write_json_array": ".serialization",
+    "set_json_backend": ".serialization",
+    "get_json_backend": ".serialization",
+    "FileCache": ".cache",
+    "MemoryCache": ".cache",
+    "CacheInterface": ".cache",
+    "CacheCodec": ".cache_codecs",
+    "JSONCodec": ".cache_codecs",
+    "BinaryResultCodec": ".cache_codecs",
+    "MsgpackCodec": ".cache_codecs",
+    "RateLimiter": ".rate_limiter",
+    "SerpArchive": ".archive",
+    "ArchiveEntry": ".archive",
+    "ReparseResult": ".archive",
+    "EventBus": ".metrics",
+    "MetricEvent": ".metrics",
+    "MetricsAggregator": ".metrics",
+    "TraceRecorder": ".metrics",
+    "to_prometheus": ".metrics",
+    "HealthTracker": ".health",
+    "CircuitBreaker": ".health",
+    "EngineHealth": ".health",
+    "RetryPolicy": ".retry",
+    "RetryBudget": ".retry",
+    "RetryStats": ".retry",
+    "ProxyPool": ".proxy",
+    "Proxy": ".proxy",
+    "ParseExecutor": ".parse_executor",
+    "QueryNormalizer": ".query",
+    "NormalizedQuery": ".query",
+    "dedupe_queries": ".query",
+    "SingleFlight": ".single_flight",
+    "NegativeCache": ".negative_cache",
+    "warm_cache": ".warming",
+    "preload_cache": ".warming",
+    "WarmReport": ".warming",
+    "dump_snapshot": ".snapshot",
+    "load_snapshot": ".snapshot",
+    "SnapshotCache": ".snapshot",
+    "PeriodicSnapshot": ".snapshot",
+    "EngineRegistry": ".registry",
+    "EngineInfo": ".registry",
+    "register_engine": ".registry",
+    "get_engine_info": ".registry",
+    "quick_search": ".helpers",
+    "search_all_engines": ".helpers",
+    "get_available_engines": ".helpers",
+    "SearchAllResult": ".helpers",
+    "visit_url": ".helpers",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .engines.google import GoogleSearch
+    from .engines.bing import BingSearch
+    from .engines.duckduckgo import DuckDuckGoSearch
+    from .engines.yahoo import YahooSearch
+    from .engines.mojeek import MojeekSearch
+    from .engines.brave import BraveSearch
+    from .base import SearchEngine, SearchResult, SearchResponse, PageContent
+    from .results import CompactResult, ResultSet, ResultView, compact_results
+    from .serialization import write_ndjson, write_json_array, set_json_backend, get_json_backend
+    from .cache import FileCache, MemoryCache, CacheInterface
+    from .cache_codecs import CacheCodec, JSONCodec, BinaryResultCodec, MsgpackCodec
+    from .rate_limiter import RateLimiter
+    from .archive import SerpArchive, ArchiveEntry, ReparseResult
+    from .metrics import EventBus, MetricEvent, MetricsAggregator, TraceRecorder, to_prometheus
+    from .health import HealthTracker, CircuitBreaker, EngineHealth
+    from .retry import RetryPolicy, RetryBudget, RetryStats
+    from .proxy import ProxyPool, Proxy
+    from .parse_executor import ParseExecutor
+    from .query import QueryNormalizer, NormalizedQuery, dedupe_queries
+    from .single_flight import SingleFlight
+    from .negative_cache import NegativeCache
+    from .warming import warm_cache, preload_cache, WarmReport
+    from .snapshot import dump_snapshot, load_snapshot, SnapshotCache, PeriodicSnapshot
+    from .registry import EngineRegistry, EngineInfo, register_engine, get_engine_info
+    from .helpers import quick_search, search_all_engines, get_available_engines, SearchAllResult, visit_url
 
 __version__ = "1.1.0"
 __author__ = "developerxnoxs"
@@ -35,15 +139,62 @@ __all__ = [
     "BraveSearch",
     "SearchEngine",
     "SearchResult",
+    "SearchResponse",
+    "CompactResult",
+    "ResultSet",
+    "ResultView",
+    "write_ndjson",
+    "write_json_array",
+    "set_json_backend",
+    "get_json_backend",
+    "compact_results",
     "FileCache",
     "MemoryCache",
     "CacheInterface",
+    "CacheCodec",
+    "JSONCodec",
+    "BinaryResultCodec",
+    "MsgpackCodec",
     "RateLimiter",
+    "SerpArchive",
+    "ArchiveEntry",
+    "ReparseResult",
+    "EventBus",
+    "MetricEvent",
+    "MetricsAggregator",
+    "TraceRecorder",
+    "to_prometheus",
+    "HealthTracker",
+    "CircuitBreaker",
+    "EngineHealth",
+    "RetryPolicy",
+    "RetryBudget",
+    "RetryStats",
+    "ProxyPool",
+    "Proxy",
+    "ParseExecutor",
+    "QueryNormalizer",
+    "NormalizedQuery",
+    "dedupe_queries",
+    "SingleFlight",
+    "NegativeCache",
+    "warm_cache",
+    "preload_cache",
+    "WarmReport",
+    "dump_snapshot",
+    "load_snapshot",
+    "SnapshotCache",
+    "PeriodicSnapshot",
+    "EngineRegistry",
+    "EngineInfo",
+    "register_engine",
+    "get_engine_info",
     "SearchEngineException",
     "NetworkException",
     "ParseException",
     "RateLimitException",
     "BlockedException",
+    "ProxyPoolExhaustedException",
     "quick_search",
     "search_all_engines",
     "get_available_engines",
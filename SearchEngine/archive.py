@@ -0,0 +1,249 @@
+"""
+Arsip SERP mentah untuk Multi Search Engine Library
+
+Menyimpan setiap halaman hasil pencarian (HTML mentah, terkompresi gzip)
+di disk lokal, sehingga hasil dapat di-parse ulang dengan versi
+_parse_results terbaru tanpa melakukan request ulang ke search engine.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any, Iterator
+import gzip
+import hashlib
+import json
+import os
+import time
+
+
+@dataclass
+class ArchiveEntry:
+    """Metadata satu SERP yang diarsipkan"""
+    engine: str
+    query: str
+    params: Dict[str, Any]
+    timestamp: float
+    path: str
+    url: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Konversi ke dictionary (tanpa path)"""
+        return {
+            "engine": self.engine,
+            "query": self.query,
+            "params": self.params,
+            "timestamp": self.timestamp,
+            "url": self.url
+        }
+
+
+@dataclass
+class ReparseResult:
+    """Hasil parse ulang satu SERP dari arsip"""
+    entry: ArchiveEntry
+    results: List[Any] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+class SerpArchive:
+    """
+    Arsip SERP mentah berbasis file.
+
+    Layout: <archive_dir>/<engine>/<YYYYMMDD>/<timestamp>-<hash>.html.gz
+    dengan metadata di file .json di sebelahnya.
+    """
+
+    def __init__(self, archive_dir: str = ".serp_archive", compresslevel: int = 6):
+        """
+        Inisialisasi SerpArchive
+
+        Args:
+            archive_dir: Direktori untuk menyimpan arsip
+            compresslevel: Level kompresi gzip (1-9)
+        """
+        self.archive_dir = archive_dir
+        self.compresslevel = compresslevel
+        if not os.path.exists(self.archive_dir):
+            os.makedirs(self.archive_dir, exist_ok=True)
+
+    def _entry_base(self, engine: str, query: str, params: Dict[str, Any], timestamp: float) -> str:
+        """Path dasar (tanpa ekstensi) untuk satu entry"""
+        key_data = f"{engine}:{query}:{json.dumps(params, sort_keys=True)}"
+        digest = hashlib.md5(key_data.encode()).hexdigest()[:16]
+        day = time.strftime("%Y%m%d", time.gmtime(timestamp))
+        directory = os.path.join(self.archive_dir, engine, day)
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"{int(timestamp * 1_000_000)}-{digest}")
+
+    def store(
+        self,
+        engine: str,
+        query: str,
+        params: Dict[str, Any],
+        html: str,
+        url: str = "",
+        timestamp: Optional[float] = None
+    ) -> ArchiveEntry:
+        """
+        Simpan satu SERP mentah ke arsip.
+
+        Args:
+            engine: Nama engine (ENGINE_NAME)
+            query: Kata kunci pencarian
+            params: Parameter pencarian (page, num_results, language, ...)
+            html: HTML mentah hasil fetch
+            url: URL yang di-fetch (opsional)
+            timestamp: Waktu fetch (default: sekarang)
+
+        Returns:
+            ArchiveEntry: Metadata entry yang disimpan
+        """
+        timestamp = timestamp if timestamp is not None else time.time()
+        base = self._entry_base(engine, query, params, timestamp)
+        entry = ArchiveEntry(
+            engine=engine,
+            query=query,
+            params=dict(params),
+            timestamp=timestamp,
+            path=base + ".html.gz",
+            url=url
+        )
+
+        with gzip.open(entry.path, "wb", compresslevel=self.compresslevel) as f:
+            f.write(html.encode("utf-8"))
+        with open(base + ".json", "w", encoding="utf-8") as f:
+            json.dump(entry.to_dict(), f, ensure_ascii=False)
+
+        return entry
+
+    def entries(
+        self,
+        engine: Optional[str] = None,
+        query: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None
+    ) -> Iterator[ArchiveEntry]:
+        """
+        Iterasi entry di arsip, urut berdasarkan waktu per engine.
+
+        Args:
+            engine: Filter nama engine
+            query: Filter kata kunci (exact match)
+            since: Hanya entry dengan timestamp >= since
+            until: Hanya entry dengan timestamp < until
+        """
+        if not os.path.isdir(self.archive_dir):
+            return
+
+        engines = [engine] if engine else sorted(os.listdir(self.archive_dir))
+        for engine_name in engines:
+            engine_dir = os.path.join(self.archive_dir, engine_name)
+            if not os.path.isdir(engine_dir):
+                continue
+            for day in sorted(os.listdir(engine_dir)):
+                day_dir = os.path.join(engine_dir, day)
+                for filename in sorted(os.listdir(day_dir)):
+                    if not filename.endswith(".json"):
+                        continue
+                    meta_path = os.path.join(day_dir, filename)
+                    try:
+                        with open(meta_path, "r", encoding="utf-8") as f:
+                            meta = json.load(f)
+                    except (json.JSONDecodeError, IOError):
+                        continue
+
+                    if query is not None and meta.get("query") != query:
+                        continue
+                    if since is not None and meta.get("timestamp", 0) < since:
+                        continue
+                    if until is not None and meta.get("timestamp", 0) >= until:
+                        continue
+
+                    yield ArchiveEntry(
+                        engine=meta["engine"],
+                        query=meta["query"],
+                        params=meta.get("params", {}),
+                        timestamp=meta.get("timestamp", 0),
+                        path=meta_path[:-len(".json")] + ".html.gz",
+                        url=meta.get("url", "")
+                    )
+
+    def load(self, entry: ArchiveEntry) -> str:
+        """Baca HTML mentah dari satu entry"""
+        with gzip.open(entry.path, "rb") as f:
+            return f.read().decode("utf-8")
+
+    def reparse(
+        self,
+        engine: Optional[str] = None,
+        query: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        parallel: bool = True,
+        chunksize: int = 16
+    ) -> Iterator[ReparseResult]:
+        """
+        Parse ulang SERP di arsip dengan _parse_results versi saat ini.
+
+        Args:
+            engine, query, since, until: Filter entry (lihat entries())
+            max_workers: Jumlah proses worker (default: jumlah CPU)
+            parallel: Gunakan process pool (default: True)
+            chunksize: Jumlah entry per task yang dikirim ke worker
+
+        Returns:
+            Iterator[ReparseResult]: Hasil per entry, urutan sama dengan entries()
+
+        Contoh:
+            >>> archive = SerpArchive(".serp_archive")
+            >>> for item in archive.reparse(engine="duckduckgo"):
+            ...     print(item.entry.query, len(item.results))
+        """
+        from .base import SearchResult
+
+        entries = list(self.entries(engine=engine, query=query, since=since, until=until))
+        jobs = [(e.engine, e.path, e.params) for e in entries]
+
+        if parallel and len(jobs) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                outputs = executor.map(_reparse_job, jobs, chunksize=chunksize)
+                for entry, (dicts, error) in zip(entries, outputs):
+                    yield ReparseResult(entry, [SearchResult(**d) for d in dicts], error)
+        else:
+            for entry, job in zip(entries, jobs):
+                dicts, error = _reparse_job(job)
+                yield ReparseResult(entry, [SearchResult(**d) for d in dicts], error)
+
+
+def _reparse_job(job) -> tuple:
+    """Worker: load, cek blocked page, parse, dan kembalikan hasil sebagai list of dict"""
+    from .base import detect_blocked_page
+    from .helpers import ENGINES
+
+    engine_name, path, params = job
+    try:
+        with gzip.open(path, "rb") as f:
+            html = f.read().decode("utf-8")
+
+        blocked_message = detect_blocked_page(html)
+        if blocked_message:
+            return [], blocked_message
+
+        engine = ENGINES[engine_name]()
+        results = engine._parse_results(html)
+
+        page = params.get("page", 1)
+        num_results = params.get("num_results", 10)
+        for i, result in enumerate(results):
+            result.position = (page - 1) * num_results + i + 1
+            result.engine = engine.ENGINE_NAME
+
+        return [r.to_dict() for r in results], None
+    except Exception as e:
+        return [], str(e)
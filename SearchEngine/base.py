@@ -3,20 +3,39 @@ Base class untuk semua search engines
 """
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
-import requests
-from bs4 import BeautifulSoup
+from threading import Lock
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Union, Sequence, Mapping, Iterator, Callable, TYPE_CHECKING
+import codecs
 import time
 import random
 import hashlib
 import json
 
-from .exceptions import NetworkException, ParseException, BlockedException
+from .exceptions import NetworkException, ParseException, BlockedException, RateLimitException
 from .cache import CacheInterface
 from .rate_limiter import RateLimiter
+from .archive import SerpArchive
+from .results import CompactResult, ResultSet, ResultListView
+from .serialization import write_ndjson, write_json_array
+from .metrics import EventBus, NULL_STAGE, trace
+from .retry import RetryPolicy
+from .proxy import ProxyPool, Proxy
+from .extraction import Strainer
+from .streaming import BlockSplitter, HEAD_CHECK_SIZE
+from .result_window import ResultWindow, window_bounds, plan_fetch
+from .decoding import decode_response, charset_from_content_type, HEADER, DEFAULT
+from .query import QueryNormalizer, NormalizedQuery, DEFAULT_NORMALIZER
+from .single_flight import SingleFlight
+from .negative_cache import NegativeCache, EMPTY, to_exception
 import re
 
+if TYPE_CHECKING:
+    from .parse_executor import ParseExecutor
+
 
 BLOCKED_PAGE_PATTERNS = [
     (r'<form[^>]*captcha[^>]*>', 'Captcha detected - please use a proxy'),
@@ -46,6 +65,49 @@ def detect_blocked_page(html: str) -> Optional[str]:
     return None
 
 
+# Durasi stage pencarian yang sedang berjalan (diisi oleh SearchEngine.execute)
+_STAGE_TIMINGS: ContextVar[Optional[Dict[str, float]]] = ContextVar("searchengine_stage_timings", default=None)
+
+CACHE_HIT = "hit"
+CACHE_MISS = "miss"
+CACHE_BYPASS = "bypass"
+CACHE_PARTIAL = "partial"
+CACHE_NEGATIVE = "negative"
+
+
+@contextmanager
+def _timed_stage(timings: Dict[str, float], stage: str, inner):
+    """Catat durasi stage ke timings (dijumlahkan jika stage berulang, mis. retry)"""
+    start = time.perf_counter()
+    try:
+        with inner:
+            yield
+    finally:
+        timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
+
+
+def _release_after_error(pool: ProxyPool, proxy: Proxy, latency: float, error: BaseException):
+    """Kembalikan proxy ke pool dengan status sesuai exception yang terjadi"""
+    if isinstance(error, RateLimitException):
+        pool.release(proxy, latency, blocked=True, rate_limited=True)
+    elif isinstance(error, BlockedException):
+        pool.release(proxy, latency, blocked=True)
+    elif isinstance(error, NetworkException):
+        pool.release(proxy, latency, failed=True)
+    else:
+        pool.release(proxy, latency)
+
+
+def _parse_retry_after(response) -> Optional[float]:
+    """Nilai header Retry-After dalam detik (hanya format angka)"""
+    headers = getattr(response, "headers", None)
+    try:
+        value = headers.get("Retry-After") if headers is not None else None
+        return float(value) if value is not None else None
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
 @dataclass
 class PageContent:
     """Representasi konten halaman yang di-visit"""
@@ -56,6 +118,7 @@ class PageContent:
     status_code: int
     success: bool
     error: Optional[str] = None
+    encoding: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Konversi ke dictionary"""
@@ -96,6 +159,10 @@ class SearchResult:
             "extra": self.extra
         }
     
+    def compact(self) -> "CompactResult":
+        """Konversi ke CompactResult yang hemat memori"""
+        return CompactResult.from_result(self)
+    
     def visit(self, timeout: int = 30, user_agent: Optional[str] = None) -> PageContent:
         """
         Kunjungi URL dan ambil konten halaman.
@@ -120,9 +187,13 @@ class SearchResult:
             "Accept-Language": "en-US,en;q=0.9"
         }
         
+        import requests
+        from bs4 import BeautifulSoup
+        
         try:
             response = requests.get(self.url, headers=headers, timeout=timeout)
-            soup = BeautifulSoup(response.text, 'html.parser')
+            html, encoding, _ = decode_response(response)
+            soup = BeautifulSoup(html, 'html.parser')
             
             title = soup.title.string if soup.title else ""
             
@@ -135,9 +206,10 @@ class SearchResult:
                 url=self.url,
                 title=title or self.title,
                 text=text,
-                html=response.text,
+                html=html,
                 status_code=response.status_code,
-                success=True
+                success=True,
+                encoding=encoding
             )
         except requests.exceptions.Timeout:
             return PageContent(
@@ -154,12 +226,88 @@ class SearchResult:
         return f"SearchResult(title='{self.title[:50]}...', url='{self.url}')"
 
 
+@dataclass(frozen=True)
+class SearchResponse:
+    """
+    Hasil satu pencarian dari SearchEngine.execute (immutable).
+    
+    Attributes:
+        query: Kata kunci pencarian
+        engine: Nama engine
+        results: Hasil pencarian (tuple, atau ResultListView jika cache_views)
+        raw_html: SERP mentah ("" jika dari cache)
+        url: URL yang di-fetch (None jika dari cache)
+        cache_status: "hit", "miss", "partial" (cache_windows: sebagian posisi
+                      dari cache), "negative" (hasil kosong dari NegativeCache)
+                      atau "bypass" (cache tidak dipakai)
+        timings: Durasi per stage dalam detik (cache_lookup, rate_limit_wait,
+                 delay, fetch, decode, block_detect, parse, total)
+        trace_id: Trace id metrics (None jika metrics tidak diset)
+        query_key: Query ter-normalisasi yang dipakai untuk cache dan coalescing
+        coalesced: True jika hasil diambil dari pencarian identik yang sedang
+                   berjalan di thread lain (coalesce=True)
+    """
+    query: str
+    engine: str
+    results: Sequence[SearchResult]
+    raw_html: str = ""
+    url: Optional[str] = None
+    cache_status: str = CACHE_BYPASS
+    timings: Mapping[str, float] = field(default_factory=lambda: MappingProxyType({}))
+    trace_id: Optional[str] = None
+    query_key: Optional[str] = None
+    coalesced: bool = False
+    
+    @property
+    def from_cache(self) -> bool:
+        return self.cache_status == CACHE_HIT
+    
+    @property
+    def elapsed(self) -> float:
+        """Durasi total pencarian (detik)"""
+        return self.timings.get("total", 0.0)
+    
+    def filter_by_keyword(self, keyword: str) -> List[SearchResult]:
+        """Filter hasil berdasarkan kata kunci di title atau description"""
+        keyword_lower = keyword.lower()
+        return [
+            r for r in self.results
+            if keyword_lower in r.title.lower() or keyword_lower in r.description.lower()
+        ]
+    
+    def filter_by_domain(self, domain: str) -> List[SearchResult]:
+        """Filter hasil berdasarkan domain"""
+        domain_lower = domain.lower()
+        return [r for r in self.results if domain_lower in r.url.lower()]
+    
+    def result_set(self) -> ResultSet:
+        return ResultSet(list(self.results))
+    
+    def to_dict_list(self) -> List[Dict[str, Any]]:
+        return [r.to_dict() for r in self.results]
+    
+    def to_json(self, indent: int = 2) -> str:
+        return json.dumps(self.to_dict_list(), indent=indent, ensure_ascii=False)
+    
+    def __len__(self) -> int:
+        return len(self.results)
+    
+    def __iter__(self):
+        return iter(self.results)
+
+
 class SearchEngine(ABC):
     """Base class untuk semua search engines"""
     
     ENGINE_NAME = "base"
     BASE_URL = ""
     
+    # Strainer blok hasil untuk search_stream (None = RESULT_SPEC.prune)
+    STREAM_BLOCK: Optional[Strainer] = None
+    
+    # Encoding SERP jika header dan <meta> tidak menyebut charset (None = sniff)
+    DEFAULT_ENCODING: Optional[str] = "utf-8"
+    
     DEFAULT_USER_AGENTS = [
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -171,12 +319,21 @@ class SearchEngine(ABC):
     def __init__(
         self,
         user_agent: Optional[str] = None,
-        proxy: Optional[str] = None,
+        proxy: Optional[Union[str, ProxyPool]] = None,
         timeout: int = 30,
         delay: float = 1.0,
         cache: Optional[CacheInterface] = None,
         rate_limiter: Optional[RateLimiter] = None,
-        scraper_api_key: Optional[str] = None
+        scraper_api_key: Optional[str] = None,
+        archive: Optional[SerpArchive] = None,
+        cache_views: bool = False,
+        cache_windows: bool = False,
+        metrics: Optional[EventBus] = None,
+        retry: Optional[RetryPolicy] = None,
+        parse_executor: Optional["ParseExecutor"] = None,
+        query_normalizer: Optional[QueryNormalizer] = None,
+        coalesce: Union[bool, SingleFlight] = False,
+        negative_cache: Optional[NegativeCache] = None
     ):
         self.user_agent = user_agent or random.choice(self.DEFAULT_USER_AGENTS)
         self.proxy = proxy
@@ -185,7 +342,17 @@ class SearchEngine(ABC):
         self.cache = cache
         self.rate_limiter = rate_limiter
         self.scraper_api_key = scraper_api_key
+        self.archive = archive
+        self.cache_views = cache_views
+        self.cache_windows = cache_windows
+        self.metrics = metrics
+        self.retry = retry
+        self.parse_executor = parse_executor
+        self.query_normalizer = query_normalizer or DEFAULT_NORMALIZER
+        self.single_flight = SingleFlight() if coalesce is True else (coalesce or None)
+        self.negative_cache = negative_cache
         self._last_request_time = 0
+        self._delay_lock = Lock()
         self._results: List[SearchResult] = []
         self._raw_html: str = ""
     
@@ -211,8 +378,8 @@ class SearchEngine(ABC):
         }
     
     def _get_proxies(self) -> Optional[Dict[str, str]]:
-        """Get proxy configuration"""
-        if self.proxy:
+        """Get proxy configuration (ProxyPool ditangani di _fetch_via_pool)"""
+        if self.proxy and not isinstance(self.proxy, ProxyPool):
             return {
                 "http": self.proxy,
                 "https": self.proxy
@@ -220,15 +387,44 @@ class SearchEngine(ABC):
         return None
     
     def _apply_delay(self):
-        """Apply delay between requests"""
-        if self.delay > 0:
-            elapsed = time.time() - self._last_request_time
-            if elapsed < self.delay:
-                time.sleep(self.delay - elapsed + random.uniform(0.1, 0.5))
-        self._last_request_time = time.time()
-    
-    def _generate_cache_key(self, query: str, **params) -> str:
-        """Generate unique cache key"""
+        """
+        Apply delay between requests
+        
+        Slot request dipesan di bawah lock lalu sleep di luar lock, sehingga
+        thread yang berbagi instance tetap berjarak minimal `delay` detik.
+        """
+        wait = 0.0
+        with self._delay_lock:
+            now = time.time()
+            if self.delay > 0:
+                elapsed = now - self._last_request_time
+                if elapsed < self.delay:
+                    wait = self.delay - elapsed + random.uniform(0.1, 0.5)
+            self._last_request_time = now + wait
+        if wait > 0:
+            time.sleep(wait)
+    
+    def _stage(self, stage: str, **tags):
+        """Timer untuk satu stage pencarian (no-op jika metrics tidak diset dan di luar execute)"""
+        inner = NULL_STAGE if self.metrics is None else self.metrics.timer(stage, self.ENGINE_NAME, **tags)
+        timings = _STAGE_TIMINGS.get()
+        if timings is None:
+            return inner
+        return _timed_stage(timings, stage, inner)
+    
+    def _count(self, name: str, value: float = 1, **tags):
+        """Emit counter ke metrics (jika diset)"""
+        if self.metrics is not None:
+            self.metrics.count(name, self.ENGINE_NAME, value, **tags)
+    
+    def normalize_query(self, query: Union[str, NormalizedQuery]) -> NormalizedQuery:
+        """Normalisasi query dengan query_normalizer engine (sekali per pencarian)"""
+        return self.query_normalizer.normalize(query)
+    
+    def _generate_cache_key(self, query: Union[str, NormalizedQuery], **params) -> str:
+        """Generate unique cache key (NormalizedQuery memakai key ter-normalisasinya)"""
+        if isinstance(query, NormalizedQuery):
+            query = query.key
         key_data = f"{self.ENGINE_NAME}:{query}:{json.dumps(params, sort_keys=True)}"
         return hashlib.md5(key_data.encode()).hexdigest()
     
@@ -240,45 +436,196 @@ class SearchEngine(ABC):
         return url
     
     def _fetch(self, url: str) -> str:
-        """Fetch URL content"""
+        """Fetch URL content (dengan retry jika RetryPolicy diset)"""
+        return self._with_retry(lambda: self._fetch_once(url))
+    
+    def _with_retry(self, func: Callable[[], Any]) -> Any:
+        """Jalankan func lewat RetryPolicy (jika diset), meng-emit metrics retry"""
+        if self.retry is None:
+            return func()
+        
+        def on_retry(attempt: int, error: Exception, delay: float):
+            self._count("retry", reason=type(error).__name__)
+        
+        def on_give_up(error: Exception, reason: str):
+            if reason != "not_retryable":
+                self._count("retry_gave_up", reason=reason)
+        
+        return self.retry.call(func, on_retry=on_retry, on_give_up=on_give_up)
+    
+    def _fetch_once(self, url: str) -> str:
+        """Satu percobaan fetch URL"""
         if self.rate_limiter:
-            self.rate_limiter.wait()
+            with self._stage("rate_limit_wait"):
+                self.rate_limiter.wait()
+        
+        with self._stage("delay"):
+            self._apply_delay()
         
-        self._apply_delay()
+        if isinstance(self.proxy, ProxyPool) and not self.scraper_api_key:
+            return self._fetch_via_pool(url, self.proxy)
+        
+        if self.scraper_api_key:
+            url = self._build_url_with_scraper_api(url)
+            proxies = None
+        else:
+            proxies = self._get_proxies()
         
+        import requests
+        return self._request(url, requests.get, proxies)
+    
+    def _fetch_via_pool(self, url: str, pool: ProxyPool) -> str:
+        """Fetch lewat proxy dari ProxyPool, dengan rate limiter dan session milik proxy"""
+        proxy = pool.acquire(self.ENGINE_NAME)
+        start = time.perf_counter()
         try:
-            if self.scraper_api_key:
-                url = self._build_url_with_scraper_api(url)
-                proxies = None
-            else:
-                proxies = self._get_proxies()
-            
-            response = requests.get(
-                url,
-                headers=self._get_headers(),
-                proxies=proxies,
-                timeout=self.timeout,
-                allow_redirects=True
-            )
-            
-            if response.status_code == 429:
-                if self.rate_limiter:
-                    self.rate_limiter.backoff()
-                raise BlockedException("Rate limited by search engine")
+            with self._stage("rate_limit_wait", proxy=proxy.label):
+                proxy.rate_limiter.wait()
+            html = self._request(url, proxy.get, None)
+        except BaseException as e:
+            _release_after_error(pool, proxy, time.perf_counter() - start, e)
+            raise
+        pool.release(proxy, time.perf_counter() - start, blocked=detect_blocked_page(html) is not None)
+        return html
+    
+    def _open_stream(self, url: str):
+        """
+        Seperti _fetch_once, tetapi mengembalikan respons yang body-nya belum dibaca
+        
+        Returns:
+            Tuple (response, proxy dari ProxyPool atau None)
+        """
+        if self.rate_limiter:
+            with self._stage("rate_limit_wait"):
+                self.rate_limiter.wait()
+        
+        with self._stage("delay"):
+            self._apply_delay()
+        
+        if isinstance(self.proxy, ProxyPool) and not self.scraper_api_key:
+            proxy = self.proxy.acquire(self.ENGINE_NAME)
+            start = time.perf_counter()
+            try:
+                with self._stage("rate_limit_wait", proxy=proxy.label):
+                    proxy.rate_limiter.wait()
+                return self._send(url, proxy.get, None, stream=True), proxy
+            except BaseException as e:
+                _release_after_error(self.proxy, proxy, time.perf_counter() - start, e)
+                raise
+        
+        if self.scraper_api_key:
+            url = self._build_url_with_scraper_api(url)
+            proxies = None
+        else:
+            proxies = self._get_proxies()
+        
+        import requests
+        return self._send(url, requests.get, proxies, stream=True), None
+    
+    def _iter_stream_text(self, response, chunk_size: int) -> Iterator[str]:
+        """Decode body respons streaming per chunk"""
+        import requests
+        
+        headers = getattr(response, "headers", None)
+        encoding = charset_from_content_type(headers.get("Content-Type") if headers is not None else None)
+        source = HEADER
+        if encoding is None:
+            encoding, source = self.DEFAULT_ENCODING or "utf-8", DEFAULT
+        self._count("decode", source=source, encoding=encoding)
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        
+        total = 0
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    total += len(chunk)
+                    yield decoder.decode(chunk)
+        except requests.exceptions.RequestException as e:
+            self._count("network_error", kind="stream")
+            raise NetworkException(f"Stream terputus: {str(e)}")
+        self._count("bytes_downloaded", total)
+        yield decoder.decode(b"", final=True)
+    
+    def _request(self, url: str, get, proxies: Optional[Dict[str, str]]) -> str:
+        """Kirim GET dan kembalikan body sebagai teks"""
+        return self._decode(self._send(url, get, proxies))
+    
+    def _decode(self, response) -> str:
+        """Decode response.content dengan encoding eksplisit (lihat decoding.py)"""
+        with self._stage("decode"):
+            text, encoding, source = decode_response(response, self.DEFAULT_ENCODING)
+        if source is not None:
+            self._count("decode", source=source, encoding=encoding)
+        return text
+    
+    def _send(self, url: str, get, proxies: Optional[Dict[str, str]], stream: bool = False):
+        """
+        Kirim GET dan petakan status/error HTTP ke exception library
+        
+        Dengan stream=True body belum dibaca (dipakai search_stream).
+        """
+        import requests
+        
+        try:
+            with self._stage("fetch"):
+                kwargs = {"stream": True} if stream else {}
+                response = get(
+                    url,
+                    headers=self._get_headers(),
+                    proxies=proxies,
+                    timeout=self.timeout,
+                    allow_redirects=True,
+                    **kwargs
+                )
             
-            if response.status_code == 403:
-                raise BlockedException("Blocked by search engine")
+            if self.metrics is not None:
+                self._count("http_status", status=response.status_code)
+                content = None if stream else getattr(response, "content", None)
+                if isinstance(content, (bytes, bytearray)):
+                    self._count("bytes_downloaded", len(content))
             
-            response.raise_for_status()
-            return response.text
+            try:
+                self._check_status(response)
+            except (BlockedException, NetworkException):
+                # Body stream tidak pernah dibaca; kembalikan koneksi ke pool
+                if stream:
+                    response.close()
+                raise
+            return response
             
         except requests.exceptions.Timeout:
+            self._count("network_error", kind="timeout")
             raise NetworkException(f"Request timeout after {self.timeout}s")
         except requests.exceptions.ConnectionError as e:
+            self._count("network_error", kind="connection")
             raise NetworkException(f"Connection error: {str(e)}")
         except requests.exceptions.RequestException as e:
+            self._count("network_error", kind="request")
             raise NetworkException(f"Request failed: {str(e)}")
     
+    def _check_status(self, response):
+        """Raise exception untuk status 429/403 dan status HTTP error lain"""
+        import requests
+        
+        if response.status_code == 429:
+            if self.rate_limiter:
+                self.rate_limiter.backoff()
+            self._count("blocked", reason="http_429")
+            raise RateLimitException(
+                "Rate limited by search engine",
+                retry_after=_parse_retry_after(response)
+            )
+        
+        if response.status_code == 403:
+            self._count("blocked", reason="http_403")
+            raise BlockedException("Blocked by search engine")
+        
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            self._count("network_error", kind="http")
+            raise NetworkException(f"Request failed: {str(e)}", status_code=response.status_code)
+    
     @abstractmethod
     def _build_search_url(
         self,
@@ -297,6 +644,12 @@ class SearchEngine(ABC):
         """Parse HTML and extract results - must be implemented by subclasses"""
         pass
     
+    def _parse(self, html: str) -> List[SearchResult]:
+        """Parse HTML inline, atau lewat ParseExecutor jika diset"""
+        if self.parse_executor is None:
+            return self._parse_results(html)
+        return self.parse_executor.parse(self, html)
+    
     def search(
         self,
         query: str,
@@ -305,7 +658,8 @@ class SearchEngine(ABC):
         language: Optional[str] = None,
         country: Optional[str] = None,
         safe_search: bool = True,
-        use_cache: bool = True
+        use_cache: bool = True,
+        force_refresh: bool = False
     ) -> List[SearchResult]:
         """
         Melakukan pencarian
@@ -318,12 +672,312 @@ class SearchEngine(ABC):
             country: Kode negara (contoh: 'ID', 'US')
             safe_search: Aktifkan SafeSearch (default: True)
             use_cache: Gunakan cache (default: True)
+            force_refresh: Fetch ulang tanpa cache hasil maupun penanda
+                           NegativeCache (default: False)
+            
+        Wrapper stateful di atas execute(): hasil dan HTML mentah disimpan di
+        instance untuk get_results(), get_raw_html(), filter_by_*() dan
+        to_json(). Untuk instance yang dipakai bersama antar thread, gunakan
+        execute() yang tidak mengubah state instance.
             
         Returns:
             List[SearchResult]: Daftar hasil pencarian
         """
-        cache_key = self._generate_cache_key(
-            query,
+        response = self.execute(query, page, num_results, language, country, safe_search, use_cache, force_refresh)
+        self._raw_html = response.raw_html
+        if isinstance(response.results, ResultListView):
+            self._results = response.results
+        else:
+            self._results = list(response.results)
+        return self._results
+    
+    def execute(
+        self,
+        query: str,
+        page: int = 1,
+        num_results: int = 10,
+        language: Optional[str] = None,
+        country: Optional[str] = None,
+        safe_search: bool = True,
+        use_cache: bool = True,
+        force_refresh: bool = False
+    ) -> SearchResponse:
+        """
+        Melakukan pencarian tanpa mengubah state instance (reentrant).
+        
+        Satu instance boleh dipakai bersama oleh banyak thread; pacing
+        (delay, rate limiter, ProxyPool) tetap berlaku untuk semua thread.
+        Parameter sama seperti search().
+        
+        Jika cache_views aktif, cache hit mengembalikan ResultListView
+        (read-only) di atas payload cache tanpa membangun SearchResult baru.
+        
+        SERP mentah disimpan ke archive (jika diset) sebelum deteksi blokir
+        dan parsing, sehingga bisa di-parse ulang lewat SerpArchive.reparse().
+        
+        Jika metrics (EventBus) diset, durasi tiap stage (cache_lookup,
+        rate_limit_wait, delay, fetch, decode, block_detect, parse, total) dan
+        counter (cache_hit, cache_miss, http_status, bytes_downloaded, decode,
+        blocked, network_error, retry, retry_gave_up) di-emit dengan tag engine dan trace id per pencarian.
+        
+        Query dinormalisasi sekali (query_normalizer) dan key-nya dipakai
+        untuk cache key, coalescing dan SearchResponse.query_key; engine
+        menerima teks query yang sudah dirapikan. Dengan coalesce=True,
+        pencarian identik yang berjalan bersamaan di instance ini hanya
+        mem-fetch sekali (counter coalesced).
+        
+        Dengan negative_cache, hasil kosong dan outcome blokir/error dicatat
+        dengan TTL pendek; penanda yang masih berlaku mengembalikan hasil
+        kosong (cache_status "negative") atau melempar exception tanpa
+        request jaringan (counter negative_cache_hit). force_refresh
+        mengabaikan penanda dan cache hasil.
+        
+        Returns:
+            SearchResponse: Hasil, HTML mentah, durasi per stage dan status cache
+            
+        Contoh:
+            >>> response = engine.execute("python")
+            >>> response.results, response.cache_status, response.timings["fetch"]
+        """
+        normalized = self.normalize_query(query)
+        if force_refresh:
+            use_cache = False
+        timings: Dict[str, float] = {}
+        token = _STAGE_TIMINGS.set(timings)
+        try:
+            if self.metrics is None:
+                with self._stage("total"):
+                    outcome, coalesced = self._execute_once(
+                        normalized, page, num_results, language, country, safe_search, use_cache, force_refresh
+                    )
+                trace_id = None
+            else:
+                with trace() as trace_id, self._stage("total"):
+                    outcome, coalesced = self._execute_once(
+                        normalized, page, num_results, language, country, safe_search, use_cache, force_refresh
+                    )
+        finally:
+            _STAGE_TIMINGS.reset(token)
+        
+        return SearchResponse(
+            query=normalized.original,
+            engine=self.ENGINE_NAME,
+            timings=MappingProxyType(timings),
+            trace_id=trace_id,
+            query_key=normalized.key,
+            coalesced=coalesced,
+            **outcome
+        )
+    
+    async def execute_async(
+        self,
+        query: str,
+        page: int = 1,
+        num_results: int = 10,
+        language: Optional[str] = None,
+        country: Optional[str] = None,
+        safe_search: bool = True,
+        use_cache: bool = True,
+        force_refresh: bool = False
+    ) -> SearchResponse:
+        """
+        Versi asyncio dari execute().
+        
+        Fetch dan parse berjalan di thread pool default event loop; dengan
+        parse_executor, parsing halaman besar berjalan di process pool.
+        
+        Contoh:
+            >>> response = await engine.execute_async("python")
+        """
+        import asyncio
+        from functools import partial
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, partial(self.execute, query, page, num_results, language, country, safe_search, use_cache, force_refresh)
+        )
+    
+    def _execute_once(
+        self,
+        query: NormalizedQuery,
+        page: int,
+        num_results: int,
+        language: Optional[str],
+        country: Optional[str],
+        safe_search: bool,
+        use_cache: bool,
+        force_refresh: bool = False
+    ):
+        """_execute dengan negative_cache dan single_flight (jika diset); return (outcome, coalesced)"""
+        args = (query, page, num_results, language, country, safe_search, use_cache)
+        if self.negative_cache is None:
+            return self._execute_coalesced(*args)
+        
+        negative_key = self._generate_cache_key(
+            query, page=page, num_results=num_results, language=language, country=country, safe_search=safe_search
+        )
+        if not force_refresh and self._check_negative(negative_key) == EMPTY:
+            return {"results": (), "cache_status": CACHE_NEGATIVE}, False
+        
+        try:
+            outcome, coalesced = self._execute_coalesced(*args)
+        except (BlockedException, NetworkException) as e:
+            self.negative_cache.record_error(self.ENGINE_NAME, negative_key, e)
+            raise
+        if not outcome["results"]:
+            self.negative_cache.record_empty(self.ENGINE_NAME, negative_key)
+        return outcome, coalesced
+    
+    def _check_negative(self, negative_key: str) -> Optional[str]:
+        """
+        Cek penanda NegativeCache (counter negative_cache_hit)
+        
+        Returns:
+            EMPTY jika query tercatat tanpa hasil, None jika tidak ada penanda
+        """
+        marker = self.negative_cache.lookup(self.ENGINE_NAME, negative_key)
+        if marker is None:
+            return None
+        self._count("negative_cache_hit", outcome=marker["outcome"])
+        if marker["outcome"] == EMPTY:
+            return EMPTY
+        raise to_exception(self.ENGINE_NAME, marker)
+    
+    def _execute_coalesced(self, *args):
+        """_execute lewat single_flight (jika diset); return (outcome, coalesced)"""
+        query = args[0]
+        if self.single_flight is None:
+            return self._execute(*args), False
+        key = (self.ENGINE_NAME, query.key) + args[1:]
+        outcome, coalesced = self.single_flight.do(key, lambda: self._execute(*args))
+        if coalesced:
+            self._count("coalesced")
+        return outcome, coalesced
+    
+    def _execute(
+        self,
+        query: NormalizedQuery,
+        page: int,
+        num_results: int,
+        language: Optional[str],
+        country: Optional[str],
+        safe_search: bool,
+        use_cache: bool
+    ) -> Dict[str, Any]:
+        """Implementasi execute(); return field SearchResponse selain query/engine/timings"""
+        if self.cache and self.cache_windows:
+            return self._execute_window(query, page, num_results, language, country, safe_search, use_cache)
+        
+        params = {
+            "page": page,
+            "num_results": num_results,
+            "language": language,
+            "country": country,
+            "safe_search": safe_search
+        }
+        cache_key = self._generate_cache_key(query, **params)
+        cache_status = CACHE_BYPASS
+        
+        if use_cache and self.cache:
+            with self._stage("cache_lookup"):
+                cached = self.cache.get(cache_key)
+            if cached:
+                self._count("cache_hit")
+                return {"results": self._cached_results(cached), "cache_status": CACHE_HIT}
+            self._count("cache_miss")
+            cache_status = CACHE_MISS
+        
+        results, raw_html, url = self._fetch_page(query, page, num_results, language, country, safe_search)
+        
+        if self.cache:
+            self.cache.set(cache_key, [r.to_dict() for r in results])
+        
+        return {"results": tuple(results), "raw_html": raw_html, "url": url, "cache_status": cache_status}
+    
+    def _execute_window(
+        self,
+        query: NormalizedQuery,
+        page: int,
+        num_results: int,
+        language: Optional[str],
+        country: Optional[str],
+        safe_search: bool,
+        use_cache: bool
+    ) -> Dict[str, Any]:
+        """
+        _execute dengan cache per posisi (cache_windows=True)
+        
+        Hasil disimpan per (engine, query, locale) berdasarkan posisi absolut;
+        window yang sudah tercakup di-slice dari cache dan partial hit hanya
+        mem-fetch rentang posisi yang belum ada. Window ditulis ulang dengan
+        sisa TTL-nya dan dibatasi ResultWindow.MAX_POSITIONS posisi.
+        """
+        first, last = window_bounds(page, num_results)
+        window_key = self._generate_cache_key(
+            query, window=True, language=language, country=country, safe_search=safe_search
+        )
+        
+        with self._stage("cache_lookup"):
+            window = ResultWindow.from_payload(self.cache.get(window_key))
+        
+        gap = (first, last)
+        cache_status = CACHE_BYPASS
+        if use_cache:
+            gap = window.missing(first, last)
+            if gap is None:
+                self._count("cache_hit", window="full")
+                return {"results": self._cached_results(window.slice(first, last)), "cache_status": CACHE_HIT}
+            cache_status = CACHE_PARTIAL if window.overlaps(first, last) else CACHE_MISS
+            self._count("cache_miss", window=cache_status)
+        
+        fetch_page, fetch_size = plan_fetch(gap[0], gap[1], num_results)
+        results, raw_html, url = self._fetch_page(query, fetch_page, fetch_size, language, country, safe_search)
+        
+        fetch_first = window_bounds(fetch_page, fetch_size)[0]
+        window.add(fetch_first, fetch_size, [r.to_dict() for r in results])
+        window.trim(fetch_first + fetch_size - 1)
+        # Sisa TTL window dipertahankan agar query yang sering di-page tetap expire
+        ttl = window.remaining_ttl(getattr(self.cache, "default_ttl", 3600))
+        if ttl is not None:
+            self.cache.set(window_key, window.to_payload(), ttl=ttl)
+        
+        return {
+            "results": self._cached_results(window.slice(first, last)),
+            "raw_html": raw_html,
+            "url": url,
+            "cache_status": cache_status
+        }
+    
+    def _cached_results(self, cached: List[Dict[str, Any]]) -> Sequence[SearchResult]:
+        """Hasil dari payload cache (ResultListView jika cache_views)"""
+        if self.cache_views:
+            return ResultListView(cached)
+        return tuple(SearchResult(**r) for r in cached)
+    
+    def _fetch_page(
+        self,
+        query: NormalizedQuery,
+        page: int,
+        num_results: int,
+        language: Optional[str],
+        country: Optional[str],
+        safe_search: bool
+    ):
+        """
+        Fetch, archive, deteksi blokir dan parse satu halaman SERP
+        
+        Returns:
+            Tuple (hasil dengan position absolut, HTML mentah, URL)
+        """
+        params = {
+            "page": page,
+            "num_results": num_results,
+            "language": language,
+            "country": country,
+            "safe_search": safe_search
+        }
+        url = self._build_search_url(
+            query=query.text,
             page=page,
             num_results=num_results,
             language=language,
@@ -331,13 +985,121 @@ class SearchEngine(ABC):
             safe_search=safe_search
         )
         
+        raw_html = self._fetch(url)
+        
+        if self.archive:
+            try:
+                self.archive.store(self.ENGINE_NAME, query.text, params, raw_html, url=url)
+            except IOError:
+                pass
+        
+        with self._stage("block_detect"):
+            blocked_message = detect_blocked_page(raw_html)
+        if blocked_message:
+            self._count("blocked", reason="page")
+            raise BlockedException(blocked_message)
+        
+        with self._stage("parse"):
+            results = self._parse(raw_html)
+        
+        for i, result in enumerate(results):
+            result.position = (page - 1) * num_results + i + 1
+            result.engine = self.ENGINE_NAME
+        
+        return results, raw_html, url
+    
+    def search_stream(
+        self,
+        query: str,
+        page: int = 1,
+        num_results: int = 10,
+        language: Optional[str] = None,
+        country: Optional[str] = None,
+        safe_search: bool = True,
+        use_cache: bool = True,
+        chunk_size: int = 8192,
+        force_refresh: bool = False
+    ) -> Iterator[SearchResult]:
+        """
+        Pencarian streaming: hasil di-yield begitu blok hasilnya selesai di-download.
+        
+        Body respons dibaca per chunk dan dipecah menjadi blok hasil
+        (STREAM_BLOCK engine, default RESULT_SPEC.prune); setiap blok
+        di-parse dengan _parse_results saat tag penutupnya diterima.
+        detect_blocked_page dijalankan pada HEAD_CHECK_SIZE karakter pertama
+        sebelum hasil pertama di-yield, dan pada seluruh halaman jika tidak
+        ada hasil. Cache dan archive diisi setelah halaman selesai dibaca;
+        jika iterasi dihentikan lebih awal, koneksi ditutup tanpa mengisi cache.
+        Tidak mengubah state instance (seperti execute); negative_cache
+        berlaku seperti pada execute().
+        
+        Args:
+            query, page, num_results, language, country, safe_search, use_cache: Sama seperti search()
+            chunk_size: Ukuran chunk body (byte)
+            force_refresh: Sama seperti search()
+            
+        Yields:
+            SearchResult dengan position dan engine sudah diisi
+            
+        Contoh:
+            >>> for result in engine.search_stream("python"):
+            ...     print(result.position, result.title)
+        """
+        query = self.normalize_query(query)
+        args = (query, page, num_results, language, country, safe_search, use_cache and not force_refresh, chunk_size)
+        if self.negative_cache is None:
+            yield from self._stream_results(*args)
+            return
+        
+        negative_key = self._generate_cache_key(
+            query, page=page, num_results=num_results, language=language, country=country, safe_search=safe_search
+        )
+        if not force_refresh and self._check_negative(negative_key) == EMPTY:
+            return
+        
+        count = 0
+        try:
+            for result in self._stream_results(*args):
+                count += 1
+                yield result
+        except (BlockedException, NetworkException) as e:
+            self.negative_cache.record_error(self.ENGINE_NAME, negative_key, e)
+            raise
+        if not count:
+            self.negative_cache.record_empty(self.ENGINE_NAME, negative_key)
+    
+    def _stream_results(
+        self,
+        query: NormalizedQuery,
+        page: int,
+        num_results: int,
+        language: Optional[str],
+        country: Optional[str],
+        safe_search: bool,
+        use_cache: bool,
+        chunk_size: int
+    ) -> Iterator[SearchResult]:
+        """Implementasi search_stream() tanpa negative_cache"""
+        params = {
+            "page": page,
+            "num_results": num_results,
+            "language": language,
+            "country": country,
+            "safe_search": safe_search
+        }
+        cache_key = self._generate_cache_key(query, **params)
+        
         if use_cache and self.cache:
-            cached = self.cache.get(cache_key)
+            with self._stage("cache_lookup"):
+                cached = self.cache.get(cache_key)
             if cached:
-                return [SearchResult(**r) for r in cached]
+                self._count("cache_hit")
+                yield from (ResultListView(cached) if self.cache_views else [SearchResult(**r) for r in cached])
+                return
+            self._count("cache_miss")
         
         url = self._build_search_url(
-            query=query,
+            query=query.text,
             page=page,
             num_results=num_results,
             language=language,
@@ -345,22 +1107,71 @@ class SearchEngine(ABC):
             safe_search=safe_search
         )
         
-        self._raw_html = self._fetch(url)
+        block = getattr(self, "STREAM_BLOCK", None) or getattr(getattr(self, "RESULT_SPEC", None), "prune", None)
+        splitter = BlockSplitter(block if isinstance(block, Strainer) else None)
+        response, proxy = self._with_retry(lambda: self._open_stream(url))
+        start = time.perf_counter()
+        results: List[SearchResult] = []
+        yielded = 0
+        head_checked = False
         
-        blocked_message = detect_blocked_page(self._raw_html)
-        if blocked_message:
-            raise BlockedException(blocked_message)
+        def check_blocked(html: str):
+            with self._stage("block_detect"):
+                blocked_message = detect_blocked_page(html)
+            if blocked_message:
+                self._count("blocked", reason="page")
+                raise BlockedException(blocked_message)
         
-        self._results = self._parse_results(self._raw_html)
+        def parse(fragments: List[str]) -> List[SearchResult]:
+            parsed = []
+            for fragment in fragments:
+                with self._stage("parse"):
+                    items = self._parse(fragment)
+                for result in items:
+                    result.position = (page - 1) * num_results + len(results) + len(parsed) + 1
+                    result.engine = self.ENGINE_NAME
+                    parsed.append(result)
+            return parsed
         
-        for i, result in enumerate(self._results):
-            result.position = (page - 1) * num_results + i + 1
-            result.engine = self.ENGINE_NAME
+        try:
+            for text in self._iter_stream_text(response, chunk_size):
+                fragments = splitter.feed(text)
+                if not head_checked and splitter.length >= HEAD_CHECK_SIZE:
+                    check_blocked(splitter.head(HEAD_CHECK_SIZE))
+                    head_checked = True
+                results.extend(parse(fragments))
+                if head_checked:
+                    while yielded < len(results):
+                        yielded += 1
+                        yield results[yielded - 1]
+            
+            fragments = splitter.close()
+            if not isinstance(block, Strainer):
+                fragments = [splitter.text]
+            results.extend(parse(fragments))
+            if not head_checked or not results:
+                check_blocked(splitter.text)
+            while yielded < len(results):
+                yielded += 1
+                yield results[yielded - 1]
+        except BaseException as e:
+            if proxy is not None:
+                _release_after_error(self.proxy, proxy, time.perf_counter() - start, e)
+                proxy = None
+            raise
+        finally:
+            response.close()
+            if proxy is not None:
+                self.proxy.release(proxy, time.perf_counter() - start)
         
-        if self.cache:
-            self.cache.set(cache_key, [r.to_dict() for r in self._results])
+        if self.archive:
+            try:
+                self.archive.store(self.ENGINE_NAME, query.text, params, splitter.text, url=url)
+            except IOError:
+                pass
         
-        return self._results
+        if self.cache:
+            self.cache.set(cache_key, [r.to_dict() for r in results])
     
     def get_results(self) -> List[SearchResult]:
         """Get hasil pencarian terakhir"""
@@ -390,6 +1201,10 @@ class SearchEngine(ABC):
         """Batasi jumlah hasil"""
         return self._results[:count]
     
+    def result_set(self) -> ResultSet:
+        """Hasil pencarian terakhir sebagai ResultSet kolumnar"""
+        return ResultSet(self._results)
+    
     def to_dict_list(self) -> List[Dict[str, Any]]:
         """Konversi semua hasil ke list of dict"""
         return [r.to_dict() for r in self._results]
@@ -397,3 +1212,11 @@ class SearchEngine(ABC):
     def to_json(self, indent: int = 2) -> str:
         """Konversi semua hasil ke JSON string"""
         return json.dumps(self.to_dict_list(), indent=indent, ensure_ascii=False)
+    
+    def write_json(self, fp, indent: Optional[int] = None) -> int:
+        """Tulis hasil terakhir sebagai JSON array ke file-like object secara streaming"""
+        return write_json_array(self._results, fp, indent=indent)
+    
+    def write_ndjson(self, fp) -> int:
+        """Tulis hasil terakhir sebagai NDJSON ke file-like object secara streaming"""
+        return write_ndjson(self._results, fp)
@@ -3,12 +3,18 @@ Caching system untuk Multi Search Engine Library
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Any, Dict
+from threading import Lock
+from typing import Optional, Any, Dict, Tuple, Iterator
 import json
 import os
+import re
+import struct
 import time
 import hashlib
 
+from .cache_codecs import CacheCodec
+from .exceptions import CacheException
+
 
 class CacheInterface(ABC):
     """Interface untuk cache"""
@@ -40,18 +46,54 @@ class CacheInterface(ABC):
 
 
 class FileCache(CacheInterface):
-    """File-based cache implementation"""
+    """
+    File-based cache implementation
+    
+    Index file id -> expiry dibangun sekali saat cache pertama dipakai, dari
+    expires_at di awal setiap file (header envelope dengan codec, field
+    pertama dokumen JSON tanpa codec) tanpa parse isi, lalu diperbarui oleh
+    set/get/delete; miss, has() dan entry expired dijawab dari index tanpa
+    menyentuh filesystem. File JSON lama (expires_at bukan field pertama)
+    di-parse penuh sekali saat index dibangun. Metadata file (mtime) tidak dipakai, sehingga
+    cp/rsync, restore backup dan filesystem seperti FAT tidak memengaruhi
+    expiry, dan entry hanya dihapus jika expires_at di isinya sudah lewat.
+    """
+    
+    ENVELOPE_MAGIC = b"SECF"
+    ENVELOPE_VERSION = 1
+    _ENVELOPE_HEADER = struct.Struct("<4sBddIB")
     
-    def __init__(self, cache_dir: str = ".cache", default_ttl: int = 3600):
+    # Field pertama dokumen JSON (ditulis oleh set), dibaca tanpa json.load
+    _JSON_EXPIRY_PREFIX = re.compile(rb'^\{\s*"expires_at":\s*(null|-?[0-9][0-9.eE+-]*)\s*,')
+    
+    def __init__(
+        self,
+        cache_dir: str = ".cache",
+        default_ttl: int = 3600,
+        codec: Optional[CacheCodec] = None,
+        index: bool = True
+    ):
         """
         Inisialisasi FileCache
         
         Args:
             cache_dir: Direktori untuk menyimpan file cache
             default_ttl: Time-to-live default dalam detik (default: 1 jam)
+            codec: Codec nilai cache (opsional). Tanpa codec, file disimpan
+                sebagai dokumen JSON seperti sebelumnya; dengan codec, file
+                berisi envelope biner kecil diikuti payload dari codec.
+            index: Jawab miss/has()/expiry dari index in-process (default: True).
+                Index hanya melihat file yang ada saat dibangun dan yang ditulis
+                instance ini; untuk direktori yang ditulis bersamaan oleh proses
+                lain, gunakan index=False atau panggil refresh_index().
         """
         self.cache_dir = cache_dir
         self.default_ttl = default_ttl
+        self.codec = codec
+        self.index = index
+        self._extension = codec.extension if codec else "json"
+        self._index: Optional[Dict[str, Optional[float]]] = None
+        self._index_lock = Lock()
         self._ensure_cache_dir()
     
     def _ensure_cache_dir(self):
@@ -59,90 +101,292 @@ class FileCache(CacheInterface):
         if not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir)
     
+    def _file_id(self, key: str) -> str:
+        """Nama file (tanpa ekstensi) untuk key tertentu"""
+        return hashlib.md5(key.encode()).hexdigest()
+    
     def _get_cache_path(self, key: str) -> str:
         """Get path file cache untuk key tertentu"""
-        safe_key = hashlib.md5(key.encode()).hexdigest()
-        return os.path.join(self.cache_dir, f"{safe_key}.json")
+        return os.path.join(self.cache_dir, f"{self._file_id(key)}.{self._extension}")
+    
+    def _read_expiry(self, filepath: str) -> Optional[float]:
+        """Baca expires_at dari awal file (header envelope atau field pertama JSON)"""
+        if self.codec is not None:
+            with open(filepath, "rb") as f:
+                header = f.read(self._ENVELOPE_HEADER.size)
+            try:
+                magic, version, _, expires_at, _, _ = self._ENVELOPE_HEADER.unpack_from(header, 0)
+            except struct.error:
+                raise CacheException("Envelope cache terpotong")
+            if magic != self.ENVELOPE_MAGIC or version != self.ENVELOPE_VERSION:
+                raise CacheException("Format envelope cache tidak dikenal")
+            return expires_at or None
+        with open(filepath, "rb") as f:
+            match = self._JSON_EXPIRY_PREFIX.match(f.read(64))
+            if match is not None:
+                return None if match.group(1) == b"null" else float(match.group(1)) or None
+            f.seek(0)
+            return json.loads(f.read().decode("utf-8")).get("expires_at")
+    
+    def _ensure_index(self) -> Dict[str, Optional[float]]:
+        """Bangun index dari isi file (sekali, saat pertama dipakai)"""
+        index = self._index
+        if index is not None:
+            return index
+        with self._index_lock:
+            if self._index is None:
+                self._index = self._build_index()
+            return self._index
+    
+    def _build_index(self) -> Dict[str, Optional[float]]:
+        suffix = f".{self._extension}"
+        index: Dict[str, Optional[float]] = {}
+        try:
+            entries = list(os.scandir(self.cache_dir))
+        except OSError:
+            return index
+        
+        for entry in entries:
+            if not entry.name.endswith(suffix):
+                continue
+            try:
+                expires_at = self._read_expiry(entry.path)
+            except (OSError, ValueError, CacheException):
+                continue
+            index[entry.name[:-len(suffix)]] = expires_at
+        return index
+    
+    def refresh_index(self):
+        """Bangun ulang index dari direktori (mis. setelah proses lain menulis)"""
+        with self._index_lock:
+            self._index = self._build_index()
+    
+    def _indexed_expiry(self, key: str) -> Tuple[bool, Optional[float]]:
+        """(ada, expires_at) menurut index"""
+        index = self._ensure_index()
+        file_id = self._file_id(key)
+        return file_id in index, index.get(file_id)
+    
+    def _pack_entry(self, key: str, value: Any, created_at: float, expires_at: Optional[float]) -> bytes:
+        """Bungkus nilai ter-encode dalam envelope biner"""
+        key_bytes = key.encode("utf-8")
+        codec_name = self.codec.name.encode("ascii")
+        header = self._ENVELOPE_HEADER.pack(
+            self.ENVELOPE_MAGIC,
+            self.ENVELOPE_VERSION,
+            created_at,
+            expires_at or 0.0,
+            len(key_bytes),
+            len(codec_name)
+        )
+        return b"".join((header, key_bytes, codec_name, self.codec.encode(value)))
+    
+    def _unpack_entry(self, data: bytes) -> Tuple[str, float, Optional[float], memoryview]:
+        """Baca envelope: (key, created_at, expires_at, payload) tanpa decode payload"""
+        try:
+            magic, version, created_at, expires_at, key_len, name_len = self._ENVELOPE_HEADER.unpack_from(data, 0)
+        except struct.error:
+            raise CacheException("Envelope cache terpotong")
+        if magic != self.ENVELOPE_MAGIC or version != self.ENVELOPE_VERSION:
+            raise CacheException("Format envelope cache tidak dikenal")
+        
+        offset = self._ENVELOPE_HEADER.size
+        key = data[offset:offset + key_len].decode("utf-8")
+        offset += key_len
+        codec_name = data[offset:offset + name_len].decode("ascii")
+        offset += name_len
+        if codec_name != self.codec.name:
+            raise CacheException(f"Entry cache ditulis dengan codec '{codec_name}'")
+        
+        return key, created_at, expires_at or None, memoryview(data)[offset:]
     
     def get(self, key: str) -> Optional[Any]:
         """Get value dari cache"""
+        if self.index:
+            present, expires_at = self._indexed_expiry(key)
+            if not present:
+                return None
+            if expires_at and expires_at < time.time():
+                self.delete(key)
+                return None
+        
         cache_path = self._get_cache_path(key)
         
-        if not os.path.exists(cache_path):
+        if not self.index and not os.path.exists(cache_path):
             return None
         
-        try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
-            if data.get("expires_at") and data["expires_at"] < time.time():
-                self.delete(key)
+        if self.codec is not None:
+            try:
+                with open(cache_path, "rb") as f:
+                    _, _, expires_at, payload = self._unpack_entry(f.read())
+                
+                if expires_at and expires_at < time.time():
+                    self.delete(key)
+                    return None
+                
+                value = self.codec.decode(bytes(payload))
+            except (CacheException, IOError):
                 return None
-            
-            return data.get("value")
-            
-        except (json.JSONDecodeError, IOError):
-            return None
+        else:
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                
+                expires_at = data.get("expires_at")
+                if expires_at and expires_at < time.time():
+                    self.delete(key)
+                    return None
+                
+                value = data.get("value")
+                
+            except (json.JSONDecodeError, IOError):
+                return None
+        
+        if self.index:
+            self._index[self._file_id(key)] = expires_at
+        return value
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """Set value ke cache"""
+        index = self._ensure_index() if self.index else None
         cache_path = self._get_cache_path(key)
         ttl = ttl if ttl is not None else self.default_ttl
-        
-        data = {
-            "key": key,
-            "value": value,
-            "created_at": time.time(),
-            "expires_at": time.time() + ttl if ttl > 0 else None
-        }
+        created_at = time.time()
+        expires_at = created_at + ttl if ttl > 0 else None
         
         try:
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            return True
+            if self.codec is not None:
+                with open(cache_path, "wb") as f:
+                    f.write(self._pack_entry(key, value, created_at, expires_at))
+            else:
+                # expires_at ditulis pertama agar index bisa dibangun tanpa parse
+                data = {
+                    "expires_at": expires_at,
+                    "created_at": created_at,
+                    "key": key,
+                    "value": value
+                }
+                with open(cache_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
         except IOError:
             return False
+        
+        if index is not None:
+            index[self._file_id(key)] = expires_at
+        return True
     
     def delete(self, key: str) -> bool:
         """Hapus key dari cache"""
-        cache_path = self._get_cache_path(key)
-        
-        if os.path.exists(cache_path):
-            try:
-                os.remove(cache_path)
-                return True
-            except IOError:
+        if self.index:
+            present, _ = self._indexed_expiry(key)
+            if not present:
                 return False
-        return False
+            self._index.pop(self._file_id(key), None)
+        
+        try:
+            os.remove(self._get_cache_path(key))
+            return True
+        except IOError:
+            return False
     
     def clear(self) -> bool:
         """Hapus semua cache"""
         try:
             for filename in os.listdir(self.cache_dir):
-                if filename.endswith(".json"):
+                if filename.endswith(f".{self._extension}"):
                     os.remove(os.path.join(self.cache_dir, filename))
             return True
         except IOError:
             return False
+        finally:
+            if self._index is not None:
+                self._index.clear()
     
     def has(self, key: str) -> bool:
-        """Cek apakah key ada di cache"""
+        """Cek apakah key ada di cache (dengan index: tanpa menyentuh filesystem)"""
+        if self.index:
+            present, expires_at = self._indexed_expiry(key)
+            return present and not (expires_at and expires_at < time.time())
         return self.get(key) is not None
     
+    def items(self) -> Iterator[Tuple[str, Any, Optional[float]]]:
+        """
+        Iterasi semua entry yang masih berlaku dalam satu pass direktori
+        
+        Yields:
+            Tuple (key, value, expires_at); entry expired tidak di-decode
+            (dengan index: file-nya tidak dibuka), file rusak dilewati
+        """
+        try:
+            filenames = os.listdir(self.cache_dir)
+        except IOError:
+            return
+        
+        now = time.time()
+        suffix = f".{self._extension}"
+        index = self._ensure_index() if self.index else None
+        for filename in filenames:
+            if not filename.endswith(suffix):
+                continue
+            if index is not None:
+                file_id = filename[:-len(suffix)]
+                if file_id not in index or (index[file_id] and index[file_id] < now):
+                    continue
+            filepath = os.path.join(self.cache_dir, filename)
+            try:
+                if self.codec is not None:
+                    with open(filepath, "rb") as f:
+                        key, _, expires_at, payload = self._unpack_entry(f.read())
+                    if expires_at and expires_at < now:
+                        continue
+                    value = self.codec.decode(bytes(payload))
+                else:
+                    with open(filepath, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    key, value, expires_at = data.get("key"), data.get("value"), data.get("expires_at")
+                    if key is None or (expires_at and expires_at < now):
+                        continue
+            except (IOError, json.JSONDecodeError, CacheException):
+                continue
+            yield key, value, expires_at
+    
     def cleanup_expired(self) -> int:
         """Hapus cache yang sudah expired, return jumlah yang dihapus"""
         deleted = 0
+        now = time.time()
+        
+        if self.index:
+            index = self._ensure_index()
+            for file_id, expires_at in list(index.items()):
+                if not (expires_at and expires_at < now):
+                    continue
+                filepath = os.path.join(self.cache_dir, f"{file_id}.{self._extension}")
+                # Konfirmasi dari isi file: proses lain mungkin sudah menulis ulang entry
+                try:
+                    expires_at = self._read_expiry(filepath)
+                    if expires_at and expires_at < now:
+                        os.remove(filepath)
+                        deleted += 1
+                    else:
+                        index[file_id] = expires_at
+                        continue
+                except FileNotFoundError:
+                    pass
+                except (IOError, ValueError, CacheException):
+                    continue
+                index.pop(file_id, None)
+            return deleted
+        
         try:
             for filename in os.listdir(self.cache_dir):
-                if filename.endswith(".json"):
+                if filename.endswith(f".{self._extension}"):
                     filepath = os.path.join(self.cache_dir, filename)
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        data = json.load(f)
+                    expires_at = self._read_expiry(filepath)
                     
-                    if data.get("expires_at") and data["expires_at"] < time.time():
+                    if expires_at and expires_at < now:
                         os.remove(filepath)
                         deleted += 1
-        except (IOError, json.JSONDecodeError):
+        except (IOError, json.JSONDecodeError, CacheException):
             pass
         
         return deleted
@@ -151,16 +395,19 @@ class FileCache(CacheInterface):
 class MemoryCache(CacheInterface):
     """In-memory cache implementation"""
     
-    def __init__(self, default_ttl: int = 3600, max_size: int = 1000):
+    def __init__(self, default_ttl: int = 3600, max_size: int = 1000, codec: Optional[CacheCodec] = None):
         """
         Inisialisasi MemoryCache
         
         Args:
             default_ttl: Time-to-live default dalam detik
             max_size: Maksimum jumlah item di cache
+            codec: Codec nilai cache (opsional). Dengan codec, nilai disimpan
+                sebagai bytes ter-encode dan di-decode saat get.
         """
         self.default_ttl = default_ttl
         self.max_size = max_size
+        self.codec = codec
         self._cache: Dict[str, Dict[str, Any]] = {}
     
     def get(self, key: str) -> Optional[Any]:
@@ -173,6 +420,11 @@ class MemoryCache(CacheInterface):
             self.delete(key)
             return None
         
+        if self.codec is not None:
+            try:
+                return self.codec.decode(data["value"])
+            except CacheException:
+                return None
         return data.get("value")
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
@@ -181,6 +433,8 @@ class MemoryCache(CacheInterface):
             self._evict_oldest()
         
         ttl = ttl if ttl is not None else self.default_ttl
+        if self.codec is not None:
+            value = self.codec.encode(value)
         self._cache[key] = {
             "value": value,
             "created_at": time.time(),
@@ -204,6 +458,42 @@ class MemoryCache(CacheInterface):
         """Cek apakah key ada di cache"""
         return self.get(key) is not None
     
+    def items(self, encoded: bool = False) -> Iterator[Tuple[str, Any, Optional[float]]]:
+        """
+        Iterasi semua entry yang masih berlaku
+        
+        Args:
+            encoded: Dengan codec, kembalikan bytes ter-encode tanpa decode
+            
+        Yields:
+            Tuple (key, value, expires_at)
+        """
+        now = time.time()
+        for key, data in list(self._cache.items()):
+            expires_at = data.get("expires_at")
+            if expires_at and expires_at < now:
+                continue
+            value = data.get("value")
+            if self.codec is not None and not encoded:
+                try:
+                    value = self.codec.decode(value)
+                except CacheException:
+                    continue
+            yield key, value, expires_at
+    
+    def set_encoded(self, key: str, data: bytes, expires_at: Optional[float]) -> bool:
+        """Simpan nilai yang sudah di-encode dengan codec cache ini (tanpa encode ulang)"""
+        if self.codec is None:
+            raise CacheException("set_encoded membutuhkan MemoryCache dengan codec")
+        if key not in self._cache and len(self._cache) >= self.max_size:
+            self._evict_oldest()
+        self._cache[key] = {
+            "value": data,
+            "created_at": time.time(),
+            "expires_at": expires_at
+        }
+        return True
+    
     def _evict_oldest(self):
         """Hapus item cache paling lama"""
         if not self._cache:
@@ -0,0 +1,219 @@
+"""
+Codec untuk nilai cache Multi Search Engine Library
+
+Codec mengubah nilai cache (biasanya list of dict hasil pencarian) menjadi
+bytes dan sebaliknya. BinaryResultCodec menyimpan list hasil secara
+kolumnar dalam format biner berversi, dengan kompresi zlib opsional.
+"""
+
+from abc import ABC, abstractmethod
+from array import array
+from itertools import accumulate
+from typing import Any, Dict, List, Optional
+import json
+import struct
+import sys
+import zlib
+
+from .exceptions import CacheException
+
+
+class CacheCodec(ABC):
+    """Interface codec nilai cache"""
+
+    name = "base"
+    extension = "bin"
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Encode nilai ke bytes"""
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """Decode bytes ke nilai"""
+        pass
+
+
+class JSONCodec(CacheCodec):
+    """Codec JSON (UTF-8)"""
+
+    name = "json"
+    extension = "json"
+
+    def __init__(self, indent: Optional[int] = None):
+        self.indent = indent
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, indent=self.indent).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        try:
+            return json.loads(data)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise CacheException(f"Gagal decode JSON cache: {str(e)}")
+
+
+RESULT_FIELDS = ("title", "url", "description", "position", "engine", "extra")
+
+
+def _is_result_list(value: Any) -> bool:
+    """Cek apakah value adalah list of dict hasil (format SearchResult.to_dict)"""
+    if not isinstance(value, list):
+        return False
+    for item in value:
+        if not isinstance(item, dict) or len(item) != len(RESULT_FIELDS):
+            return False
+        for name in RESULT_FIELDS:
+            if name not in item:
+                return False
+        if not isinstance(item["position"], int) or not isinstance(item["extra"], dict):
+            return False
+        if not (isinstance(item["title"], str) and isinstance(item["url"], str)
+                and isinstance(item["description"], str) and isinstance(item["engine"], str)):
+            return False
+    return True
+
+
+class BinaryResultCodec(CacheCodec):
+    """
+    Codec biner untuk list hasil pencarian.
+
+    Layout (little-endian):
+        b"SRC" | versi (1 byte) | flags (1 byte) | payload (opsional zlib)
+
+    Payload list hasil:
+        count (uint32) | position (int64 x count) | panjang string dalam
+        karakter (uint32 x 5*count) | blob UTF-8 berisi title, url,
+        description, engine dan extra (JSON, kosong jika {}) per hasil
+
+    Nilai selain list hasil disimpan sebagai JSON dengan flag FLAG_JSON.
+    """
+
+    name = "binary"
+    extension = "bin"
+
+    MAGIC = b"SRC"
+    SCHEMA_VERSION = 1
+    FLAG_ZLIB = 0x01
+    FLAG_JSON = 0x02
+
+    _COUNT = struct.Struct("<I")
+
+    def __init__(self, compress: bool = False, compress_level: int = 6, min_compress_size: int = 512):
+        """
+        Args:
+            compress: Kompres payload dengan zlib
+            compress_level: Level kompresi zlib (1-9)
+            min_compress_size: Payload lebih kecil dari ini tidak dikompres
+        """
+        self.compress = compress
+        self.compress_level = compress_level
+        self.min_compress_size = min_compress_size
+
+    def encode(self, value: Any) -> bytes:
+        flags = 0
+        if _is_result_list(value):
+            payload = self._encode_results(value)
+        else:
+            flags |= self.FLAG_JSON
+            payload = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        if self.compress and len(payload) >= self.min_compress_size:
+            payload = zlib.compress(payload, self.compress_level)
+            flags |= self.FLAG_ZLIB
+
+        return self.MAGIC + bytes((self.SCHEMA_VERSION, flags)) + payload
+
+    def decode(self, data: bytes) -> Any:
+        if len(data) < 5 or data[:3] != self.MAGIC:
+            raise CacheException("Data cache bukan format BinaryResultCodec")
+        version, flags = data[3], data[4]
+        if version != self.SCHEMA_VERSION:
+            raise CacheException(f"Versi schema cache {version} tidak didukung")
+
+        payload = memoryview(data)[5:]
+        try:
+            if flags & self.FLAG_ZLIB:
+                payload = memoryview(zlib.decompress(payload))
+            if flags & self.FLAG_JSON:
+                return json.loads(bytes(payload))
+            return self._decode_results(payload)
+        except (zlib.error, struct.error, ValueError, UnicodeDecodeError) as e:
+            raise CacheException(f"Gagal decode cache biner: {str(e)}")
+
+    def _encode_results(self, results: List[Dict[str, Any]]) -> bytes:
+        positions = array("q", [r["position"] for r in results])
+        strings = []
+        for r in results:
+            strings.append(r["title"])
+            strings.append(r["url"])
+            strings.append(r["description"])
+            strings.append(r["engine"])
+            strings.append(json.dumps(r["extra"], ensure_ascii=False) if r["extra"] else "")
+        lengths = array("I", map(len, strings))
+        if sys.byteorder != "little":
+            positions.byteswap()
+            lengths.byteswap()
+        return b"".join((
+            self._COUNT.pack(len(results)),
+            positions.tobytes(),
+            lengths.tobytes(),
+            "".join(strings).encode("utf-8"),
+        ))
+
+    def _decode_results(self, payload: memoryview) -> List[Dict[str, Any]]:
+        (count,) = self._COUNT.unpack_from(payload, 0)
+        offset = self._COUNT.size
+
+        positions = array("q")
+        positions.frombytes(payload[offset:offset + 8 * count])
+        offset += 8 * count
+
+        lengths = array("I")
+        lengths.frombytes(payload[offset:offset + 4 * 5 * count])
+        offset += 4 * 5 * count
+
+        if sys.byteorder != "little":
+            positions.byteswap()
+            lengths.byteswap()
+
+        text = str(payload[offset:], "utf-8")
+        bounds = list(accumulate(lengths, initial=0))
+        pieces = [text[a:b] for a, b in zip(bounds, bounds[1:])]
+
+        engines: Dict[str, str] = {}
+        return [
+            {
+                "title": pieces[i],
+                "url": pieces[i + 1],
+                "description": pieces[i + 2],
+                "position": position,
+                "engine": engines.setdefault(pieces[i + 3], pieces[i + 3]),
+                "extra": json.loads(pieces[i + 4]) if pieces[i + 4] else {},
+            }
+            for i, position in zip(range(0, 5 * count, 5), positions)
+        ]
+
+
+class MsgpackCodec(CacheCodec):
+    """Codec msgpack (membutuhkan paket msgpack)"""
+
+    name = "msgpack"
+    extension = "msgpack"
+
+    def __init__(self):
+        try:
+            import msgpack
+        except ImportError:
+            raise ImportError("msgpack diperlukan untuk MsgpackCodec: pip install msgpack")
+        self._msgpack = msgpack
+
+    def encode(self, value: Any) -> bytes:
+        return self._msgpack.packb(value, use_bin_type=True)
+
+    def decode(self, data: bytes) -> Any:
+        try:
+            return self._msgpack.unpackb(data, raw=False)
+        except Exception as e:
+            raise CacheException(f"Gagal decode msgpack cache: {str(e)}")
@@ -0,0 +1,153 @@
+"""
+Decoding body HTTP untuk Multi Search Engine Library
+
+`response.text` milik requests menebak encoding dengan charset_normalizer /
+chardet atas seluruh body jika header tidak menyebut charset, dan pada
+halaman ratusan KB biaya itu bisa melebihi biaya parsing. Modul ini
+men-decode `response.content` (bytes) dengan encoding eksplisit, berurutan:
+
+    BOM -> charset header Content-Type -> <meta charset> -> default engine -> sniff
+
+Sniff hanya dipakai sebagai upaya terakhir dan hanya atas beberapa KB pertama.
+"""
+
+from typing import Optional, Tuple
+import codecs
+import re
+
+
+META_SCAN_SIZE = 4096
+SNIFF_SIZE = 8192
+
+BOM = "bom"
+HEADER = "header"
+META = "meta"
+DEFAULT = "default"
+SNIFF = "sniff"
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+
+_CONTENT_TYPE_CHARSET = re.compile(r'charset\s*=\s*["\']?\s*([A-Za-z0-9_.:-]+)', re.IGNORECASE)
+_META_CHARSET = re.compile(rb'<meta[^>]*?charset\s*=\s*["\']?\s*([A-Za-z0-9_.:-]+)', re.IGNORECASE)
+
+# Label yang oleh browser (WHATWG) di-decode sebagai windows-1252
+_BROWSER_ALIASES = {"latin-1": "cp1252", "iso8859-1": "cp1252", "ascii": "cp1252"}
+
+
+def normalize_encoding(label) -> Optional[str]:
+    """Nama codec Python untuk label charset, atau None jika tidak dikenal"""
+    if not isinstance(label, (str, bytes)):
+        return None
+    if isinstance(label, bytes):
+        label = label.decode("ascii", "ignore")
+    try:
+        name = codecs.lookup(label.strip()).name
+    except LookupError:
+        return None
+    return _BROWSER_ALIASES.get(name, name)
+
+
+def charset_from_content_type(content_type) -> Optional[str]:
+    """Charset dari header Content-Type (None jika tidak ada/tidak dikenal)"""
+    if not isinstance(content_type, str):
+        return None
+    match = _CONTENT_TYPE_CHARSET.search(content_type)
+    return normalize_encoding(match.group(1)) if match else None
+
+
+def charset_from_meta(content: bytes, limit: int = META_SCAN_SIZE) -> Optional[str]:
+    """Charset dari <meta charset> / <meta http-equiv> di awal dokumen"""
+    match = _META_CHARSET.search(content, 0, limit)
+    return normalize_encoding(match.group(1)) if match else None
+
+
+def sniff_encoding(content: bytes, limit: int = SNIFF_SIZE) -> str:
+    """
+    Tebak encoding dari `limit` byte pertama.
+
+    UTF-8 valid diterima langsung; selain itu charset_normalizer dipakai jika
+    terpasang, dengan fallback windows-1252.
+    """
+    head = content[:limit]
+    try:
+        head.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError as e:
+        # Karakter multibyte yang terpotong di batas sampel tetap dianggap UTF-8
+        if e.reason == "unexpected end of data" and len(content) > limit:
+            return "utf-8"
+
+    try:
+        from charset_normalizer import from_bytes
+    except ImportError:
+        return "cp1252"
+    best = from_bytes(head).best()
+    return normalize_encoding(best.encoding) if best is not None else "cp1252"
+
+
+def detect_encoding(
+    content: bytes,
+    content_type: Optional[str] = None,
+    default_encoding: Optional[str] = None
+) -> Tuple[str, str, int]:
+    """
+    Tentukan encoding body.
+
+    Returns:
+        Tuple (encoding, sumber: bom/header/meta/default/sniff, panjang BOM)
+    """
+    for bom, encoding in _BOMS:
+        if content.startswith(bom):
+            return encoding, BOM, len(bom)
+
+    encoding = charset_from_content_type(content_type)
+    if encoding:
+        return encoding, HEADER, 0
+
+    encoding = charset_from_meta(content)
+    if encoding:
+        return encoding, META, 0
+
+    encoding = normalize_encoding(default_encoding) if default_encoding else None
+    if encoding:
+        return encoding, DEFAULT, 0
+
+    return sniff_encoding(content), SNIFF, 0
+
+
+def decode_html(
+    content: bytes,
+    content_type: Optional[str] = None,
+    default_encoding: Optional[str] = None
+) -> Tuple[str, str, str]:
+    """
+    Decode body HTML dengan encoding eksplisit (karakter invalid diganti U+FFFD).
+
+    Returns:
+        Tuple (teks, encoding, sumber encoding)
+    """
+    encoding, source, skip = detect_encoding(content, content_type, default_encoding)
+    return str(content[skip:], encoding, "replace"), encoding, source
+
+
+def decode_response(response, default_encoding: Optional[str] = None) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    decode_html untuk objek respons requests.
+
+    Jika content bukan bytes (mis. respons tiruan), kembali ke response.text.
+
+    Returns:
+        Tuple (teks, encoding, sumber encoding); encoding/sumber None pada fallback
+    """
+    content = getattr(response, "content", None)
+    if not isinstance(content, (bytes, bytearray)):
+        return response.text, None, None
+    headers = getattr(response, "headers", None)
+    content_type = headers.get("Content-Type") if headers is not None else None
+    if isinstance(content, bytearray):
+        content = bytes(content)
+    return decode_html(content, content_type, default_encoding)
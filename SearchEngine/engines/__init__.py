@@ -1,13 +1,34 @@
 """
 Search Engine implementations
+
+Class engine di-import saat pertama kali diakses (lazy), sehingga
+`import SearchEngine.engines` tidak memuat semua modul engine.
 """
 
-from .google import GoogleSearch
-from .bing import BingSearch
-from .duckduckgo import DuckDuckGoSearch
-from .yahoo import YahooSearch
-from .mojeek import MojeekSearch
-from .brave import BraveSearch
+from importlib import import_module
+from typing import Dict, Tuple
+
+# nama engine -> (modul, nama class); dipakai EngineRegistry untuk engine bawaan
+ENGINE_CLASSES: Dict[str, Tuple[str, str]] = {
+    "google": (".google", "GoogleSearch"),
+    "bing": (".bing", "BingSearch"),
+    "duckduckgo": (".duckduckgo", "DuckDuckGoSearch"),
+    "yahoo": (".yahoo", "YahooSearch"),
+    "mojeek": (".mojeek", "MojeekSearch"),
+    "brave": (".brave", "BraveSearch"),
+}
+
+_CLASS_MODULES = {class_name: module for module, class_name in ENGINE_CLASSES.values()}
+
+
+def __getattr__(name: str):
+    module = _CLASS_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "GoogleSearch",
@@ -5,10 +5,10 @@ Mengikuti logika dari PHP: https://github.com/developerxnoxs/multi-search-engine
 
 from typing import Optional, List
 from urllib.parse import urlencode
-from bs4 import BeautifulSoup
 
 from ..base import SearchEngine, SearchResult
 from ..exceptions import ParseException
+from ..extraction import ResultSpec, FieldSpec, Strainer
 
 
 class BingSearch(SearchEngine):
@@ -21,6 +21,16 @@ class BingSearch(SearchEngine):
     ENGINE_NAME = "bing"
     BASE_URL = "https://www.bing.com/search"
     
+    RESULT_SPEC = ResultSpec(
+        containers=('li.b_algo',),
+        fields={
+            "url": FieldSpec(('h2 a',), attr='href', required=True),
+            "title": FieldSpec(('h2 a',), required=True),
+            "description": FieldSpec(('div.b_caption p', 'div.b_caption', 'p')),
+        },
+        prune=Strainer('li', class_='b_algo'),
+    )
+    
     def _build_search_url(
         self,
         query: str,
@@ -57,31 +67,10 @@ class BingSearch(SearchEngine):
         results = []
         
         try:
-            soup = BeautifulSoup(html, "html.parser")
-            
-            blocks = soup.select('li.b_algo')
-            
-            for block in blocks:
-                a = block.select_one('h2 a')
-                
-                if not a:
-                    continue
-                
-                url = a.get('href', '')
-                title = a.get_text(strip=True)
-                
-                description = ""
-                desc = block.select_one('div.b_caption p')
-                if desc:
-                    description = desc.get_text(strip=True)
-                else:
-                    caption = block.select_one('div.b_caption')
-                    if caption:
-                        description = caption.get_text(strip=True)
-                    else:
-                        p_elem = block.select_one('p')
-                        if p_elem:
-                            description = p_elem.get_text(strip=True)
+            for item in self.RESULT_SPEC.extract(html):
+                url = item["url"]
+                title = item["title"]
+                description = item["description"] or ""
                 
                 if title and url:
                     results.append(SearchResult(
@@ -5,10 +5,10 @@ Mengikuti logika dari PHP: https://github.com/developerxnoxs/multi-search-engine
 
 from typing import Optional, List
 from urllib.parse import urlencode
-from bs4 import BeautifulSoup
 
 from ..base import SearchEngine, SearchResult
 from ..exceptions import ParseException
+from ..extraction import ResultSpec, FieldSpec, Strainer
 
 
 class BraveSearch(SearchEngine):
@@ -22,6 +22,20 @@ class BraveSearch(SearchEngine):
     ENGINE_NAME = "brave"
     BASE_URL = "https://search.brave.com/search"
     
+    RESULT_SPEC = ResultSpec(
+        containers=('div.snippet[data-type="web"]',),
+        fields={
+            "url": FieldSpec(('a[href][class*="svelte"]',), attr='href', required=True),
+            "title": FieldSpec(('div.title.search-snippet-title', 'div[class*="title"]')),
+            "description": FieldSpec((
+                'div.content.desktop-default-regular',
+                'div[class*="generic-snippet"]',
+                'div[class*="snippet-description"]',
+            )),
+        },
+        prune=Strainer('div', attrs={'data-type': 'web'}),
+    )
+    
     def _build_search_url(
         self,
         query: str,
@@ -49,33 +63,14 @@ class BraveSearch(SearchEngine):
         results = []
         
         try:
-            soup = BeautifulSoup(html, "html.parser")
-            
-            nodes = soup.select('div.snippet[data-type="web"]')
-            
-            for node in nodes:
-                a_node = node.select_one('a[href][class*="svelte"]')
-                
-                title_node = node.select_one('div.title.search-snippet-title')
-                if not title_node:
-                    title_node = node.select_one('div[class*="title"]')
-                
-                desc_node = node.select_one('div.content.desktop-default-regular')
-                if not desc_node:
-                    desc_node = node.select_one('div[class*="generic-snippet"]')
-                if not desc_node:
-                    desc_node = node.select_one('div[class*="snippet-description"]')
-                
-                if not a_node:
-                    continue
-                
-                url = a_node.get('href', '')
+            for item in self.RESULT_SPEC.extract(html):
+                url = item["url"]
                 
                 if not url or url.startswith('#') or 'brave.com' in url:
                     continue
                 
-                title = title_node.get_text(strip=True) if title_node else ''
-                description = desc_node.get_text(strip=True) if desc_node else ''
+                title = item["title"] or ''
+                description = item["description"] or ''
                 
                 if title and url:
                     results.append(SearchResult(
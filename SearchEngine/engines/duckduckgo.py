@@ -3,13 +3,208 @@ DuckDuckGo Search Engine Implementation
 Mengikuti logika dari PHP: https://github.com/developerxnoxs/multi-search-engine
 """
 
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
 from urllib.parse import urlencode, unquote
-from bs4 import BeautifulSoup
+from html.parser import HTMLParser
+from html.entities import html5
 import re
 
 from ..base import SearchEngine, SearchResult
 from ..exceptions import ParseException
+from ..extraction import ResultSpec, FieldSpec, class_contains, Strainer
+
+
+# Elemen tanpa closing tag, sama dengan daftar yang dipakai tree builder html.parser di bs4
+_VOID_ELEMENTS = frozenset([
+    'area', 'base', 'basefont', 'bgsound', 'br', 'col', 'command', 'embed', 'frame', 'hr',
+    'image', 'img', 'input', 'isindex', 'keygen', 'link', 'menuitem', 'meta', 'nextid',
+    'param', 'source', 'spacer', 'track', 'wbr',
+])
+
+# Teks di dalam elemen ini tidak ikut get_text() di bs4
+_OPAQUE_TEXT_ELEMENTS = frozenset(['script', 'style', 'template', 'rt', 'rp'])
+
+# Named entity -> karakter, dibangun dengan aturan yang sama seperti bs4
+_NAMED_ENTITIES: Dict[str, str] = {}
+for _name, _char in sorted(html5.items()):
+    _NAMED_ENTITIES.setdefault(_name[:-1] if _name.endswith(";") else _name, _char)
+
+_RESULT_LINK_TAG = re.compile(
+    r'<a\b[^>]*?(?<=\s)class\s*=\s*(["\'])(?:[^"\']*\s)?result__a(?:\s[^"\']*)?\1',
+    re.IGNORECASE
+)
+
+
+class _FastNode:
+    """Elemen terbuka pada stack parser fast-path"""
+    
+    __slots__ = ("tag", "text", "snippets")
+    
+    def __init__(self, tag: str):
+        self.tag = tag
+        self.text: Optional[List[str]] = None
+        self.snippets: Optional[List[Optional["_FastNode"]]] = None
+
+
+class _FastResultParser(HTMLParser):
+    """
+    Parser satu kali jalan untuk markup html.duckduckgo.com.
+    
+    Meniru tree builder html.parser milik bs4 (stack elemen, void element,
+    pop sampai tag yang cocok, decoding entity) tanpa membangun tree: hanya
+    link result__a, container div[class*="result"] terdekat, dan kandidat
+    snippet yang dicatat. Kasus yang tidak bisa ditiru dengan pasti
+    menandai parser sebagai unsafe.
+    """
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.stack: List[_FastNode] = []
+        self.capturing: List[_FastNode] = []
+        self.links: List[Tuple[str, _FastNode, Optional[_FastNode]]] = []
+        self.unsafe = False
+        self._pending: List[str] = []
+    
+    def _flush(self):
+        """Selesaikan satu text node (setara satu NavigableString di bs4)"""
+        if not self._pending:
+            return
+        text = "".join(self._pending).strip()
+        self._pending = []
+        if text:
+            for node in self.capturing:
+                node.text.append(text)
+    
+    def _capture(self, node: _FastNode):
+        node.text = []
+        self.capturing.append(node)
+    
+    def _close(self, node: _FastNode):
+        if node.text is not None and node in self.capturing:
+            self.capturing.remove(node)
+    
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        attr_dict = {key: value if value is not None else "" for key, value in attrs}
+        node = _FastNode(tag)
+        classes = attr_dict.get("class", "")
+        
+        if "snippet" in classes:
+            kind = 2
+            if "result__snippet" in classes and tag in ("a", "div"):
+                kind = 0 if tag == "a" else 1
+            for open_node in self.stack:
+                if open_node.snippets is not None and open_node.snippets[kind] is None:
+                    open_node.snippets[kind] = node
+                    if node.text is None:
+                        self._capture(node)
+        
+        if tag == "a" and "result__a" in classes.split():
+            container = None
+            for open_node in reversed(self.stack):
+                if open_node.snippets is not None:
+                    container = open_node
+                    break
+            if node.text is None:
+                self._capture(node)
+            self.links.append((attr_dict.get("href", ""), node, container))
+        
+        if tag == "div" and "result" in classes:
+            node.snippets = [None, None, None]
+        
+        if tag in _VOID_ELEMENTS:
+            self._close(node)
+        else:
+            self.stack.append(node)
+    
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_ELEMENTS:
+            self.handle_endtag(tag)
+    
+    def handle_endtag(self, tag):
+        self._flush()
+        if tag in _VOID_ELEMENTS:
+            return
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i].tag == tag:
+                for node in self.stack[i:]:
+                    self._close(node)
+                del self.stack[i:]
+                return
+    
+    def handle_data(self, data):
+        if not self.capturing:
+            return
+        if any(node.tag in _OPAQUE_TEXT_ELEMENTS for node in self.stack):
+            self.unsafe = True
+            return
+        self._pending.append(data)
+    
+    def handle_entityref(self, name):
+        self.handle_data(_NAMED_ENTITIES.get(name, "&" + name))
+    
+    def handle_charref(self, name):
+        if not self.capturing:
+            return
+        try:
+            number = int(name[1:], 16) if name[:1] in ("x", "X") else int(name)
+        except ValueError:
+            self.unsafe = True
+            return
+        if 0 < number < 0x80 or 0xA0 <= number < 0xD800 or 0xE000 <= number <= 0x10FFFF:
+            self.handle_data(chr(number))
+        else:
+            self.unsafe = True
+    
+    def handle_comment(self, data):
+        self._flush()
+    
+    def handle_decl(self, decl):
+        self._flush()
+    
+    def handle_pi(self, data):
+        self._flush()
+    
+    def unknown_decl(self, data):
+        self._flush()
+        if self.capturing:
+            self.unsafe = True
+
+
+def fast_extract(html: str) -> Optional[List[Dict[str, Optional[str]]]]:
+    """
+    Ekstrak hasil DuckDuckGo dengan satu forward scan tanpa BeautifulSoup.
+    
+    Returns:
+        List dict dengan field yang sama seperti RESULT_SPEC.extract(),
+        atau None jika sanity check gagal dan parser bs4 harus dipakai
+    """
+    parser = _FastResultParser()
+    try:
+        parser.feed(html)
+        parser.close()
+        parser._flush()
+    except Exception:
+        return None
+    
+    if parser.unsafe or len(parser.links) != len(_RESULT_LINK_TAG.findall(html)):
+        return None
+    
+    records = []
+    for href, node, container in parser.links:
+        description = None
+        if container is not None:
+            for snippet in container.snippets:
+                if snippet is not None:
+                    description = "".join(snippet.text)
+                    break
+        records.append({
+            "href": href,
+            "title": "".join(node.text),
+            "description": description,
+        })
+    return records
 
 
 class DuckDuckGoSearch(SearchEngine):
@@ -22,6 +217,28 @@ class DuckDuckGoSearch(SearchEngine):
     ENGINE_NAME = "duckduckgo"
     BASE_URL = "https://html.duckduckgo.com/html/"
     
+    RESULT_SPEC = ResultSpec(
+        containers=('a.result__a',),
+        fields={
+            "href": FieldSpec(attr='href'),
+            "title": FieldSpec(),
+            "description": FieldSpec(
+                (
+                    'a[class*="result__snippet"]',
+                    'div[class*="result__snippet"]',
+                    '[class*="snippet"]',
+                ),
+                scope='div[class*="result"]',
+            ),
+        },
+        prune=Strainer(class_=class_contains('result')),
+    )
+    
+    FAST_PARSE = True
+    
+    # Blok search_stream: satu div.result per hasil (prune di atas mencakup div.results)
+    STREAM_BLOCK = Strainer('div', class_='result')
+    
     AD_PATTERNS = [
         'duckduckgo.com/y.js',
         'ad_domain=',
@@ -78,33 +295,26 @@ class DuckDuckGoSearch(SearchEngine):
         
         PHP menggunakan XPath: //a[contains(@class,"result__a")]
         Dan mencari snippet dengan: ../following-sibling::div[contains(@class,"result__snippet")]
+        
+        Memakai fast_extract() terlebih dahulu (jika FAST_PARSE aktif),
+        dan kembali ke RESULT_SPEC jika sanity check fast-path gagal.
         """
         results = []
         
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            items = fast_extract(html) if self.FAST_PARSE else None
+            if items is None:
+                items = self.RESULT_SPEC.extract(html)
             
-            links = soup.select('a.result__a')
-            
-            for a in links:
-                href = a.get('href', '')
+            for item in items:
+                href = item["href"]
                 url = self._extract_real_url(href)
                 
                 if self._is_ad_url(url) or self._is_ad_url(href):
                     continue
                 
-                title = a.get_text(strip=True)
-                
-                description = ""
-                result_container = a.find_parent('div', class_=lambda x: x and 'result' in x)
-                if result_container:
-                    desc_elem = result_container.find('a', class_=lambda x: x and 'result__snippet' in str(x))
-                    if not desc_elem:
-                        desc_elem = result_container.find('div', class_=lambda x: x and 'result__snippet' in str(x))
-                    if not desc_elem:
-                        desc_elem = result_container.find(class_=lambda x: x and 'snippet' in str(x))
-                    if desc_elem:
-                        description = desc_elem.get_text(strip=True)
+                title = item["title"]
+                description = item["description"] or ""
                 
                 if not url or not re.match(r'^https?://', url):
                     continue
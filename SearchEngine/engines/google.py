@@ -5,11 +5,11 @@ Mengikuti logika dari PHP: https://github.com/developerxnoxs/multi-search-engine
 
 from typing import Optional, List
 from urllib.parse import urlencode, unquote
-from bs4 import BeautifulSoup
 import re
 
 from ..base import SearchEngine, SearchResult
 from ..exceptions import ParseException
+from ..extraction import ResultSpec, FieldSpec, Strainer
 
 
 class GoogleSearch(SearchEngine):
@@ -23,6 +23,16 @@ class GoogleSearch(SearchEngine):
     ENGINE_NAME = "google"
     BASE_URL = "https://www.google.com/search"
     
+    RESULT_SPEC = ResultSpec(
+        containers=('div.MjjYud', 'div.ezO2md'),
+        fields={
+            "href": FieldSpec(('div.yuRUbf a[href]', 'a[href]'), attr='href', required=True),
+            "title": FieldSpec(('h3.LC20lb', 'a span.CVA68e'), required=True),
+            "description": FieldSpec(('div.VwiC3b', 'span.FrIlee')),
+        },
+        prune=Strainer('div', class_=['MjjYud', 'ezO2md']),
+    )
+    
     def _get_headers(self):
         """Override headers untuk Google - tambahkan consent cookie"""
         headers = super()._get_headers()
@@ -60,30 +70,8 @@ class GoogleSearch(SearchEngine):
         results = []
         
         try:
-            soup = BeautifulSoup(html, "html.parser")
-            
-            blocks = soup.select('div.MjjYud')
-            
-            if not blocks:
-                blocks = soup.select('div.ezO2md')
-            
-            for block in blocks:
-                link_container = block.select_one('div.yuRUbf a[href]')
-                if not link_container:
-                    link_container = block.select_one('a[href]')
-                
-                title_elem = block.select_one('h3.LC20lb')
-                if not title_elem:
-                    title_elem = block.select_one('a span.CVA68e')
-                
-                desc_elem = block.select_one('div.VwiC3b')
-                if not desc_elem:
-                    desc_elem = block.select_one('span.FrIlee')
-                
-                if not link_container or not title_elem:
-                    continue
-                
-                href = link_container.get('href', '')
+            for item in self.RESULT_SPEC.extract(html):
+                href = item["href"]
                 
                 if href.startswith('/url?'):
                     parts = href.replace('/url?q=', '').split('&')
@@ -99,8 +87,8 @@ class GoogleSearch(SearchEngine):
                 if 'google.com' in link:
                     continue
                 
-                title = title_elem.get_text(strip=True)
-                description = desc_elem.get_text(strip=True) if desc_elem else ''
+                title = item["title"]
+                description = item["description"] or ''
                 
                 if title and link:
                     results.append(SearchResult(
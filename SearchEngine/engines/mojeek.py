@@ -5,10 +5,10 @@ Mengikuti logika dari PHP: https://github.com/developerxnoxs/multi-search-engine
 
 from typing import Optional, List
 from urllib.parse import urlencode
-from bs4 import BeautifulSoup
 
 from ..base import SearchEngine, SearchResult
 from ..exceptions import ParseException
+from ..extraction import ResultSpec, FieldSpec, class_contains, Strainer
 
 
 class MojeekSearch(SearchEngine):
@@ -22,6 +22,16 @@ class MojeekSearch(SearchEngine):
     ENGINE_NAME = "mojeek"
     BASE_URL = "https://www.mojeek.com/search"
     
+    RESULT_SPEC = ResultSpec(
+        containers=('div[class*="result"]',),
+        fields={
+            "url": FieldSpec(('a',), attr='href', required=True),
+            "title": FieldSpec(('a',)),
+            "description": FieldSpec(('p',)),
+        },
+        prune=Strainer('div', class_=class_contains('result')),
+    )
+    
     def _build_search_url(
         self,
         query: str,
@@ -45,20 +55,10 @@ class MojeekSearch(SearchEngine):
         results = []
         
         try:
-            soup = BeautifulSoup(html, "html.parser")
-            
-            blocks = soup.select('div[class*="result"]')
-            
-            for block in blocks:
-                a = block.select_one('a')
-                desc = block.select_one('p')
-                
-                if not a:
-                    continue
-                
-                url = a.get('href', '')
-                title = a.get_text(strip=True)
-                description = desc.get_text(strip=True) if desc else ''
+            for item in self.RESULT_SPEC.extract(html):
+                url = item["url"]
+                title = item["title"]
+                description = item["description"] or ''
                 
                 if title and url and url.startswith('http'):
                     results.append(SearchResult(
@@ -5,11 +5,11 @@ Mengikuti logika dari PHP: https://github.com/developerxnoxs/multi-search-engine
 
 from typing import Optional, List
 from urllib.parse import urlencode, unquote
-from bs4 import BeautifulSoup
 import re
 
 from ..base import SearchEngine, SearchResult
 from ..exceptions import ParseException
+from ..extraction import ResultSpec, FieldSpec, class_contains, Strainer
 
 
 class YahooSearch(SearchEngine):
@@ -22,6 +22,16 @@ class YahooSearch(SearchEngine):
     ENGINE_NAME = "yahoo"
     BASE_URL = "https://search.yahoo.com/search"
     
+    RESULT_SPEC = ResultSpec(
+        containers=('div[class*="algo"]',),
+        fields={
+            "href": FieldSpec(('a',), attr='href', required=True),
+            "title": FieldSpec(('h3',), required=True),
+            "description": FieldSpec(('p',)),
+        },
+        prune=Strainer('div', class_=class_contains('algo')),
+    )
+    
     def _build_search_url(
         self,
         query: str,
@@ -52,27 +62,17 @@ class YahooSearch(SearchEngine):
         results = []
         
         try:
-            soup = BeautifulSoup(html, "html.parser")
-            
-            nodes = soup.select('div[class*="algo"]')
-            
-            for node in nodes:
-                link_node = node.select_one('a')
-                title_node = node.select_one('h3')
-                desc_node = node.select_one('p')
+            for item in self.RESULT_SPEC.extract(html):
+                url = self._extract_real_url(item["href"])
+                title = item["title"]
+                description = item["description"] or ''
                 
-                if link_node and title_node:
-                    href = link_node.get('href', '')
-                    url = self._extract_real_url(href)
-                    title = title_node.get_text(strip=True)
-                    description = desc_node.get_text(strip=True) if desc_node else ''
-                    
-                    if title and url:
-                        results.append(SearchResult(
-                            title=title,
-                            url=url,
-                            description=description
-                        ))
+                if title and url:
+                    results.append(SearchResult(
+                        title=title,
+                        url=url,
+                        description=description
+                    ))
             
         except Exception as e:
             raise ParseException(f"Failed to parse Yahoo results: {str(e)}")
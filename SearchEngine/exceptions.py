@@ -2,6 +2,8 @@
 Custom exceptions untuk Multi Search Engine Library
 """
 
+from typing import Optional
+
 
 class SearchEngineException(Exception):
     """Base exception untuk semua error search engine"""
@@ -10,7 +12,10 @@ class SearchEngineException(Exception):
 
 class NetworkException(SearchEngineException):
     """Exception untuk error jaringan/HTTP"""
-    pass
+
+    def __init__(self, message: str = "", status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
 
 
 class ParseException(SearchEngineException):
@@ -18,13 +23,21 @@ class ParseException(SearchEngineException):
     pass
 
 
-class RateLimitException(SearchEngineException):
-    """Exception ketika terkena rate limit"""
+class BlockedException(SearchEngineException):
+    """Exception ketika di-block oleh search engine"""
     pass
 
 
-class BlockedException(SearchEngineException):
-    """Exception ketika di-block oleh search engine"""
+class RateLimitException(BlockedException):
+    """Exception ketika terkena rate limit (HTTP 429)"""
+
+    def __init__(self, message: str = "", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class ProxyPoolExhaustedException(BlockedException):
+    """Exception ketika ProxyPool tidak punya proxy yang tersedia (engine tidak dihubungi)"""
     pass
 
 
@@ -0,0 +1,208 @@
+"""
+Declarative result extraction untuk Multi Search Engine Library
+
+Setiap engine mendeskripsikan struktur hasil SERP-nya lewat ResultSpec:
+selector container, selector per field beserta fallback-nya, dan
+SoupStrainer untuk membatasi parsing hanya pada subtree yang berisi hasil.
+Selector CSS dan SoupStrainer di-compile sekali saat spec pertama kali
+dipakai, sehingga bs4 dan soupsieve baru di-import saat parse pertama.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Tuple, Callable, Any, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, SoupStrainer
+    from bs4.element import Tag
+
+
+def class_contains(fragment: str) -> Callable[[Optional[str]], bool]:
+    """Matcher class untuk SoupStrainer, setara dengan [class*="fragment"]"""
+    def match(value: Optional[str]) -> bool:
+        return value is not None and fragment in value
+    return match
+
+
+class Strainer:
+    """
+    Deskripsi SoupStrainer yang dibangun saat pertama dipakai.
+
+    Argumen sama dengan bs4.SoupStrainer, contoh: Strainer('li', class_='b_algo').
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        self._strainer = None
+
+    def build(self) -> "SoupStrainer":
+        """SoupStrainer bs4 (dibuat sekali)"""
+        if self._strainer is None:
+            from bs4 import SoupStrainer
+            self._strainer = SoupStrainer(*self.args, **self.kwargs)
+        return self._strainer
+
+    def matches(self, tag: str, attrs: Dict[str, Optional[str]]) -> bool:
+        """
+        Cek start tag (nama + atribut) terhadap kriteria Strainer tanpa bs4.
+
+        Dipakai parser streaming; mendukung nama tag, class_ dan attrs dengan
+        nilai string, list, True atau fungsi seperti class_contains.
+        """
+        name = self.args[0] if self.args else self.kwargs.get("name")
+        if name is not None and not _match_rule(name, tag):
+            return False
+
+        rules = dict(self.kwargs.get("attrs") or {})
+        if "class_" in self.kwargs:
+            rules["class"] = self.kwargs["class_"]
+        for attr, rule in rules.items():
+            value = attrs.get(attr)
+            if attr == "class" and value:
+                candidates = [value] + value.split()
+                if not any(_match_rule(rule, candidate) for candidate in candidates):
+                    return False
+            elif not _match_rule(rule, value):
+                return False
+        return True
+
+    def __repr__(self) -> str:
+        params = [repr(a) for a in self.args] + [f"{k}={v!r}" for k, v in self.kwargs.items()]
+        return f"Strainer({', '.join(params)})"
+
+
+def _match_rule(rule: Any, value: Optional[str]) -> bool:
+    if rule is True:
+        return value is not None
+    if callable(rule):
+        return bool(rule(value))
+    if isinstance(rule, (list, tuple, set)):
+        return any(_match_rule(r, value) for r in rule)
+    return value == rule
+
+
+def _compile(selector: str):
+    import soupsieve as sv
+    return sv.compile(selector)
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """
+    Spesifikasi satu field hasil pencarian.
+
+    Args:
+        selectors: Selector CSS, dicoba berurutan sampai ada yang cocok.
+            Tuple kosong berarti elemen container itu sendiri.
+        attr: Nama atribut yang diambil (None = teks elemen)
+        scope: Selector ancestor terdekat yang menjadi basis pencarian
+            (seperti find_parent), None = container
+        required: Lewati container jika elemen field ini tidak ditemukan
+    """
+    selectors: Tuple[str, ...] = ()
+    attr: Optional[str] = None
+    scope: Optional[str] = None
+    required: bool = False
+
+    def __post_init__(self):
+        object.__setattr__(self, "_patterns", None)
+        object.__setattr__(self, "_scope_pattern", None)
+
+    def compile(self):
+        """Compile selector (otomatis saat find() pertama)"""
+        object.__setattr__(self, "_scope_pattern", _compile(self.scope) if self.scope else None)
+        object.__setattr__(self, "_patterns", tuple(_compile(s) for s in self.selectors))
+
+    def find(self, block: "Tag", memo: Dict[str, Optional["Tag"]]) -> Optional["Tag"]:
+        """Cari elemen field di dalam block, memakai memo per-block untuk selector yang sama"""
+        if self._patterns is None:
+            self.compile()
+        base = block
+        if self._scope_pattern is not None:
+            base = self._scope_pattern.closest(block.parent) if block.parent else None
+            if base is None:
+                return None
+
+        if not self._patterns:
+            return base
+
+        for selector, pattern in zip(self.selectors, self._patterns):
+            memo_key = f"{self.scope}|{selector}"
+            if memo_key not in memo:
+                memo[memo_key] = pattern.select_one(base)
+            elem = memo[memo_key]
+            if elem is not None:
+                return elem
+        return None
+
+    def value(self, elem: Optional["Tag"]) -> Optional[str]:
+        """Ambil nilai field dari elemen (None jika elemen tidak ada)"""
+        if elem is None:
+            return None
+        if self.attr:
+            return elem.get(self.attr, '')
+        return elem.get_text(strip=True)
+
+
+@dataclass(frozen=True)
+class ResultSpec:
+    """
+    Spesifikasi ekstraksi hasil SERP untuk satu engine.
+
+    Args:
+        containers: Selector container hasil; selector berikutnya hanya
+            dipakai jika selector sebelumnya tidak menemukan apa pun
+        fields: Mapping nama field ke FieldSpec
+        prune: Strainer (atau SoupStrainer) yang mencakup semua container
+            (opsional). Hanya subtree yang cocok yang dibangun saat parsing.
+        features: Parser BeautifulSoup yang dipakai
+    """
+    containers: Tuple[str, ...]
+    fields: Dict[str, FieldSpec] = field(default_factory=dict)
+    prune: Optional[Union[Strainer, "SoupStrainer"]] = None
+    features: str = "html.parser"
+
+    def __post_init__(self):
+        object.__setattr__(self, "_container_patterns", None)
+
+    def parse(self, html: str, prune: bool = True) -> "BeautifulSoup":
+        """Parse HTML, hanya membangun subtree yang relevan jika prune aktif"""
+        from bs4 import BeautifulSoup
+        parse_only = self.prune if prune else None
+        if isinstance(parse_only, Strainer):
+            parse_only = parse_only.build()
+        return BeautifulSoup(html, self.features, parse_only=parse_only)
+
+    def blocks(self, soup: "BeautifulSoup") -> List["Tag"]:
+        """Ambil container hasil dengan fallback selector"""
+        if self._container_patterns is None:
+            object.__setattr__(self, "_container_patterns", tuple(_compile(s) for s in self.containers))
+        for pattern in self._container_patterns:
+            found = pattern.select(soup)
+            if found:
+                return found
+        return []
+
+    def extract(self, html: str, prune: bool = True) -> List[Dict[str, Optional[str]]]:
+        """
+        Ekstrak field dari setiap container.
+
+        Returns:
+            List dict nama field -> nilai (None jika elemen tidak ditemukan),
+            container dengan field required yang hilang dilewati
+        """
+        records = []
+        soup = self.parse(html, prune=prune)
+
+        for block in self.blocks(soup):
+            memo: Dict[str, Any] = {}
+            record: Dict[str, Optional[str]] = {}
+            for name, spec in self.fields.items():
+                elem = spec.find(block, memo)
+                if elem is None and spec.required:
+                    break
+                record[name] = spec.value(elem)
+            else:
+                records.append(record)
+
+        return records
@@ -0,0 +1,330 @@
+"""
+Health tracking untuk Multi Search Engine Library
+
+Mencatat latency, error rate dan block rate per engine secara rolling,
+dengan circuit breaker per engine yang terbuka setelah BlockedException /
+NetworkException berturut-turut dan mencoba lagi (probe) setelah cooldown.
+Dipakai oleh quick_search(engine="auto") untuk memilih engine tersehat.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Optional, List, Dict, Any, Iterable
+import json
+import logging
+import os
+import tempfile
+import time
+
+from .exceptions import BlockedException, NetworkException
+
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker sederhana.
+
+    closed -> open setelah failure_threshold kegagalan berturut-turut;
+    open -> half_open setelah cooldown (satu request probe diizinkan);
+    half_open -> closed jika probe berhasil, kembali open jika gagal
+    (termasuk error lain seperti ParseException, agar probe selalu selesai).
+    """
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 300.0):
+        """
+        Args:
+            failure_threshold: Jumlah kegagalan berturut-turut sebelum open
+            cooldown: Detik sebelum probe setelah open
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+    def allow_request(self) -> bool:
+        """Cek apakah request boleh dilakukan (menandai probe saat half-open)"""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN and time.time() - self.opened_at >= self.cooldown:
+            self.state = HALF_OPEN
+            self._probing = False
+        if self.state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def is_available(self) -> bool:
+        """Seperti allow_request, tanpa mengubah state"""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN:
+            return time.time() - self.opened_at >= self.cooldown
+        return not self._probing
+
+    def record_success(self):
+        self.state = CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._probing = False
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = OPEN
+            self.opened_at = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"state": self.state, "failures": self.failures, "opened_at": self.opened_at}
+
+    def restore(self, data: Dict[str, Any]):
+        self.state = data.get("state", CLOSED)
+        if self.state == HALF_OPEN:
+            self.state = OPEN
+        self.failures = data.get("failures", 0)
+        self.opened_at = data.get("opened_at", 0.0)
+
+
+@dataclass
+class EngineHealth:
+    """Statistik rolling satu engine"""
+    engine: str
+    samples: deque = field(default_factory=lambda: deque(maxlen=50))
+
+    @property
+    def requests(self) -> int:
+        return len(self.samples)
+
+    @property
+    def error_rate(self) -> float:
+        if not self.samples:
+            return 0.0
+        return sum(1 for _, outcome in self.samples if outcome != "ok") / len(self.samples)
+
+    @property
+    def block_rate(self) -> float:
+        if not self.samples:
+            return 0.0
+        return sum(1 for _, outcome in self.samples if outcome == "blocked") / len(self.samples)
+
+    @property
+    def latency(self) -> float:
+        """Rata-rata latency (detik) dari request yang berhasil"""
+        latencies = [latency for latency, outcome in self.samples if outcome == "ok"]
+        return sum(latencies) / len(latencies) if latencies else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "engine": self.engine,
+            "requests": self.requests,
+            "latency": self.latency,
+            "error_rate": self.error_rate,
+            "block_rate": self.block_rate
+        }
+
+
+def classify_outcome(error: Optional[BaseException]) -> str:
+    """Kategori hasil request: 'ok', 'blocked', 'network' atau 'error'"""
+    if error is None:
+        return "ok"
+    if isinstance(error, BlockedException):
+        return "blocked"
+    if isinstance(error, NetworkException):
+        return "network"
+    return "error"
+
+
+class HealthTracker:
+    """
+    Health tracker per engine, thread-safe, dengan persistensi JSON opsional.
+
+    Contoh:
+        >>> health = HealthTracker(path=".engine_health.json")
+        >>> results = quick_search("python", engine="auto", health=health)
+        >>> print(health.report())
+    """
+
+    def __init__(
+        self,
+        window: int = 50,
+        failure_threshold: int = 3,
+        cooldown: float = 300.0,
+        latency_reference: float = 2.0,
+        path: Optional[str] = None,
+        save_interval: float = 5.0
+    ):
+        """
+        Args:
+            window: Jumlah request terakhir yang dihitung per engine
+            failure_threshold: Kegagalan blokir/jaringan berturut-turut sebelum circuit open
+            cooldown: Detik sebelum engine yang open dicoba lagi
+            latency_reference: Latency (detik) yang mengurangi skor menjadi setengah
+            path: File JSON untuk menyimpan state (opsional)
+            save_interval: Jarak minimum antar simpan otomatis (detik); perubahan
+                           state circuit selalu langsung disimpan
+        """
+        self.window = window
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.latency_reference = latency_reference
+        self.path = path
+        self.save_interval = save_interval
+        self.last_error: Optional[Exception] = None
+        self._last_saved = 0.0
+        self._save_lock = Lock()
+        self._health: Dict[str, EngineHealth] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = Lock()
+        if path and os.path.exists(path):
+            self.load()
+
+    def _get(self, engine: str):
+        if engine not in self._health:
+            self._health[engine] = EngineHealth(engine, deque(maxlen=self.window))
+            self._breakers[engine] = CircuitBreaker(self.failure_threshold, self.cooldown)
+        return self._health[engine], self._breakers[engine]
+
+    def record(self, engine: str, latency: float, error: Optional[BaseException] = None):
+        """
+        Catat hasil satu request.
+
+        Args:
+            engine: Nama engine
+            latency: Durasi request (detik)
+            error: Exception jika request gagal
+        """
+        outcome = classify_outcome(error)
+        with self._lock:
+            health, breaker = self._get(engine)
+            health.samples.append((latency, outcome))
+            previous = breaker.state
+            if outcome == "ok":
+                breaker.record_success()
+            elif outcome in ("blocked", "network") or breaker.state == HALF_OPEN:
+                # Probe half-open yang gagal karena error lain tetap menyelesaikan probe
+                breaker.record_failure()
+            due = breaker.state != previous or time.time() - self._last_saved >= self.save_interval
+        if self.path and due:
+            self.save()
+
+    def allow_request(self, engine: str) -> bool:
+        """Cek circuit breaker engine (menandai probe jika half-open)"""
+        with self._lock:
+            return self._get(engine)[1].allow_request()
+
+    def is_available(self, engine: str) -> bool:
+        """Cek apakah circuit engine tidak sedang open"""
+        with self._lock:
+            return self._get(engine)[1].is_available()
+
+    def state(self, engine: str) -> str:
+        """State circuit breaker engine"""
+        with self._lock:
+            breaker = self._get(engine)[1]
+            breaker.is_available()
+            return breaker.state
+
+    def score(self, engine: str) -> float:
+        """
+        Skor kesehatan 0..1 (lebih tinggi lebih sehat).
+
+        Engine tanpa data mendapat skor 1.0 agar tetap dicoba.
+        """
+        with self._lock:
+            health = self._get(engine)[0]
+            if not health.samples:
+                return 1.0
+            return (1.0 - health.error_rate) / (1.0 + health.latency / self.latency_reference)
+
+    def ranked(self, engines: Iterable[str]) -> List[str]:
+        """Urutkan engine yang tersedia dari yang tersehat (urutan awal sebagai tie-break)"""
+        candidates = [e for e in engines if self.is_available(e)]
+        return sorted(candidates, key=lambda e: -self.score(e))
+
+    def choose(self, engines: Iterable[str]) -> Optional[str]:
+        """Engine tersehat yang tersedia, atau None"""
+        ranked = self.ranked(engines)
+        return ranked[0] if ranked else None
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """Statistik semua engine yang pernah dicatat"""
+        result = {}
+        for engine in list(self._health):
+            with self._lock:
+                row = self._health[engine].to_dict()
+            row["state"] = self.state(engine)
+            row["score"] = self.score(engine)
+            result[engine] = row
+        return result
+
+    def reset(self, engine: Optional[str] = None):
+        """Hapus statistik (satu engine atau semua)"""
+        with self._lock:
+            if engine is None:
+                self._health.clear()
+                self._breakers.clear()
+            else:
+                self._health.pop(engine, None)
+                self._breakers.pop(engine, None)
+
+    def save(self, path: Optional[str] = None) -> bool:
+        """
+        Simpan state ke file JSON (atomik, lewat file sementara unik + os.replace).
+
+        Returns:
+            True jika berhasil; OSError dicatat ke log dan last_error, tidak di-raise
+        """
+        path = path or self.path
+        with self._save_lock:
+            with self._lock:
+                data = {
+                    engine: {
+                        "samples": list(health.samples),
+                        "breaker": self._breakers[engine].to_dict()
+                    }
+                    for engine, health in self._health.items()
+                }
+                self._last_saved = time.time()
+            tmp_path = None
+            try:
+                fd, tmp_path = tempfile.mkstemp(
+                    prefix=os.path.basename(path) + ".",
+                    suffix=".tmp",
+                    dir=os.path.dirname(os.path.abspath(path))
+                )
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"version": 1, "engines": data}, f)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                if tmp_path and os.path.exists(tmp_path):
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+                self.last_error = e
+                logger.warning("Gagal menyimpan health state ke %s: %s", path, e)
+                return False
+            return True
+
+    def load(self, path: Optional[str] = None):
+        """Muat state dari file JSON (file rusak diabaikan)"""
+        path = path or self.path
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return
+        with self._lock:
+            for engine, item in data.get("engines", {}).items():
+                health, breaker = self._get(engine)
+                health.samples.clear()
+                health.samples.extend((latency, outcome) for latency, outcome in item.get("samples", []))
+                breaker.restore(item.get("breaker", {}))
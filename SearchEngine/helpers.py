@@ -2,29 +2,30 @@
 Helper functions untuk kemudahan penggunaan Multi Search Engine Library
 """
 
-from typing import Optional, List, Dict, Any, Union
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Dict, Any, Union, TYPE_CHECKING
+import time
 
 from .base import SearchResult
-from .engines.google import GoogleSearch
-from .engines.bing import BingSearch
-from .engines.duckduckgo import DuckDuckGoSearch
-from .engines.yahoo import YahooSearch
-from .engines.mojeek import MojeekSearch
-from .engines.brave import BraveSearch
+from .results import ResultSet
+from .registry import registry
 from .cache import CacheInterface
+from .metrics import EventBus
+from .health import HealthTracker
+from .negative_cache import NegativeCache
+from .exceptions import BlockedException, NetworkException
 
+if TYPE_CHECKING:
+    from .parse_executor import ParseExecutor
 
-ENGINES = {
-    "google": GoogleSearch,
-    "bing": BingSearch,
-    "duckduckgo": DuckDuckGoSearch,
-    "yahoo": YahooSearch,
-    "mojeek": MojeekSearch,
-    "brave": BraveSearch,
-}
+
+# Registry engine global; class di-import saat pertama dipakai (ENGINES["bing"]).
+# Engine tambahan didaftarkan lewat register_engine() atau entry point.
+ENGINES = registry
 
 DEFAULT_ENGINE = "duckduckgo"
+AUTO_ENGINE = "auto"
+
+DEFAULT_HEALTH = HealthTracker()
 
 
 def quick_search(
@@ -34,19 +35,33 @@ def quick_search(
     language: Optional[str] = None,
     country: Optional[str] = None,
     cache: Optional[CacheInterface] = None,
-    scraper_api_key: Optional[str] = None
+    scraper_api_key: Optional[str] = None,
+    metrics: Optional[EventBus] = None,
+    health: Optional[HealthTracker] = None,
+    parse_executor: Optional["ParseExecutor"] = None,
+    negative_cache: Optional[NegativeCache] = None
 ) -> List[SearchResult]:
     """
     Fungsi shortcut untuk pencarian cepat dalam 1 baris.
     
     Args:
         query: Kata kunci pencarian
-        engine: Nama mesin pencari ('google', 'bing', 'duckduckgo', 'yahoo', 'mojeek', 'brave')
+        engine: Nama engine di registry ('google', 'bing', 'duckduckgo', 'yahoo', 'mojeek',
+                'brave', atau engine plugin) atau 'auto' untuk memilih engine tersehat
         num_results: Jumlah hasil yang diinginkan (default: 10)
         language: Kode bahasa (contoh: 'id', 'en')
         country: Kode negara (contoh: 'ID', 'US')
         cache: Instance cache (opsional)
         scraper_api_key: API key untuk ScraperAPI (diperlukan untuk Google)
+        metrics: EventBus untuk metrics per stage (opsional)
+        health: HealthTracker (default: tracker global DEFAULT_HEALTH)
+        parse_executor: ParseExecutor untuk parsing di process pool (opsional)
+        negative_cache: NegativeCache bersama untuk hasil kosong dan penanda blokir (opsional)
+        
+    Dengan engine='auto', engine dicoba dari skor kesehatan tertinggi;
+    engine dengan circuit breaker open dilewati, dan BlockedException /
+    NetworkException (termasuk penanda blokir dari negative_cache) membuat
+    pencarian pindah ke engine berikutnya.
         
     Returns:
         List[SearchResult]: Daftar hasil pencarian
@@ -55,27 +70,104 @@ def quick_search(
         >>> results = quick_search("Python tutorial")
         >>> results = quick_search("machine learning", engine="brave", num_results=5)
         >>> results = quick_search("AI news", engine="google", scraper_api_key="YOUR_KEY")
+        >>> results = quick_search("Python tutorial", engine="auto")
     """
     engine_lower = engine.lower()
+    health = health or DEFAULT_HEALTH
+    
+    if engine_lower == AUTO_ENGINE:
+        return _auto_search(
+            query, num_results, language, country, cache, scraper_api_key, metrics, health, parse_executor,
+            negative_cache
+        )
     
     if engine_lower not in ENGINES:
         available = ", ".join(ENGINES.keys())
         raise ValueError(f"Engine '{engine}' tidak dikenal. Pilihan: {available}")
     
-    engine_class = ENGINES[engine_lower]
+    return _run_search(
+        engine_lower, query, num_results, language, country, cache, scraper_api_key, metrics, health,
+        parse_executor, negative_cache
+    )
+
+
+def _run_search(
+    engine_name: str,
+    query: str,
+    num_results: int,
+    language: Optional[str],
+    country: Optional[str],
+    cache: Optional[CacheInterface],
+    scraper_api_key: Optional[str],
+    metrics: Optional[EventBus],
+    health: HealthTracker,
+    parse_executor: Optional["ParseExecutor"] = None,
+    negative_cache: Optional[NegativeCache] = None
+) -> List[SearchResult]:
+    """Jalankan satu pencarian dan catat hasilnya ke health tracker"""
+    engine_class = ENGINES[engine_name]
     
     search_engine = engine_class(
         cache=cache,
         scraper_api_key=scraper_api_key,
-        delay=1.0
+        delay=1.0,
+        metrics=metrics,
+        parse_executor=parse_executor,
+        negative_cache=negative_cache
     )
     
-    return search_engine.search(
-        query=query,
-        num_results=num_results,
-        language=language,
-        country=country
-    )
+    start = time.perf_counter()
+    try:
+        results = search_engine.search(
+            query=query,
+            num_results=num_results,
+            language=language,
+            country=country
+        )
+    except Exception as e:
+        health.record(engine_name, time.perf_counter() - start, e)
+        raise
+    health.record(engine_name, time.perf_counter() - start)
+    return results
+
+
+def auto_candidates(scraper_api_key: Optional[str] = None) -> List[str]:
+    """Engine yang dipertimbangkan mode 'auto' (engine yang butuh API key hanya jika ada ScraperAPI key)"""
+    names = ENGINES.names() if scraper_api_key else ENGINES.names(requires_api_key=False)
+    if DEFAULT_ENGINE in names:
+        names.remove(DEFAULT_ENGINE)
+        names.insert(0, DEFAULT_ENGINE)
+    return names
+
+
+def _auto_search(
+    query: str,
+    num_results: int,
+    language: Optional[str],
+    country: Optional[str],
+    cache: Optional[CacheInterface],
+    scraper_api_key: Optional[str],
+    metrics: Optional[EventBus],
+    health: HealthTracker,
+    parse_executor: Optional["ParseExecutor"] = None,
+    negative_cache: Optional[NegativeCache] = None
+) -> List[SearchResult]:
+    """Pencarian dengan engine tersehat, pindah ke engine berikutnya jika diblokir"""
+    last_error: Optional[Exception] = None
+    for engine_name in health.ranked(auto_candidates(scraper_api_key)):
+        if not health.allow_request(engine_name):
+            continue
+        try:
+            return _run_search(
+                engine_name, query, num_results, language, country, cache, scraper_api_key, metrics, health,
+                parse_executor, negative_cache
+            )
+        except (BlockedException, NetworkException) as e:
+            last_error = e
+    
+    if last_error is not None:
+        raise last_error
+    raise BlockedException("Semua engine sedang tidak tersedia (circuit breaker open)")
 
 
 class SearchAllResult:
@@ -104,6 +196,10 @@ class SearchAllResult:
     def items(self):
         """Kompatibel dengan dict.items()"""
         return self.results.items()
+    
+    def to_result_set(self) -> ResultSet:
+        """Gabungkan hasil semua engine ke satu ResultSet kolumnar"""
+        return ResultSet.from_searches(*self.results.values())
 
 
 def search_all_engines(
@@ -115,14 +211,19 @@ def search_all_engines(
     cache: Optional[CacheInterface] = None,
     scraper_api_key: Optional[str] = None,
     parallel: bool = True,
-    raise_on_error: bool = False
+    raise_on_error: bool = False,
+    metrics: Optional[EventBus] = None,
+    health: Optional[HealthTracker] = None,
+    parse_executor: Optional["ParseExecutor"] = None,
+    negative_cache: Optional[NegativeCache] = None
 ) -> SearchAllResult:
     """
     Pencarian di multiple engines sekaligus.
     
     Args:
         query: Kata kunci pencarian
-        engines: List nama engine (default: semua engine kecuali Google)
+        engines: List nama engine (default: engine registry dengan fan_out=True
+                 yang tidak butuh API key)
         num_results: Jumlah hasil per engine (default: 5)
         language: Kode bahasa
         country: Kode negara
@@ -130,6 +231,14 @@ def search_all_engines(
         scraper_api_key: API key ScraperAPI (untuk Google/Bing)
         parallel: Jalankan pencarian paralel (default: True)
         raise_on_error: Raise exception jika ada error (default: False)
+        metrics: EventBus bersama untuk semua engine (opsional)
+        health: HealthTracker (default: DEFAULT_HEALTH); dengan daftar engine
+                default, engine yang circuit breaker-nya open dilewati dan
+                dicatat di .errors
+        parse_executor: ParseExecutor bersama; parsing halaman besar dipindah
+                        ke process pool agar fan-out tidak terkunci GIL
+        negative_cache: NegativeCache bersama; engine yang sedang ditandai
+                        terblokir gagal tanpa request jaringan
         
     Returns:
         SearchAllResult: Object dengan .results (Dict hasil) dan .errors (Dict error)
@@ -146,11 +255,19 @@ def search_all_engines(
         
         >>> results = search_all_engines("AI", engines=["duckduckgo", "brave"])
     """
-    if engines is None:
-        engines = ["duckduckgo", "yahoo", "mojeek", "brave"]
-    
+    health = health or DEFAULT_HEALTH
     search_result = SearchAllResult()
     
+    if engines is None:
+        engines = []
+        for engine_name in ENGINES.names(fan_out=True, requires_api_key=False):
+            if health.allow_request(engine_name):
+                engines.append(engine_name)
+            else:
+                search_result.errors[engine_name] = BlockedException(
+                    f"{engine_name} dilewati: circuit breaker open"
+                )
+    
     def search_single(engine_name: str) -> tuple:
         try:
             engine_results = quick_search(
@@ -160,13 +277,19 @@ def search_all_engines(
                 language=language,
                 country=country,
                 cache=cache,
-                scraper_api_key=scraper_api_key
+                scraper_api_key=scraper_api_key,
+                metrics=metrics,
+                health=health,
+                parse_executor=parse_executor,
+                negative_cache=negative_cache
             )
             return (engine_name, engine_results, None)
         except Exception as e:
             return (engine_name, [], e)
     
     if parallel and len(engines) > 1:
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        
         with ThreadPoolExecutor(max_workers=len(engines)) as executor:
             futures = {executor.submit(search_single, eng): eng for eng in engines}
             for future in as_completed(futures):
@@ -190,10 +313,13 @@ def search_all_engines(
     return search_result
 
 
-def get_available_engines() -> List[str]:
+def get_available_engines(**capabilities: Any) -> List[str]:
     """
-    Mendapatkan daftar engine yang tersedia.
+    Mendapatkan daftar engine yang tersedia di registry.
     
+    Args:
+        **capabilities: Filter metadata EngineInfo, mis. supports_country=True
+        
     Returns:
         List[str]: Daftar nama engine
         
@@ -201,8 +327,10 @@ def get_available_engines() -> List[str]:
         >>> engines = get_available_engines()
         >>> print(engines)
         ['google', 'bing', 'duckduckgo', 'yahoo', 'mojeek', 'brave']
+        >>> get_available_engines(supports_language=True, requires_api_key=False)
+        ['bing', 'duckduckgo', 'brave']
     """
-    return list(ENGINES.keys())
+    return ENGINES.names(**capabilities)
 
 
 def visit_url(
@@ -230,6 +358,7 @@ def visit_url(
         >>> page = visit_url("https://example.com", timeout=10)
     """
     from .base import PageContent
+    from .decoding import decode_response
     import requests
     from bs4 import BeautifulSoup
     
@@ -242,7 +371,8 @@ def visit_url(
     
     try:
         response = requests.get(url, headers=headers, timeout=timeout)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        html, encoding, _ = decode_response(response)
+        soup = BeautifulSoup(html, 'html.parser')
         
         title = soup.title.string if soup.title else ""
         
@@ -255,9 +385,10 @@ def visit_url(
             url=url,
             title=title,
             text=text,
-            html=response.text,
+            html=html,
             status_code=response.status_code,
-            success=True
+            success=True,
+            encoding=encoding
         )
     except requests.exceptions.Timeout:
         return PageContent(
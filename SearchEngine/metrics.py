@@ -0,0 +1,401 @@
+"""
+Metrics dan tracing untuk Multi Search Engine Library
+
+EventBus menerima event per stage pencarian (cache lookup, rate limiter,
+delay, fetch, deteksi blokir, parse) beserta counter (bytes, status code,
+cache hit/miss, blokir, retry) yang diberi tag nama engine. Subscriber
+seperti MetricsAggregator dan TraceRecorder memproses event tersebut
+di dalam proses, dan bisa diekspor ke format teks Prometheus atau
+OTLP/JSON tanpa collector yang berjalan.
+"""
+
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Optional, List, Dict, Any, Callable, Tuple, Iterator
+import json
+import os
+import time
+
+
+STAGE = "stage"
+COUNTER = "counter"
+
+_current_trace_id: ContextVar[Optional[str]] = ContextVar("searchengine_trace_id", default=None)
+
+NULL_STAGE = nullcontext()
+
+
+@dataclass
+class MetricEvent:
+    """Satu event metrics"""
+    kind: str
+    name: str
+    engine: str
+    value: float
+    tags: Dict[str, Any] = field(default_factory=dict)
+    timestamp: float = 0.0
+    trace_id: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Konversi ke dictionary"""
+        return {
+            "kind": self.kind,
+            "name": self.name,
+            "engine": self.engine,
+            "value": self.value,
+            "tags": self.tags,
+            "timestamp": self.timestamp,
+            "trace_id": self.trace_id
+        }
+
+
+@contextmanager
+def trace(trace_id: Optional[str] = None) -> Iterator[str]:
+    """
+    Tandai semua event di dalam blok dengan trace id yang sama.
+
+    Dipakai oleh SearchEngine.search untuk mengelompokkan stage satu pencarian.
+    """
+    trace_id = trace_id or os.urandom(16).hex()
+    token = _current_trace_id.set(trace_id)
+    try:
+        yield trace_id
+    finally:
+        _current_trace_id.reset(token)
+
+
+class EventBus:
+    """
+    Event bus sederhana untuk metrics.
+
+    Contoh:
+        >>> bus = EventBus()
+        >>> stats = bus.subscribe(MetricsAggregator())
+        >>> ddg = DuckDuckGoSearch(metrics=bus)
+        >>> ddg.search("python")
+        >>> print(stats.summary()["duckduckgo"]["fetch"]["p95"])
+    """
+
+    def __init__(self):
+        self._subscribers: List[Callable[[MetricEvent], None]] = []
+        self._lock = Lock()
+
+    def subscribe(self, callback: Callable[[MetricEvent], None]):
+        """Daftarkan subscriber (callable yang menerima MetricEvent), return subscriber"""
+        with self._lock:
+            self._subscribers = self._subscribers + [callback]
+        return callback
+
+    def unsubscribe(self, callback: Callable[[MetricEvent], None]):
+        """Hapus subscriber"""
+        with self._lock:
+            self._subscribers = [s for s in self._subscribers if s is not callback]
+
+    def emit(self, event: MetricEvent):
+        """Kirim event ke semua subscriber; error di subscriber tidak mengganggu pencarian"""
+        for callback in self._subscribers:
+            try:
+                callback(event)
+            except Exception:
+                pass
+
+    def count(self, name: str, engine: str, value: float = 1, **tags):
+        """Emit event counter"""
+        self.emit(MetricEvent(
+            kind=COUNTER,
+            name=name,
+            engine=engine,
+            value=value,
+            tags=tags,
+            timestamp=time.time(),
+            trace_id=_current_trace_id.get()
+        ))
+
+    @contextmanager
+    def timer(self, stage: str, engine: str, **tags):
+        """Context manager yang meng-emit durasi stage (detik), dengan tag outcome ok/error"""
+        start = time.perf_counter()
+        outcome = "ok"
+        try:
+            yield
+        except BaseException:
+            outcome = "error"
+            raise
+        finally:
+            tags["outcome"] = outcome
+            self.emit(MetricEvent(
+                kind=STAGE,
+                name=stage,
+                engine=engine,
+                value=time.perf_counter() - start,
+                tags=tags,
+                timestamp=time.time(),
+                trace_id=_current_trace_id.get()
+            ))
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Percentile nearest-rank dari list yang sudah diurutkan"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(q * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+class MetricsAggregator:
+    """
+    Subscriber yang mengumpulkan durasi stage dan counter di dalam proses.
+
+    Durasi disimpan di reservoir berukuran tetap per (engine, stage) untuk
+    menghitung p50/p95/p99; count, sum dan max dihitung dari semua event.
+    """
+
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self, reservoir_size: int = 1024):
+        """
+        Args:
+            reservoir_size: Jumlah durasi terakhir yang disimpan per (engine, stage)
+        """
+        self.reservoir_size = reservoir_size
+        self._stages: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._counters: Dict[Tuple[str, str, Tuple[Tuple[str, Any], ...]], float] = {}
+        self._lock = Lock()
+
+    def __call__(self, event: MetricEvent):
+        with self._lock:
+            if event.kind == STAGE:
+                key = (event.engine, event.name)
+                stats = self._stages.get(key)
+                if stats is None:
+                    stats = {"count": 0, "sum": 0.0, "max": 0.0, "errors": 0,
+                             "samples": deque(maxlen=self.reservoir_size)}
+                    self._stages[key] = stats
+                stats["count"] += 1
+                stats["sum"] += event.value
+                stats["max"] = max(stats["max"], event.value)
+                if event.tags.get("outcome") == "error":
+                    stats["errors"] += 1
+                stats["samples"].append(event.value)
+            else:
+                key = (event.name, event.engine, tuple(sorted(event.tags.items())))
+                self._counters[key] = self._counters.get(key, 0) + event.value
+
+    def reset(self):
+        """Hapus semua data"""
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        Ringkasan durasi per engine dan stage.
+
+        Returns:
+            Dict engine -> stage -> {count, errors, mean, max, p50, p95, p99}
+        """
+        with self._lock:
+            items = [(key, dict(stats), sorted(stats["samples"])) for key, stats in self._stages.items()]
+
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (engine, stage), stats, samples in items:
+            row = {
+                "count": stats["count"],
+                "errors": stats["errors"],
+                "mean": stats["sum"] / stats["count"],
+                "max": stats["max"],
+            }
+            for q in self.QUANTILES:
+                row[f"p{int(q * 100)}"] = _percentile(samples, q)
+            result.setdefault(engine, {})[stage] = row
+        return result
+
+    def stage_sums(self) -> Dict[Tuple[str, str], Tuple[int, float, List[float]]]:
+        """(engine, stage) -> (count, sum, sampel terurut), dipakai oleh exporter"""
+        with self._lock:
+            return {
+                key: (stats["count"], stats["sum"], sorted(stats["samples"]))
+                for key, stats in self._stages.items()
+            }
+
+    def counters(self) -> List[Tuple[str, str, Dict[str, Any], float]]:
+        """Daftar counter: (nama, engine, tags, nilai)"""
+        with self._lock:
+            return [(name, engine, dict(tags), value) for (name, engine, tags), value in self._counters.items()]
+
+    def counter(self, name: str, engine: Optional[str] = None, **tags) -> float:
+        """Total nilai counter, difilter berdasarkan engine dan tag"""
+        total = 0.0
+        for counter_name, counter_engine, counter_tags, value in self.counters():
+            if counter_name != name or (engine is not None and counter_engine != engine):
+                continue
+            if any(counter_tags.get(k) != v for k, v in tags.items()):
+                continue
+            total += value
+        return total
+
+
+class TraceRecorder:
+    """Subscriber yang menyimpan event stage terakhir sebagai span, dikelompokkan per trace id"""
+
+    def __init__(self, max_spans: int = 10000):
+        self._spans: deque = deque(maxlen=max_spans)
+        self._lock = Lock()
+
+    def __call__(self, event: MetricEvent):
+        if event.kind != STAGE:
+            return
+        with self._lock:
+            self._spans.append(event)
+
+    def spans(self, trace_id: Optional[str] = None) -> List[MetricEvent]:
+        """Span yang tersimpan (opsional untuk satu trace id)"""
+        with self._lock:
+            spans = list(self._spans)
+        if trace_id is not None:
+            spans = [s for s in spans if s.trace_id == trace_id]
+        return spans
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _metric_name(name: str) -> str:
+    return "".join(c if c.isalnum() else "_" for c in name)
+
+
+def _merge_tags(reserved: Dict[str, Any], tags: Dict[str, Any]) -> Dict[str, Any]:
+    """Gabungkan label tetap (engine, stage, ...) dengan tag event; tag yang bentrok diberi prefix tag_"""
+    merged = dict(reserved)
+    for key, value in tags.items():
+        merged[f"tag_{key}" if key in reserved else key] = value
+    return merged
+
+
+def _labels(labels: Dict[str, Any]) -> str:
+    return "{" + ",".join(f'{_metric_name(k)}="{_escape_label(v)}"' for k, v in labels.items()) + "}"
+
+
+def to_prometheus(aggregator: MetricsAggregator, prefix: str = "searchengine") -> str:
+    """
+    Render metrics dalam format teks eksposisi Prometheus.
+
+    Durasi stage menjadi summary `<prefix>_stage_seconds`, counter menjadi
+    `<prefix>_<nama>_total`.
+    """
+    lines = [
+        f"# HELP {prefix}_stage_seconds Durasi stage pencarian per engine",
+        f"# TYPE {prefix}_stage_seconds summary",
+    ]
+    for (engine, stage), (count, total, samples) in sorted(aggregator.stage_sums().items()):
+        for q in MetricsAggregator.QUANTILES:
+            labels = _labels({"engine": engine, "stage": stage, "quantile": q})
+            lines.append(f"{prefix}_stage_seconds{labels} {_percentile(samples, q):.6f}")
+        labels = _labels({"engine": engine, "stage": stage})
+        lines.append(f"{prefix}_stage_seconds_sum{labels} {total:.6f}")
+        lines.append(f"{prefix}_stage_seconds_count{labels} {count}")
+
+    by_name: Dict[str, List[Tuple[str, Dict[str, Any], float]]] = {}
+    for name, engine, tags, value in aggregator.counters():
+        by_name.setdefault(name, []).append((engine, tags, value))
+
+    for name in sorted(by_name):
+        metric = f"{prefix}_{_metric_name(name)}_total"
+        lines.append(f"# TYPE {metric} counter")
+        for engine, tags, value in sorted(by_name[name], key=lambda x: (x[0], sorted(x[1].items()))):
+            labels = _labels(_merge_tags({"engine": engine}, tags))
+            lines.append(f"{metric}{labels} {value:g}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    result = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            typed = {"boolValue": value}
+        elif isinstance(value, int):
+            typed = {"intValue": str(value)}
+        elif isinstance(value, float):
+            typed = {"doubleValue": value}
+        else:
+            typed = {"stringValue": str(value)}
+        result.append({"key": key, "value": typed})
+    return result
+
+
+def _otlp_resource(service_name: str) -> Dict[str, Any]:
+    return {"attributes": _otlp_attributes({"service.name": service_name})}
+
+
+def to_otlp_metrics(aggregator: MetricsAggregator, service_name: str = "SearchEngine") -> Dict[str, Any]:
+    """Export metrics sebagai dokumen OTLP/JSON (ExportMetricsServiceRequest)"""
+    now_ns = str(time.time_ns())
+    summary_points = []
+    for (engine, stage), (count, total, samples) in sorted(aggregator.stage_sums().items()):
+        summary_points.append({
+            "attributes": _otlp_attributes({"engine": engine, "stage": stage}),
+            "timeUnixNano": now_ns,
+            "count": str(count),
+            "sum": total,
+            "quantileValues": [
+                {"quantile": q, "value": _percentile(samples, q)} for q in MetricsAggregator.QUANTILES
+            ],
+        })
+
+    sum_points = []
+    for name, engine, tags, value in aggregator.counters():
+        sum_points.append({
+            "attributes": _otlp_attributes(_merge_tags({"event": name, "engine": engine}, tags)),
+            "timeUnixNano": now_ns,
+            "asDouble": value,
+        })
+
+    return {
+        "resourceMetrics": [{
+            "resource": _otlp_resource(service_name),
+            "scopeMetrics": [{
+                "scope": {"name": "SearchEngine"},
+                "metrics": [
+                    {"name": "searchengine.stage.duration", "unit": "s", "summary": {"dataPoints": summary_points}},
+                    {
+                        "name": "searchengine.events",
+                        "sum": {"dataPoints": sum_points, "aggregationTemporality": 2, "isMonotonic": True},
+                    },
+                ],
+            }],
+        }]
+    }
+
+
+def to_otlp_traces(recorder: TraceRecorder, service_name: str = "SearchEngine") -> Dict[str, Any]:
+    """Export span dari TraceRecorder sebagai dokumen OTLP/JSON (ExportTraceServiceRequest)"""
+    spans = []
+    for event in recorder.spans():
+        end_ns = int(event.timestamp * 1e9)
+        spans.append({
+            "traceId": event.trace_id or "",
+            "spanId": os.urandom(8).hex(),
+            "name": f"{event.engine}.{event.name}",
+            "kind": 1,
+            "startTimeUnixNano": str(end_ns - int(event.value * 1e9)),
+            "endTimeUnixNano": str(end_ns),
+            "attributes": _otlp_attributes(_merge_tags({"engine": event.engine}, event.tags)),
+            "status": {"code": 2 if event.tags.get("outcome") == "error" else 1},
+        })
+    return {
+        "resourceSpans": [{
+            "resource": _otlp_resource(service_name),
+            "scopeSpans": [{"scope": {"name": "SearchEngine"}, "spans": spans}],
+        }]
+    }
+
+
+def write_otlp_json(document: Dict[str, Any], path: str):
+    """Tulis dokumen OTLP/JSON ke file (satu dokumen per baris), untuk dikirim collector nanti"""
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(document, ensure_ascii=False) + "\n")
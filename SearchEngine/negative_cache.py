@@ -0,0 +1,145 @@
+"""
+Negative caching untuk Multi Search Engine Library
+
+Hasil kosong, halaman blokir (captcha/403/429) dan error jaringan tidak
+pernah masuk cache hasil, sehingga setiap retry query yang sama kembali
+menghantam engine dan memperdalam blokir. NegativeCache mencatat outcome
+tersebut per (engine, query) dengan TTL pendek yang terpisah, ditambah
+penanda "blocked until" per engine yang membuat pencarian langsung gagal
+tanpa request jaringan sampai waktunya lewat.
+
+Contoh:
+    >>> negative = NegativeCache(empty_ttl=300, blocked_ttl=900, engine_block_ttl=600)
+    >>> engine = BingSearch(negative_cache=negative)
+    >>> engine.search("python")                      # captcha -> BlockedException
+    >>> engine.search("rust")                        # BlockedException tanpa request
+    >>> engine.search("rust", force_refresh=True)    # abaikan penanda, fetch ulang
+"""
+
+from typing import Optional, Dict, Any
+import time
+
+from .cache import CacheInterface, MemoryCache
+from .exceptions import (
+    BlockedException,
+    NetworkException,
+    ProxyPoolExhaustedException,
+    RateLimitException,
+    SearchEngineException
+)
+
+
+EMPTY = "empty"
+BLOCKED = "blocked"
+RATE_LIMITED = "rate_limited"
+ERROR = "error"
+
+
+class NegativeCache:
+    """
+    Penanda outcome negatif per (engine, query) dan blokir per engine.
+
+    Satu instance boleh dibagi ke beberapa engine; dengan store berupa
+    FileCache(index=False), penanda juga berlaku lintas proses.
+    """
+
+    def __init__(
+        self,
+        store: Optional[CacheInterface] = None,
+        empty_ttl: float = 300,
+        blocked_ttl: float = 900,
+        error_ttl: float = 60,
+        engine_block_ttl: float = 300
+    ):
+        """
+        Args:
+            store: Cache untuk penanda (default: MemoryCache tersendiri)
+            empty_ttl: TTL hasil kosong (detik, 0 = tidak dicatat)
+            blocked_ttl: TTL penanda blokir per query
+            error_ttl: TTL penanda error jaringan per query
+            engine_block_ttl: Lama engine dianggap terblokir setelah halaman
+                              blokir/429 (Retry-After dipakai jika lebih lama;
+                              0 = tanpa penanda per engine)
+        """
+        self.store = store if store is not None else MemoryCache(max_size=10000)
+        self.empty_ttl = empty_ttl
+        self.blocked_ttl = blocked_ttl
+        self.error_ttl = error_ttl
+        self.engine_block_ttl = engine_block_ttl
+
+    @staticmethod
+    def _query_key(engine: str, key: str) -> str:
+        return f"negative:{engine}:{key}"
+
+    @staticmethod
+    def _engine_key(engine: str) -> str:
+        return f"blocked_until:{engine}"
+
+    def _put(self, key: str, outcome: str, ttl: float, message: str = ""):
+        if ttl <= 0:
+            return
+        self.store.set(key, {"outcome": outcome, "message": message, "until": time.time() + ttl}, ttl=ttl)
+
+    def _live(self, key: str) -> Optional[Dict[str, Any]]:
+        marker = self.store.get(key)
+        if isinstance(marker, dict) and marker.get("until", 0) > time.time():
+            return marker
+        return None
+
+    def get(self, engine: str, key: str) -> Optional[Dict[str, Any]]:
+        """Penanda untuk (engine, cache key query), atau None"""
+        return self._live(self._query_key(engine, key))
+
+    def record_empty(self, engine: str, key: str):
+        self._put(self._query_key(engine, key), EMPTY, self.empty_ttl)
+
+    def record_error(self, engine: str, key: str, error: SearchEngineException):
+        """
+        Catat exception pencarian; blokir/429 juga memasang penanda per engine.
+
+        ProxyPoolExhaustedException tidak dicatat: engine tidak pernah dihubungi.
+        """
+        if isinstance(error, ProxyPoolExhaustedException):
+            return
+        if isinstance(error, BlockedException):
+            outcome = RATE_LIMITED if isinstance(error, RateLimitException) else BLOCKED
+            self._put(self._query_key(engine, key), outcome, self.blocked_ttl, str(error))
+            retry_after = getattr(error, "retry_after", None) or 0
+            seconds = max(self.engine_block_ttl, retry_after) if self.engine_block_ttl else 0
+            self.block_engine(engine, seconds, str(error), outcome)
+        elif isinstance(error, NetworkException):
+            self._put(self._query_key(engine, key), ERROR, self.error_ttl, str(error))
+
+    def block_engine(self, engine: str, seconds: float, reason: str = "", outcome: str = BLOCKED):
+        """Tandai engine terblokir selama `seconds` detik (outcome BLOCKED atau RATE_LIMITED)"""
+        self._put(self._engine_key(engine), outcome, seconds, reason)
+
+    def unblock_engine(self, engine: str):
+        self.store.delete(self._engine_key(engine))
+
+    def blocked_until(self, engine: str) -> Optional[float]:
+        """Timestamp akhir blokir engine, atau None jika tidak terblokir"""
+        marker = self._live(self._engine_key(engine))
+        return marker["until"] if marker is not None else None
+
+    def lookup(self, engine: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Penanda yang berlaku sebelum request jaringan: blokir engine, lalu penanda query.
+
+        Returns:
+            Dict penanda (outcome, message, until) atau None
+        """
+        return self._live(self._engine_key(engine)) or self.get(engine, key)
+
+
+def to_exception(engine: str, marker: Dict[str, Any]) -> SearchEngineException:
+    """Exception untuk penanda negatif (tanpa request jaringan)"""
+    remaining = max(0.0, marker["until"] - time.time())
+    message = f"{engine}: cached {marker['outcome']} outcome for another {remaining:.0f}s"
+    if marker.get("message"):
+        message += f" ({marker['message']})"
+    if marker["outcome"] == RATE_LIMITED:
+        return RateLimitException(message, retry_after=remaining)
+    if marker["outcome"] == BLOCKED:
+        return BlockedException(message)
+    return NetworkException(message)
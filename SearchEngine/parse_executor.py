@@ -0,0 +1,170 @@
+"""
+Parse SERP di process pool untuk Multi Search Engine Library
+
+Parsing BeautifulSoup di _parse_results berjalan di bawah GIL, sehingga
+fan-out berbasis thread (search_all_engines) hanya memakai satu core.
+ParseExecutor mengirim HTML ke worker process yang sudah "hangat" (modul
+engine, bs4 dan selector sudah di-import/di-compile) dan menerima hasil
+kembali sebagai list of dict. Halaman kecil tetap di-parse inline karena
+biaya IPC-nya lebih besar dari parse itu sendiri.
+
+Contoh:
+    >>> with ParseExecutor(max_workers=8) as executor:
+    ...     engine = BingSearch(parse_executor=executor)
+    ...     results = engine.search("python")
+"""
+
+from threading import Lock
+from typing import Optional, List, Dict, Any, Iterable
+
+from .exceptions import ConfigurationException
+
+
+DEFAULT_INLINE_THRESHOLD = 50_000
+
+# Instance engine per class di dalam worker process (dibuat sekali per worker)
+_WORKER_ENGINES: Dict[type, Any] = {}
+
+
+def _worker_engine(engine_class):
+    engine = _WORKER_ENGINES.get(engine_class)
+    if engine is None:
+        engine = _WORKER_ENGINES[engine_class] = engine_class(delay=0)
+    return engine
+
+
+def _warm_worker(engine_names: List[str]):
+    """Initializer worker: import modul engine dan jalankan satu parse kosong"""
+    from .helpers import ENGINES
+
+    for name in engine_names:
+        try:
+            _worker_engine(ENGINES[name])._parse_results("<html><body></body></html>")
+        except Exception:
+            pass
+
+
+def _parse_job(engine_class, html: str) -> List[Dict[str, Any]]:
+    """Worker: parse HTML dengan engine_class dan kembalikan hasil sebagai list of dict"""
+    return [r.to_dict() for r in _worker_engine(engine_class)._parse_results(html)]
+
+
+class ParseExecutor:
+    """
+    Process pool untuk _parse_results.
+
+    Pool dibuat saat halaman besar pertama dikirim. Worker mem-parse dengan
+    instance engine milik worker berdasarkan class engine, sehingga
+    perubahan pada instance (mis. RESULT_SPEC yang diganti per instance)
+    tidak ikut terbawa; class harus bisa di-pickle (didefinisikan di level
+    modul).
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        inline_threshold: int = DEFAULT_INLINE_THRESHOLD,
+        warm_engines: Optional[Iterable[str]] = None,
+        mp_context=None
+    ):
+        """
+        Args:
+            max_workers: Jumlah worker process (default: jumlah CPU)
+            inline_threshold: Halaman lebih pendek dari ini (karakter) di-parse inline
+            warm_engines: Nama engine yang di-import saat worker start
+                          (default: semua engine di registry)
+            mp_context: multiprocessing context (opsional, mis. "spawn")
+        """
+        if inline_threshold < 0:
+            raise ConfigurationException("inline_threshold tidak boleh negatif")
+        self.max_workers = max_workers
+        self.inline_threshold = inline_threshold
+        self.warm_engines = list(warm_engines) if warm_engines is not None else None
+        self.mp_context = mp_context
+        self.inline = 0
+        self.offloaded = 0
+        self._pool = None
+        self._lock = Lock()
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                from concurrent.futures import ProcessPoolExecutor
+                import multiprocessing
+
+                if self.warm_engines is None:
+                    from .helpers import ENGINES
+                    self.warm_engines = ENGINES.names()
+                context = self.mp_context
+                if isinstance(context, str):
+                    context = multiprocessing.get_context(context)
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=context,
+                    initializer=_warm_worker,
+                    initargs=(self.warm_engines,)
+                )
+            return self._pool
+
+    def should_offload(self, html: str) -> bool:
+        return len(html) >= self.inline_threshold
+
+    def _count(self, offloaded: bool):
+        with self._lock:
+            if offloaded:
+                self.offloaded += 1
+            else:
+                self.inline += 1
+
+    def submit(self, engine, html: str):
+        """
+        Kirim HTML ke worker.
+
+        Returns:
+            concurrent.futures.Future berisi list of dict hasil
+        """
+        self._count(True)
+        return self._get_pool().submit(_parse_job, type(engine), html)
+
+    def parse(self, engine, html: str) -> list:
+        """Parse HTML untuk engine (inline jika di bawah threshold); blocking"""
+        if not self.should_offload(html):
+            self._count(False)
+            return engine._parse_results(html)
+        return _to_results(self.submit(engine, html).result())
+
+    async def parse_async(self, engine, html: str) -> list:
+        """Seperti parse(), tanpa memblokir event loop"""
+        import asyncio
+
+        if not self.should_offload(html):
+            self._count(False)
+            return engine._parse_results(html)
+        return _to_results(await asyncio.wrap_future(self.submit(engine, html)))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "inline": self.inline,
+            "offloaded": self.offloaded,
+            "inline_threshold": self.inline_threshold,
+            "started": self._pool is not None,
+        }
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "ParseExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+        return False
+
+
+def _to_results(dicts: List[Dict[str, Any]]) -> list:
+    from .base import SearchResult
+
+    return [SearchResult(**d) for d in dicts]
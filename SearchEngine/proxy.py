@@ -0,0 +1,368 @@
+"""
+Proxy pool untuk Multi Search Engine Library
+
+ProxyPool membagi request ke beberapa proxy dengan strategi round-robin,
+least-loaded atau sticky per engine. Setiap proxy punya RateLimiter dan
+connection pool (requests.Session) sendiri, di-probe secara berkala ke
+URL health check, dan dikeluarkan dari rotasi setelah berulang kali
+menyebabkan blokir.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import Lock, Event, Thread
+from typing import Optional, List, Dict, Any, Iterable, Iterator, TYPE_CHECKING
+import time
+
+from .rate_limiter import RateLimiter
+from .exceptions import BlockedException, ConfigurationException, ProxyPoolExhaustedException
+
+if TYPE_CHECKING:
+    import requests
+
+
+ROUND_ROBIN = "round_robin"
+LEAST_LOADED = "least_loaded"
+STICKY = "sticky"
+
+
+@dataclass(eq=False)
+class Proxy:
+    """Satu proxy di dalam ProxyPool"""
+    url: str
+    rate_limiter: RateLimiter
+    pool_maxsize: int = 10
+    in_flight: int = 0
+    total_requests: int = 0
+    failures: int = 0
+    blocks: int = 0
+    consecutive_failures: int = 0
+    consecutive_blocks: int = 0
+    healthy: bool = True
+    evicted: bool = False
+    last_latency: float = 0.0
+    _session: Optional["requests.Session"] = field(default=None, repr=False)
+
+    @property
+    def proxies(self) -> Dict[str, str]:
+        """Konfigurasi proxies untuk requests"""
+        return {"http": self.url, "https": self.url}
+
+    @property
+    def label(self) -> str:
+        """host:port proxy tanpa kredensial, aman dipakai sebagai tag metrics"""
+        from urllib.parse import urlsplit
+
+        try:
+            parts = urlsplit(self.url if "//" in self.url else f"//{self.url}")
+            host, port = parts.hostname, parts.port
+        except ValueError:
+            host, port = None, None
+        if not host:
+            return "unknown"
+        return f"{host}:{port}" if port else host
+
+    @property
+    def available(self) -> bool:
+        return self.healthy and not self.evicted
+
+    @property
+    def session(self) -> "requests.Session":
+        """Session (connection pool) khusus proxy ini, dibuat saat pertama dipakai"""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.proxies.update(self.proxies)
+            # Tanpa ini HTTP(S)_PROXY/NO_PROXY dari environment bisa menggantikan
+            # atau melewati proxy pool
+            session.trust_env = False
+            self._session = session
+        return self._session
+
+    def get(self, url: str, **kwargs) -> "requests.Response":
+        """GET melalui proxy ini"""
+        return self.session.get(url, **kwargs)
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def to_dict(self, include_url: bool = False) -> Dict[str, Any]:
+        """
+        Statistik proxy.
+
+        Args:
+            include_url: Sertakan URL mentah (termasuk kredensial user:pass@)
+                         sebagai field "url"; default hanya "proxy" (host:port)
+        """
+        data = {
+            "proxy": self.label,
+            "in_flight": self.in_flight,
+            "requests": self.total_requests,
+            "failures": self.failures,
+            "blocks": self.blocks,
+            "healthy": self.healthy,
+            "evicted": self.evicted,
+            "last_latency": self.last_latency,
+            "current_delay": self.rate_limiter.current_delay
+        }
+        if include_url:
+            data["url"] = self.url
+        return data
+
+
+class ProxyPool:
+    """
+    Pool proxy dengan rotasi, health check dan rate limit per proxy.
+
+    Contoh:
+        >>> pool = ProxyPool(["http://p1:8080", "http://p2:8080"], strategy="least_loaded")
+        >>> pool.check_health("http://127.0.0.1:8000/health")
+        >>> bing = BingSearch(proxy=pool)
+        >>> ddg = DuckDuckGoSearch(proxy=pool)
+    """
+
+    STRATEGIES = (ROUND_ROBIN, LEAST_LOADED, STICKY)
+
+    def __init__(
+        self,
+        proxies: Iterable[str],
+        strategy: str = ROUND_ROBIN,
+        requests_per_minute: int = 10,
+        min_delay: float = 1.0,
+        max_blocks: int = 3,
+        max_failures: int = 3,
+        health_check_url: Optional[str] = None,
+        health_check_timeout: float = 5.0,
+        pool_maxsize: int = 10
+    ):
+        """
+        Args:
+            proxies: Daftar URL proxy
+            strategy: 'round_robin', 'least_loaded' atau 'sticky' (satu proxy per engine)
+            requests_per_minute: Batas request per menit per proxy
+            min_delay: Delay minimum antar request per proxy (detik)
+            max_blocks: Blokir berturut-turut sebelum proxy dikeluarkan (evict)
+            max_failures: Error jaringan berturut-turut sebelum proxy ditandai tidak sehat
+            health_check_url: URL default untuk check_health()
+            health_check_timeout: Timeout health check (detik)
+            pool_maxsize: Ukuran connection pool per proxy
+        """
+        if strategy not in self.STRATEGIES:
+            raise ConfigurationException(
+                f"Strategi proxy '{strategy}' tidak dikenal. Pilihan: {', '.join(self.STRATEGIES)}"
+            )
+        self.strategy = strategy
+        self.requests_per_minute = requests_per_minute
+        self.min_delay = min_delay
+        self.max_blocks = max_blocks
+        self.max_failures = max_failures
+        self.health_check_url = health_check_url
+        self.health_check_timeout = health_check_timeout
+        self.pool_maxsize = pool_maxsize
+        self._proxies: List[Proxy] = []
+        self._sticky: Dict[str, Proxy] = {}
+        self._next = 0
+        self._lock = Lock()
+        self._stop_event: Optional[Event] = None
+        self._checker: Optional[Thread] = None
+        for url in proxies:
+            self.add(url)
+
+    def add(self, url: str) -> Proxy:
+        """Tambahkan proxy ke pool"""
+        proxy = Proxy(
+            url=url,
+            rate_limiter=RateLimiter(self.requests_per_minute, self.min_delay),
+            pool_maxsize=self.pool_maxsize
+        )
+        with self._lock:
+            self._proxies.append(proxy)
+        return proxy
+
+    def remove(self, url: str):
+        """Hapus proxy dari pool"""
+        with self._lock:
+            for proxy in [p for p in self._proxies if p.url == url]:
+                proxy.close()
+                self._proxies.remove(proxy)
+            self._sticky = {k: v for k, v in self._sticky.items() if v.url != url}
+
+    @property
+    def proxies(self) -> List[Proxy]:
+        """Semua proxy di pool"""
+        return list(self._proxies)
+
+    @property
+    def available(self) -> List[Proxy]:
+        """Proxy yang sehat dan belum di-evict"""
+        return [p for p in self._proxies if p.available]
+
+    def _select(self, engine: str) -> Proxy:
+        candidates = [p for p in self._proxies if p.available]
+        if not candidates:
+            raise ProxyPoolExhaustedException("Tidak ada proxy yang tersedia di ProxyPool")
+
+        if self.strategy == LEAST_LOADED:
+            return min(candidates, key=lambda p: (p.in_flight, p.total_requests))
+
+        if self.strategy == STICKY:
+            proxy = self._sticky.get(engine)
+            if proxy is not None and proxy.available and proxy in self._proxies:
+                return proxy
+
+        proxy = candidates[self._next % len(candidates)]
+        self._next += 1
+        if self.strategy == STICKY:
+            self._sticky[engine] = proxy
+        return proxy
+
+    def acquire(self, engine: str = "") -> Proxy:
+        """
+        Pilih proxy untuk satu request (harus diikuti release()).
+
+        Raises:
+            ProxyPoolExhaustedException: Jika tidak ada proxy yang tersedia
+        """
+        with self._lock:
+            proxy = self._select(engine)
+            proxy.in_flight += 1
+            proxy.total_requests += 1
+            return proxy
+
+    def release(
+        self,
+        proxy: Proxy,
+        latency: float = 0.0,
+        failed: bool = False,
+        blocked: bool = False,
+        rate_limited: bool = False
+    ):
+        """
+        Kembalikan proxy setelah request dan catat hasilnya.
+
+        Args:
+            proxy: Proxy dari acquire()
+            latency: Durasi request (detik)
+            failed: Request gagal karena error jaringan
+            blocked: Request diblokir (403, 429, captcha)
+            rate_limited: Request terkena 429 (rate limiter proxy di-backoff)
+        """
+        if rate_limited:
+            proxy.rate_limiter.backoff()
+        with self._lock:
+            proxy.in_flight = max(0, proxy.in_flight - 1)
+            proxy.last_latency = latency
+            if blocked:
+                proxy.blocks += 1
+                proxy.consecutive_blocks += 1
+                if proxy.consecutive_blocks >= self.max_blocks:
+                    proxy.evicted = True
+            elif failed:
+                proxy.failures += 1
+                proxy.consecutive_failures += 1
+                if proxy.consecutive_failures >= self.max_failures:
+                    proxy.healthy = False
+            else:
+                proxy.consecutive_blocks = 0
+                proxy.consecutive_failures = 0
+
+    @contextmanager
+    def lease(self, engine: str = "") -> Iterator[Proxy]:
+        """Context manager acquire/release (exception dihitung sebagai kegagalan)"""
+        proxy = self.acquire(engine)
+        start = time.perf_counter()
+        try:
+            yield proxy
+        except BlockedException:
+            self.release(proxy, time.perf_counter() - start, blocked=True)
+            raise
+        except Exception:
+            self.release(proxy, time.perf_counter() - start, failed=True)
+            raise
+        self.release(proxy, time.perf_counter() - start)
+
+    def check_health(self, url: Optional[str] = None, include_evicted: bool = False) -> Dict[str, bool]:
+        """
+        Probe setiap proxy dengan GET ke URL health check.
+
+        Proxy yang merespon dengan status < 500 ditandai sehat. Proxy yang
+        sudah di-evict hanya di-probe (dan dipulihkan) jika include_evicted=True.
+
+        Returns:
+            Dict url proxy -> sehat
+        """
+        import requests
+
+        url = url or self.health_check_url
+        if not url:
+            raise ConfigurationException("health_check_url belum diset")
+
+        result = {}
+        for proxy in self.proxies:
+            if proxy.evicted and not include_evicted:
+                result[proxy.url] = False
+                continue
+            try:
+                ok = proxy.get(url, timeout=self.health_check_timeout).status_code < 500
+            except requests.exceptions.RequestException:
+                ok = False
+            with self._lock:
+                proxy.healthy = ok
+                if ok:
+                    proxy.consecutive_failures = 0
+                    if include_evicted:
+                        proxy.evicted = False
+                        proxy.consecutive_blocks = 0
+            result[proxy.url] = ok
+        return result
+
+    def start_health_checks(self, interval: float = 60.0, url: Optional[str] = None):
+        """Jalankan check_health() berkala di thread background"""
+        self.stop_health_checks()
+        stop_event = Event()
+
+        def run():
+            while not stop_event.wait(interval):
+                try:
+                    self.check_health(url)
+                except ConfigurationException:
+                    return
+
+        self._stop_event = stop_event
+        self._checker = Thread(target=run, name="ProxyPoolHealthCheck", daemon=True)
+        self._checker.start()
+
+    def stop_health_checks(self):
+        """Hentikan health check berkala"""
+        if self._stop_event is not None:
+            self._stop_event.set()
+            self._checker.join()
+            self._stop_event = None
+            self._checker = None
+
+    def stats(self, include_url: bool = False) -> List[Dict[str, Any]]:
+        """Statistik semua proxy (lihat Proxy.to_dict untuk include_url)"""
+        return [p.to_dict(include_url) for p in self.proxies]
+
+    def close(self):
+        """Hentikan health check dan tutup semua session"""
+        self.stop_health_checks()
+        for proxy in self.proxies:
+            proxy.close()
+
+    def __len__(self) -> int:
+        return len(self._proxies)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -0,0 +1,136 @@
+"""
+Normalisasi query untuk Multi Search Engine Library
+
+QueryNormalizer mengubah query mentah menjadi NormalizedQuery satu kali per
+pencarian; hasilnya dipakai bersama oleh cache key, key single-flight dan
+response (SearchResponse.query_key), sehingga "Python  Tutorial",
+"python tutorial" dan " python tutorial " berbagi entry cache dan fetch.
+
+Dengan operators=True, frasa dalam tanda kutip dipertahankan sebagai satu
+unit, operator seperti site:/filetype:/-kata dinormalisasi (domain
+lowercase tanpa "www.") dan diurutkan di akhir key, sementara OR/AND tetap
+huruf besar.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+import re
+import unicodedata
+
+
+_WHITESPACE = re.compile(r"\s+")
+_TOKENS = re.compile(r'-?"[^"]*"|\S+')
+_OPERATOR = re.compile(r"^-?[a-z]+:", re.IGNORECASE)
+_BOOLEAN_OPERATORS = {"OR", "AND", "|"}
+_DOMAIN_OPERATORS = {"site", "inurl", "-site"}
+
+
+@dataclass(frozen=True)
+class NormalizedQuery:
+    """
+    Query yang sudah dinormalisasi.
+
+    Attributes:
+        original: Query seperti yang diberikan pemanggil
+        text: Query yang dikirim ke engine (NFKC + whitespace dirapikan, case dipertahankan)
+        key: Key ter-normalisasi untuk cache, single-flight dan dedup
+    """
+    original: str
+    text: str
+    key: str
+
+    def __str__(self) -> str:
+        return self.text
+
+
+class QueryNormalizer:
+    """
+    Normalizer query yang bisa dikonfigurasi.
+
+    Contoh:
+        >>> QueryNormalizer().normalize("  Python　 Tutorial ").key
+        'python tutorial'
+        >>> QueryNormalizer(operators=True).normalize('site:WWW.Python.org "Async  IO"').key
+        '"async io" site:python.org'
+    """
+
+    def __init__(
+        self,
+        unicode_form: str = "NFKC",
+        casefold: bool = True,
+        collapse_whitespace: bool = True,
+        operators: bool = False
+    ):
+        """
+        Args:
+            unicode_form: Bentuk normalisasi Unicode (None = tanpa normalisasi)
+            casefold: Key case-insensitive (str.casefold)
+            collapse_whitespace: Rapikan whitespace berturut-turut dan di tepi
+            operators: Tangani tanda kutip dan operator (site:, filetype:, -kata, OR)
+        """
+        self.unicode_form = unicode_form
+        self.casefold = casefold
+        self.collapse_whitespace = collapse_whitespace
+        self.operators = operators
+
+    def normalize(self, query) -> NormalizedQuery:
+        """Normalisasi query (NormalizedQuery dikembalikan apa adanya)"""
+        if isinstance(query, NormalizedQuery):
+            return query
+        text = query
+        if self.unicode_form:
+            text = unicodedata.normalize(self.unicode_form, text)
+        if self.collapse_whitespace:
+            text = _WHITESPACE.sub(" ", text).strip()
+        key = self._key_with_operators(text) if self.operators else self._fold(text)
+        return NormalizedQuery(original=query, text=text, key=key)
+
+    def _fold(self, value: str) -> str:
+        return value.casefold() if self.casefold else value
+
+    def _key_with_operators(self, text: str) -> str:
+        terms: List[str] = []
+        operators: List[Tuple[str, str]] = []
+        for token in _TOKENS.findall(text):
+            if token in _BOOLEAN_OPERATORS:
+                terms.append(token)
+            elif token.lstrip("-").startswith('"'):
+                phrase = token.strip('"-')
+                if self.collapse_whitespace:
+                    phrase = _WHITESPACE.sub(" ", phrase).strip()
+                terms.append(("-" if token.startswith("-") else "") + f'"{self._fold(phrase)}"')
+            elif _OPERATOR.match(token):
+                name, _, value = token.partition(":")
+                name = name.lower()
+                value = value.lower() if name in _DOMAIN_OPERATORS else self._fold(value)
+                if name in _DOMAIN_OPERATORS and value.startswith("www."):
+                    value = value[4:]
+                operators.append((name, value))
+            else:
+                terms.append(self._fold(token))
+        return " ".join(terms + [f"{name}:{value}" for name, value in sorted(operators)])
+
+
+DEFAULT_NORMALIZER = QueryNormalizer()
+
+
+def dedupe_queries(
+    queries: Iterable[str],
+    normalizer: Optional[QueryNormalizer] = None
+) -> List[NormalizedQuery]:
+    """
+    Normalisasi daftar query dan buang duplikat berdasarkan key (urutan pertama dipertahankan).
+
+    Contoh:
+        >>> [q.text for q in dedupe_queries(["Python", " python ", "Rust"])]
+        ['Python', 'Rust']
+    """
+    normalizer = normalizer or DEFAULT_NORMALIZER
+    seen = set()
+    unique: List[NormalizedQuery] = []
+    for query in queries:
+        normalized = normalizer.normalize(query)
+        if normalized.key not in seen:
+            seen.add(normalized.key)
+            unique.append(normalized)
+    return unique
@@ -0,0 +1,290 @@
+"""
+Registry engine untuk Multi Search Engine Library
+
+Engine didaftarkan dengan nama beserta metadata kemampuannya (bahasa,
+negara, pagination, rate yang disarankan) dan baru di-import saat pertama
+kali diminta. Engine pihak ketiga ditemukan lewat entry point
+`searchengine.engines` (importlib.metadata), misalnya di pyproject.toml:
+
+    [project.entry-points."searchengine.engines"]
+    intranet = "acme_search.intranet:IntranetSearch"
+
+Metadata engine plugin dibaca dari atribut class `CAPABILITIES` (dict
+dengan key yang sama seperti field EngineInfo) saat class di-import.
+"""
+
+from collections.abc import MutableMapping
+from dataclasses import dataclass, fields, replace
+from importlib import import_module
+from threading import RLock
+from typing import Optional, List, Dict, Any, Iterator, Union
+
+from .engines import ENGINE_CLASSES
+from .exceptions import ConfigurationException
+
+
+ENTRY_POINT_GROUP = "searchengine.engines"
+
+BUILTIN = "builtin"
+ENTRY_POINT = "entry_point"
+RUNTIME = "runtime"
+
+
+@dataclass(frozen=True)
+class EngineInfo:
+    """
+    Metadata satu engine.
+
+    Attributes:
+        name: Nama engine (key registry)
+        target: Lokasi class "modul:Class"; modul relatif (diawali ".")
+                di-resolve terhadap package SearchEngine
+        supports_language: Parameter language diteruskan ke engine
+        supports_country: Parameter country diteruskan ke engine
+        supports_pagination: Parameter page didukung
+        requests_per_minute: Rate maksimum yang disarankan
+        requires_api_key: Butuh ScraperAPI key agar bisa dipakai
+        fan_out: Ikut dalam daftar default search_all_engines
+        source: "builtin", "entry_point" atau "runtime"
+    """
+    name: str
+    target: str
+    supports_language: bool = True
+    supports_country: bool = True
+    supports_pagination: bool = True
+    requests_per_minute: int = 10
+    requires_api_key: bool = False
+    fan_out: bool = True
+    source: str = RUNTIME
+
+    @property
+    def min_delay(self) -> float:
+        """Jeda antar request (detik) sesuai requests_per_minute"""
+        return 60.0 / self.requests_per_minute if self.requests_per_minute > 0 else 0.0
+
+    def matches(self, **capabilities: Any) -> bool:
+        """Cek apakah semua capability bernilai sama, mis. matches(supports_country=True)"""
+        return all(getattr(self, key) == value for key, value in capabilities.items())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+CAPABILITY_FIELDS = tuple(
+    f.name for f in fields(EngineInfo) if f.name not in ("name", "target", "source")
+)
+
+# Metadata engine bawaan, sesuai parameter yang dipakai _build_search_url
+_BUILTIN_CAPABILITIES: Dict[str, Dict[str, Any]] = {
+    "google": {"requests_per_minute": 5, "requires_api_key": True, "fan_out": False},
+    "bing": {"fan_out": False},
+    "duckduckgo": {},
+    "yahoo": {"supports_language": False, "supports_country": False},
+    "mojeek": {"supports_language": False, "supports_country": False},
+    "brave": {"supports_country": False},
+}
+
+
+def _resolve(target: str):
+    """Import class dari string "modul:Class" """
+    module, _, attribute = target.partition(":")
+    if not attribute:
+        raise ConfigurationException(f"Target engine '{target}' harus berformat 'modul:Class'")
+    package = __name__.rpartition(".")[0] if module.startswith(".") else None
+    value = import_module(module, package)
+    for part in attribute.split("."):
+        value = getattr(value, part)
+    return value
+
+
+def _entry_points(group: str) -> list:
+    from importlib import metadata
+
+    eps = metadata.entry_points()
+    if hasattr(eps, "select"):
+        return list(eps.select(group=group))
+    return list(eps.get(group, []))
+
+
+class EngineRegistry(MutableMapping):
+    """
+    Mapping nama engine -> class engine dengan lazy import dan metadata.
+
+    Engine bawaan terdaftar sejak awal; entry point baru dibaca saat daftar
+    engine pertama kali dibutuhkan (iterasi, len, atau nama yang belum
+    dikenal). Entry point dengan nama yang sudah terdaftar diabaikan.
+    `registry["nama"] = Class` setara dengan register("nama", Class).
+    """
+
+    def __init__(self, builtins: bool = True, entry_point_group: Optional[str] = ENTRY_POINT_GROUP):
+        """
+        Args:
+            builtins: Daftarkan engine bawaan
+            entry_point_group: Grup entry point plugin (None = tanpa plugin)
+        """
+        self.entry_point_group = entry_point_group
+        self._infos: Dict[str, EngineInfo] = {}
+        self._loaded: Dict[str, Any] = {}
+        self._discovered = entry_point_group is None
+        self._lock = RLock()
+
+        if builtins:
+            for name, (module, class_name) in ENGINE_CLASSES.items():
+                self._infos[name] = EngineInfo(
+                    name=name,
+                    target=f".engines{module}:{class_name}",
+                    source=BUILTIN,
+                    **_BUILTIN_CAPABILITIES.get(name, {})
+                )
+
+    def register(self, name: str, engine: Union[str, type], **capabilities: Any) -> EngineInfo:
+        """
+        Daftarkan (atau ganti) engine.
+
+        Args:
+            name: Nama engine
+            engine: Class engine, atau string "modul:Class" untuk lazy import
+            **capabilities: Field EngineInfo (supports_language, requests_per_minute, ...)
+
+        Returns:
+            EngineInfo yang terdaftar
+        """
+        unknown = set(capabilities) - set(CAPABILITY_FIELDS)
+        if unknown:
+            raise ConfigurationException(f"Capability tidak dikenal: {', '.join(sorted(unknown))}")
+
+        with self._lock:
+            if isinstance(engine, str):
+                info = EngineInfo(name=name, target=engine, **capabilities)
+                self._loaded.pop(name, None)
+            else:
+                declared = dict(getattr(engine, "CAPABILITIES", {}) or {})
+                declared.update(capabilities)
+                info = EngineInfo(
+                    name=name, target=f"{engine.__module__}:{engine.__qualname__}",
+                    **{k: v for k, v in declared.items() if k in CAPABILITY_FIELDS}
+                )
+                self._loaded[name] = engine
+            self._infos[name] = info
+        return info
+
+    def unregister(self, name: str):
+        with self._lock:
+            del self._infos[name]
+            self._loaded.pop(name, None)
+
+    def discover(self, force: bool = False) -> List[str]:
+        """
+        Baca entry point plugin (sekali, kecuali force=True).
+
+        Returns:
+            Nama engine yang baru didaftarkan
+        """
+        if self.entry_point_group is None:
+            return []
+        with self._lock:
+            if self._discovered and not force:
+                return []
+            self._discovered = True
+            added = []
+            for ep in _entry_points(self.entry_point_group):
+                if ep.name in self._infos:
+                    continue
+                self._infos[ep.name] = EngineInfo(name=ep.name, target=ep.value, source=ENTRY_POINT)
+                added.append(ep.name)
+            return added
+
+    def get(self, name: str, default: Any = None):
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def info(self, name: str) -> EngineInfo:
+        """
+        Metadata engine.
+
+        Untuk engine plugin, class di-import sekali agar CAPABILITIES-nya terbaca.
+        """
+        if name not in self:
+            raise KeyError(name)
+        if self._infos[name].source == ENTRY_POINT and name not in self._loaded:
+            self[name]
+        return self._infos[name]
+
+    def infos(self) -> List[EngineInfo]:
+        return [self.info(name) for name in self]
+
+    def names(self, **capabilities: Any) -> List[str]:
+        """
+        Nama engine, opsional difilter capability.
+
+        Contoh:
+            >>> registry.names(supports_country=True, requires_api_key=False)
+        """
+        if not capabilities:
+            return list(self)
+        return [name for name in self if self.info(name).matches(**capabilities)]
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._loaded
+
+    def __getitem__(self, name: str):
+        engine = self._loaded.get(name)
+        if engine is not None:
+            return engine
+
+        with self._lock:
+            if name not in self._infos:
+                self.discover()
+            info = self._infos[name]
+            if name not in self._loaded:
+                try:
+                    engine = _resolve(info.target)
+                except (ImportError, AttributeError) as e:
+                    raise ConfigurationException(
+                        f"Engine '{name}' gagal di-load dari '{info.target}': {e}"
+                    ) from e
+                if info.source == ENTRY_POINT:
+                    declared = getattr(engine, "CAPABILITIES", None) or {}
+                    self._infos[name] = replace(
+                        info, **{k: v for k, v in declared.items() if k in CAPABILITY_FIELDS}
+                    )
+                self._loaded[name] = engine
+            return self._loaded[name]
+
+    def __setitem__(self, name: str, engine):
+        self.register(name, engine)
+
+    def __delitem__(self, name: str):
+        self.unregister(name)
+
+    def __iter__(self) -> Iterator[str]:
+        self.discover()
+        return iter(list(self._infos))
+
+    def __len__(self) -> int:
+        self.discover()
+        return len(self._infos)
+
+    def __contains__(self, name: object) -> bool:
+        if name not in self._infos:
+            self.discover()
+        return name in self._infos
+
+    def __repr__(self) -> str:
+        return f"EngineRegistry({list(self._infos)})"
+
+
+# Registry global yang dipakai quick_search, search_all_engines dan get_available_engines
+registry = EngineRegistry()
+
+
+def register_engine(name: str, engine: Union[str, type], **capabilities: Any) -> EngineInfo:
+    """Daftarkan engine ke registry global (lihat EngineRegistry.register)"""
+    return registry.register(name, engine, **capabilities)
+
+
+def get_engine_info(name: str) -> EngineInfo:
+    """Metadata engine dari registry global"""
+    return registry.info(name)
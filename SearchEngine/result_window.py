@@ -0,0 +1,158 @@
+"""
+Cache hasil per posisi untuk Multi Search Engine Library
+
+ResultWindow menyimpan hasil ranked satu (engine, query, locale) berdasarkan
+posisi absolut beserta rentang posisi yang sudah pernah di-fetch. Request
+dengan window (page, num_results) yang sudah tercakup dilayani dengan
+slicing, dan partial hit hanya mem-fetch rentang yang belum ada.
+
+Window mempertahankan expiry dari fetch pertamanya (menulis hasil baru
+tidak memperpanjang TTL) dan dibatasi MAX_POSITIONS posisi.
+"""
+
+from typing import Optional, List, Dict, Any, Tuple
+import time
+
+
+def window_bounds(page: int, num_results: int) -> Tuple[int, int]:
+    """Posisi absolut pertama dan terakhir (inklusif) untuk satu request"""
+    start = (page - 1) * num_results + 1
+    return start, start + num_results - 1
+
+
+def plan_fetch(first: int, last: int, max_size: int) -> Tuple[int, int]:
+    """
+    Request (page, num_results) terkecil yang mencakup posisi first..last.
+
+    Engine hanya mengenal offset kelipatan num_results, jadi dicari ukuran
+    halaman n >= jumlah posisi yang hilang sehingga satu halaman mencakup
+    seluruh rentang; max_size (window request asal) selalu memenuhi.
+    """
+    for size in range(last - first + 1, max_size + 1):
+        page = (first - 1) // size + 1
+        if page * size >= last:
+            return page, size
+    return (first - 1) // max_size + 1, max_size
+
+
+class ResultWindow:
+    """
+    Hasil ranked per posisi dengan daftar rentang yang sudah di-fetch.
+
+    Rentang dicatat terpisah dari hasil: halaman yang mengembalikan lebih
+    sedikit hasil dari yang diminta tetap dianggap mencakup seluruh
+    rentangnya, sehingga tidak di-fetch ulang.
+    """
+
+    # Jumlah posisi maksimum yang dicakup satu window
+    MAX_POSITIONS = 500
+
+    def __init__(
+        self,
+        ranges: Optional[List[List[int]]] = None,
+        results: Optional[Dict[int, Dict[str, Any]]] = None,
+        expires_at: Optional[float] = None
+    ):
+        self.ranges: List[List[int]] = [list(r) for r in ranges or []]
+        self.results: Dict[int, Dict[str, Any]] = dict(results or {})
+        self.expires_at = expires_at
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> "ResultWindow":
+        """Buat dari nilai cache (payload kosong/tidak valid -> window kosong)"""
+        if not isinstance(payload, dict):
+            return cls()
+        results = {item["position"]: item for item in payload.get("results", [])}
+        return cls(payload.get("ranges", []), results, payload.get("expires_at"))
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            "ranges": self.ranges,
+            "results": [self.results[position] for position in sorted(self.results)],
+            "expires_at": self.expires_at,
+        }
+
+    def remaining_ttl(self, default_ttl: float) -> Optional[float]:
+        """
+        TTL untuk menulis window ke cache.
+
+        Window baru (expires_at None) mendapat default_ttl; window lama
+        mempertahankan sisa TTL-nya. expires_at 0 berarti tanpa expiry.
+
+        Returns:
+            Sisa TTL (0 = tanpa expiry), atau None jika window sudah expired
+        """
+        now = time.time()
+        if self.expires_at is None:
+            self.expires_at = now + default_ttl if default_ttl > 0 else 0
+        if not self.expires_at:
+            return 0
+        remaining = self.expires_at - now
+        return remaining if remaining > 0 else None
+
+    def missing(self, first: int, last: int) -> Optional[Tuple[int, int]]:
+        """Rentang terkecil yang memuat semua posisi first..last yang belum di-fetch (None = tercakup)"""
+        gaps = []
+        cursor = first
+        for start, end in self.ranges:
+            if end < cursor:
+                continue
+            if start > last:
+                break
+            if start > cursor:
+                gaps.append((cursor, start - 1))
+            cursor = max(cursor, end + 1)
+            if cursor > last:
+                break
+        if cursor <= last:
+            gaps.append((cursor, last))
+        if not gaps:
+            return None
+        return gaps[0][0], gaps[-1][1]
+
+    def overlaps(self, first: int, last: int) -> bool:
+        """Cek apakah sebagian posisi first..last sudah di-fetch"""
+        return any(start <= last and end >= first for start, end in self.ranges)
+
+    def add(self, first: int, requested: int, results: List[Dict[str, Any]]):
+        """
+        Catat hasil satu fetch yang dimulai di posisi first.
+
+        Args:
+            first: Posisi absolut hasil pertama
+            requested: num_results yang diminta
+            results: Dict hasil (format SearchResult.to_dict) dengan position absolut
+        """
+        for item in results:
+            self.results[item["position"]] = item
+        last = first + max(requested, len(results)) - 1
+        merged: List[List[int]] = []
+        for start, end in sorted(self.ranges + [[first, last]]):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        self.ranges = merged
+
+    def trim(self, last: int, max_positions: Optional[int] = None):
+        """
+        Batasi window ke max_positions posisi yang berakhir di posisi last.
+
+        Posisi sebelum fetch terakhir dipertahankan (pola paging maju),
+        posisi di luar batas dibuang beserta rentangnya.
+        """
+        max_positions = max_positions or self.MAX_POSITIONS
+        if sum(end - start + 1 for start, end in self.ranges) <= max_positions:
+            return
+        low = max(1, last - max_positions + 1)
+        high = low + max_positions - 1
+        self.ranges = [
+            [max(start, low), min(end, high)]
+            for start, end in self.ranges
+            if end >= low and start <= high
+        ]
+        self.results = {p: item for p, item in self.results.items() if low <= p <= high}
+
+    def slice(self, first: int, last: int) -> List[Dict[str, Any]]:
+        """Hasil dengan posisi first..last, urut posisi"""
+        return [self.results[p] for p in range(first, last + 1) if p in self.results]
@@ -0,0 +1,459 @@
+"""
+Representasi hasil pencarian yang hemat memori
+
+CompactResult menyimpan field yang sama dengan SearchResult, tetapi memakai
+__slots__ (tanpa __dict__ per instance), meng-intern nama engine dan domain,
+dan baru membuat dict `extra` saat benar-benar dipakai.
+
+ResultSet menyimpan hasil dari banyak pencarian secara kolumnar, dengan
+kolom lowercase dan domain yang sudah dihitung, untuk filter dan export
+dalam jumlah besar.
+
+ResultView membungkus dict payload cache secara read-only, sehingga cache
+hit tidak perlu membangun ulang objek hasil.
+"""
+
+from array import array
+from collections.abc import Sequence
+from itertools import compress, repeat
+from operator import contains
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Union, Pattern
+from urllib.parse import urlsplit
+import csv
+import json
+import re
+import sys
+
+
+_SIMPLE_HOST = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*://([^/?#@\[\]:]*)(?::\d*)?(?:[/?#]|$)')
+
+
+def intern_domain(url: str) -> str:
+    """Ambil domain (hostname, lowercase) dari URL sebagai string yang di-intern"""
+    match = _SIMPLE_HOST.match(url)
+    if match:
+        return sys.intern(match.group(1).lower())
+    try:
+        hostname = urlsplit(url).hostname or ""
+    except ValueError:
+        hostname = ""
+    return sys.intern(hostname)
+
+
+class CompactResult:
+    """
+    Satu hasil pencarian dengan footprint memori minimal.
+
+    Kompatibel dengan SearchResult untuk atribut, to_dict() dan visit().
+
+    Contoh:
+        >>> compact = CompactResult.from_result(results[0])
+        >>> compact.domain
+        'docs.python.org'
+    """
+
+    __slots__ = ("title", "url", "description", "position", "engine", "domain", "_extra")
+
+    def __init__(
+        self,
+        title: str,
+        url: str,
+        description: str,
+        position: int = 0,
+        engine: str = "",
+        extra: Optional[Dict[str, Any]] = None
+    ):
+        self.title = title
+        self.url = url
+        self.description = description
+        self.position = position
+        self.engine = sys.intern(engine)
+        self.domain = intern_domain(url)
+        self._extra = extra or None
+
+    @property
+    def extra(self) -> Dict[str, Any]:
+        """Dict extra, dibuat saat pertama kali diakses"""
+        if self._extra is None:
+            self._extra = {}
+        return self._extra
+
+    @extra.setter
+    def extra(self, value: Dict[str, Any]):
+        self._extra = value or None
+
+    @classmethod
+    def from_result(cls, result) -> "CompactResult":
+        """Buat CompactResult dari SearchResult"""
+        return cls(
+            title=result.title,
+            url=result.url,
+            description=result.description,
+            position=result.position,
+            engine=result.engine,
+            extra=result.extra
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompactResult":
+        """Buat CompactResult dari dict hasil to_dict()"""
+        return cls(
+            title=data["title"],
+            url=data["url"],
+            description=data["description"],
+            position=data.get("position", 0),
+            engine=data.get("engine", ""),
+            extra=data.get("extra")
+        )
+
+    def to_result(self):
+        """Konversi kembali ke SearchResult"""
+        from .base import SearchResult
+        return SearchResult(
+            title=self.title,
+            url=self.url,
+            description=self.description,
+            position=self.position,
+            engine=self.engine,
+            extra=dict(self._extra) if self._extra else {}
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Konversi ke dictionary (format sama dengan SearchResult.to_dict)"""
+        return {
+            "title": self.title,
+            "url": self.url,
+            "description": self.description,
+            "position": self.position,
+            "engine": self.engine,
+            "extra": self._extra if self._extra is not None else {}
+        }
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Konversi ke JSON string"""
+        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+
+    def visit(self, timeout: int = 30, user_agent: Optional[str] = None):
+        """Kunjungi URL hasil, lihat SearchResult.visit()"""
+        return self.to_result().visit(timeout=timeout, user_agent=user_agent)
+
+    def __eq__(self, other) -> bool:
+        if not hasattr(other, "to_dict"):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+        self.engine = sys.intern(self.engine)
+        self.domain = sys.intern(self.domain)
+
+    def __repr__(self) -> str:
+        return f"CompactResult(title='{self.title[:50]}...', url='{self.url}')"
+
+
+class ResultView:
+    """
+    View read-only di atas dict hasil yang tersimpan di cache.
+
+    Dipakai untuk cache hit tanpa membangun ulang SearchResult; atribut
+    dibaca langsung dari dict payload cache, dan to_dict() mengembalikan
+    dict itu sendiri (jangan diubah).
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Dict[str, Any]):
+        object.__setattr__(self, "_data", data)
+
+    title = property(lambda self: self._data["title"])
+    url = property(lambda self: self._data["url"])
+    description = property(lambda self: self._data["description"])
+    position = property(lambda self: self._data.get("position", 0))
+    engine = property(lambda self: self._data.get("engine", ""))
+    extra = property(lambda self: self._data.get("extra") or {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ResultView bersifat read-only, gunakan to_result() untuk salinan yang bisa diubah")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Payload cache asli (tanpa salinan)"""
+        return self._data
+
+    def to_result(self):
+        """Buat SearchResult dari payload"""
+        from .base import SearchResult
+        return SearchResult(**self._data)
+
+    def visit(self, timeout: int = 30, user_agent: Optional[str] = None):
+        """Kunjungi URL hasil, lihat SearchResult.visit()"""
+        return self.to_result().visit(timeout=timeout, user_agent=user_agent)
+
+    def __eq__(self, other) -> bool:
+        if not hasattr(other, "to_dict"):
+            return NotImplemented
+        return self._data == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ResultView(title='{self.title[:50]}...', url='{self.url}')"
+
+
+class ResultListView(Sequence):
+    """List read-only berisi ResultView yang dibuat saat item diakses"""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: List[Dict[str, Any]]):
+        self._items = items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ResultListView(self._items[index])
+        return ResultView(self._items[index])
+
+    def to_dict_list(self) -> List[Dict[str, Any]]:
+        """Payload cache asli"""
+        return self._items
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Sequence):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ResultListView({len(self)} hasil)"
+
+
+def compact_results(results: Iterable[Any]) -> List[CompactResult]:
+    """Konversi list SearchResult (atau dict) ke list CompactResult"""
+    return [
+        r if isinstance(r, CompactResult)
+        else CompactResult.from_dict(r) if isinstance(r, dict)
+        else CompactResult.from_result(r)
+        for r in results
+    ]
+
+
+class ResultSet:
+    """
+    Kumpulan hasil pencarian dengan penyimpanan kolumnar.
+
+    Setiap field disimpan di list/array terpisah; nama engine dan domain
+    di-intern, dan kolom lowercase untuk title, description dan url dihitung
+    sekali saat hasil ditambahkan. Filter berjalan di atas kolom dan
+    mengembalikan ResultSet baru.
+
+    Contoh:
+        >>> rs = ResultSet()
+        >>> rs.extend(DuckDuckGoSearch().search("python"))
+        >>> rs.extend(BraveSearch().search("python"))
+        >>> python_docs = rs.filter_keyword("tutorial").filter_domain("python.org")
+        >>> python_docs.to_csv("hasil.csv")
+    """
+
+    COLUMNS = ("title", "url", "description", "position", "engine", "domain")
+
+    def __init__(self, results: Optional[Iterable[Any]] = None):
+        self.titles: List[str] = []
+        self.urls: List[str] = []
+        self.descriptions: List[str] = []
+        self.positions = array("q")
+        self.engines: List[str] = []
+        self.domains: List[str] = []
+        self.extras: List[Optional[Dict[str, Any]]] = []
+        self._lower: Dict[str, List[str]] = {"title": [], "description": [], "url": []}
+        if results is not None:
+            self.extend(results)
+
+    @classmethod
+    def from_searches(cls, *searches: Iterable[Any]) -> "ResultSet":
+        """Gabungkan hasil dari beberapa pencarian"""
+        result_set = cls()
+        for results in searches:
+            result_set.extend(results)
+        return result_set
+
+    def append(self, result: Any):
+        """Tambahkan satu hasil (SearchResult, CompactResult atau dict)"""
+        self.extend([result])
+
+    def extend(self, results: Iterable[Any]):
+        """Tambahkan banyak hasil (SearchResult, CompactResult atau dict)"""
+        for r in results:
+            if isinstance(r, dict):
+                title, url, description = r["title"], r["url"], r["description"]
+                position, engine, extra = r.get("position", 0), r.get("engine", ""), r.get("extra")
+            else:
+                title, url, description = r.title, r.url, r.description
+                position, engine = r.position, r.engine
+                extra = r._extra if isinstance(r, CompactResult) else r.extra
+            self.titles.append(title)
+            self.urls.append(url)
+            self.descriptions.append(description)
+            self.positions.append(position)
+            self.engines.append(sys.intern(engine))
+            self.domains.append(getattr(r, "domain", None) or intern_domain(url))
+            self.extras.append(extra or None)
+        n = len(self.titles)
+        for name, column in (("title", self.titles), ("description", self.descriptions), ("url", self.urls)):
+            lower = self._lower[name]
+            lower.extend(map(str.lower, column[len(lower):n]))
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def __iter__(self) -> Iterator[CompactResult]:
+        for i in range(len(self)):
+            yield self._row(i)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[CompactResult, "ResultSet"]:
+        if isinstance(index, slice):
+            return self.take(range(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ResultSet index out of range")
+        return self._row(index)
+
+    def _row(self, i: int) -> CompactResult:
+        return CompactResult(
+            title=self.titles[i],
+            url=self.urls[i],
+            description=self.descriptions[i],
+            position=self.positions[i],
+            engine=self.engines[i],
+            extra=self.extras[i]
+        )
+
+    def take(self, indices: Iterable[int]) -> "ResultSet":
+        """Buat ResultSet baru dari baris-baris dengan index tertentu"""
+        indices = list(indices)
+        subset = ResultSet()
+        for name in ("titles", "urls", "descriptions", "engines", "domains", "extras"):
+            column = getattr(self, name)
+            setattr(subset, name, [column[i] for i in indices])
+        subset.positions = array("q", [self.positions[i] for i in indices])
+        for name, column in self._lower.items():
+            subset._lower[name] = [column[i] for i in indices]
+        return subset
+
+    def _select(self, mask: Iterable[bool]) -> "ResultSet":
+        return self.take(compress(range(len(self)), mask))
+
+    def filter_keyword(self, keyword: str, fields: Iterable[str] = ("title", "description")) -> "ResultSet":
+        """Filter hasil yang mengandung keyword (case-insensitive) di salah satu field"""
+        keyword_lower = keyword.lower()
+        masks = [map(contains, self._lower[name], repeat(keyword_lower)) for name in fields]
+        return self._select(map(any, zip(*masks)))
+
+    def filter_domain(self, domain: str, include_subdomains: bool = True) -> "ResultSet":
+        """Filter hasil berdasarkan domain (hostname), termasuk subdomain secara default"""
+        domain_lower = domain.lower()
+        suffix = "." + domain_lower
+        matching = {
+            d for d in set(self.domains)
+            if d == domain_lower or (include_subdomains and d.endswith(suffix))
+        }
+        return self._select(map(matching.__contains__, self.domains))
+
+    def filter_engine(self, *engines: str) -> "ResultSet":
+        """Filter hasil dari engine tertentu"""
+        wanted = set(engines)
+        return self._select(map(wanted.__contains__, self.engines))
+
+    def filter_regex(
+        self,
+        pattern: Union[str, Pattern],
+        fields: Iterable[str] = ("title", "description", "url"),
+        flags: int = re.IGNORECASE
+    ) -> "ResultSet":
+        """Filter hasil yang cocok dengan regex di salah satu field"""
+        compiled = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+        columns = {"title": self.titles, "description": self.descriptions, "url": self.urls}
+        masks = [map(bool, map(compiled.search, columns[name])) for name in fields]
+        return self._select(map(any, zip(*masks)))
+
+    def limit(self, count: int) -> "ResultSet":
+        """Batasi jumlah hasil"""
+        return self[:count]
+
+    def to_columns(self) -> Dict[str, List[Any]]:
+        """Export sebagai dict nama kolom -> list nilai"""
+        return {
+            "title": list(self.titles),
+            "url": list(self.urls),
+            "description": list(self.descriptions),
+            "position": self.positions.tolist(),
+            "engine": list(self.engines),
+            "domain": list(self.domains),
+            "extra": [json.dumps(e, ensure_ascii=False) if e else "" for e in self.extras]
+        }
+
+    def to_dict_list(self) -> List[Dict[str, Any]]:
+        """Konversi semua hasil ke list of dict (format SearchResult.to_dict)"""
+        return [r.to_dict() for r in self]
+
+    def to_csv(self, path_or_file: Union[str, Any]) -> int:
+        """
+        Export ke CSV (kolom extra di-encode sebagai JSON).
+
+        Args:
+            path_or_file: Path file atau file-like object teks
+
+        Returns:
+            int: Jumlah baris yang ditulis
+        """
+        columns = self.to_columns()
+        header = list(columns.keys())
+
+        def write(f):
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(zip(*columns.values()))
+
+        if isinstance(path_or_file, str):
+            with open(path_or_file, "w", encoding="utf-8", newline="") as f:
+                write(f)
+        else:
+            write(path_or_file)
+        return len(self)
+
+    def to_arrow(self):
+        """Export ke pyarrow.Table (membutuhkan pyarrow)"""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("pyarrow diperlukan untuk export Arrow/Parquet: pip install pyarrow")
+
+        columns = self.to_columns()
+        return pa.table({
+            "title": pa.array(columns["title"], type=pa.string()),
+            "url": pa.array(columns["url"], type=pa.string()),
+            "description": pa.array(columns["description"], type=pa.string()),
+            "position": pa.array(columns["position"], type=pa.int64()),
+            "engine": pa.array(columns["engine"], type=pa.string()).dictionary_encode(),
+            "domain": pa.array(columns["domain"], type=pa.string()).dictionary_encode(),
+            "extra": pa.array(columns["extra"], type=pa.string()),
+        })
+
+    def to_parquet(self, path: str, **kwargs) -> int:
+        """Export ke file Parquet (membutuhkan pyarrow)"""
+        table = self.to_arrow()
+        import pyarrow.parquet as pq
+        pq.write_table(table, path, **kwargs)
+        return len(self)
+
+    def __repr__(self) -> str:
+        return f"ResultSet({len(self)} hasil, {len(set(self.engines))} engine)"
@@ -0,0 +1,239 @@
+"""
+Retry policy untuk Multi Search Engine Library
+
+RetryPolicy mengulang request yang gagal karena error sementara
+(NetworkException, RateLimitException) dengan backoff eksponensial
+"decorrelated jitter", dibatasi oleh RetryBudget agar retry tidak
+menambah beban lebih dari rasio tertentu terhadap request normal.
+BlockedException (captcha, 403) tidak di-retry karena retry hanya
+memperparah blokir.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Optional, Callable, Dict, Any, Tuple, Type, TypeVar
+import random
+import time
+
+from .exceptions import NetworkException, RateLimitException
+
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+class RetryBudget:
+    """
+    Budget retry berbasis sliding window.
+
+    Retry diizinkan selama jumlah retry di window kurang dari
+    max(min_retries, ratio * jumlah request di window). Satu budget
+    bisa dibagi ke beberapa engine.
+    """
+
+    def __init__(self, ratio: float = 0.1, min_retries: int = 3, window: float = 60.0):
+        """
+        Args:
+            ratio: Rasio maksimum retry terhadap request (0.1 = 10% beban tambahan)
+            min_retries: Retry minimum yang selalu diizinkan per window
+            window: Panjang window dalam detik
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests: deque = deque()
+        self._retries: deque = deque()
+        self._lock = Lock()
+
+    def _trim(self, now: float):
+        cutoff = now - self.window
+        while self._requests and self._requests[0] < cutoff:
+            self._requests.popleft()
+        while self._retries and self._retries[0] < cutoff:
+            self._retries.popleft()
+
+    def record_request(self):
+        """Catat satu request awal (bukan retry)"""
+        with self._lock:
+            now = time.time()
+            self._trim(now)
+            self._requests.append(now)
+
+    def try_acquire(self) -> bool:
+        """Ambil satu jatah retry; False jika budget habis"""
+        with self._lock:
+            now = time.time()
+            self._trim(now)
+            if len(self._retries) >= max(self.min_retries, self.ratio * len(self._requests)):
+                return False
+            self._retries.append(now)
+            return True
+
+    @property
+    def available(self) -> int:
+        """Sisa jatah retry di window saat ini"""
+        with self._lock:
+            self._trim(time.time())
+            allowed = max(self.min_retries, int(self.ratio * len(self._requests)))
+            return max(0, allowed - len(self._retries))
+
+
+@dataclass
+class RetryStats:
+    """Statistik retry"""
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    recovered: int = 0
+    gave_up: int = 0
+    budget_exhausted: int = 0
+    backoff_seconds: float = 0.0
+    by_error: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Konversi ke dictionary"""
+        return {
+            "calls": self.calls,
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "recovered": self.recovered,
+            "gave_up": self.gave_up,
+            "budget_exhausted": self.budget_exhausted,
+            "backoff_seconds": self.backoff_seconds,
+            "by_error": dict(self.by_error)
+        }
+
+
+class RetryPolicy:
+    """
+    Policy retry dengan decorrelated jitter dan retry budget.
+
+    Contoh:
+        >>> policy = RetryPolicy(max_attempts=3, base_delay=1.0)
+        >>> bing = BingSearch(retry=policy, rate_limiter=RateLimiter())
+        >>> bing.search("python")
+        >>> print(policy.stats.to_dict())
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        budget: Optional[RetryBudget] = None,
+        retry_on: Tuple[Type[BaseException], ...] = (NetworkException, RateLimitException),
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Args:
+            max_attempts: Jumlah percobaan maksimum (termasuk percobaan pertama)
+            base_delay: Delay minimum antar percobaan (detik)
+            max_delay: Delay maksimum antar percobaan (detik)
+            budget: RetryBudget (default: budget baru 10%)
+            retry_on: Tipe exception yang boleh di-retry
+            sleep: Fungsi sleep (bisa diganti untuk testing)
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget if budget is not None else RetryBudget()
+        self.retry_on = retry_on
+        self.sleep = sleep
+        self.stats = RetryStats()
+        self._lock = Lock()
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """
+        Klasifikasi error: RateLimitException dan NetworkException sementara
+        (timeout, koneksi, 408/429/5xx) di-retry; BlockedException dan HTTP 4xx
+        lainnya tidak.
+        """
+        if not isinstance(error, self.retry_on):
+            return False
+        status_code = getattr(error, "status_code", None)
+        if isinstance(error, NetworkException) and status_code is not None:
+            return status_code in RETRYABLE_STATUS_CODES
+        return True
+
+    def next_delay(self, previous: float) -> float:
+        """Delay berikutnya (decorrelated jitter): uniform(base, previous * 3), dibatasi max_delay"""
+        return min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, previous * 3)))
+
+    def _record(self, **increments):
+        with self._lock:
+            for name, value in increments.items():
+                setattr(self.stats, name, getattr(self.stats, name) + value)
+
+    def call(
+        self,
+        func: Callable[[], T],
+        on_retry: Optional[Callable[[int, BaseException, float], None]] = None,
+        on_give_up: Optional[Callable[[BaseException, str], None]] = None
+    ) -> T:
+        """
+        Jalankan func dengan retry.
+
+        Args:
+            func: Fungsi tanpa argumen yang dijalankan
+            on_retry: Callback (attempt, error, delay) sebelum menunggu retry
+            on_give_up: Callback (error, alasan) saat berhenti retry
+                        ('not_retryable', 'max_attempts' atau 'budget')
+
+        Returns:
+            Hasil func
+
+        Raises:
+            Exception terakhir dari func jika semua percobaan gagal
+        """
+        self.budget.record_request()
+        self._record(calls=1)
+        delay = self.base_delay
+        attempt = 1
+
+        while True:
+            self._record(attempts=1)
+            try:
+                result = func()
+            except Exception as e:
+                reason = None
+                if not self.is_retryable(e):
+                    reason = "not_retryable"
+                elif attempt >= self.max_attempts:
+                    reason = "max_attempts"
+                elif not self.budget.try_acquire():
+                    reason = "budget"
+                    self._record(budget_exhausted=1)
+
+                if reason is not None:
+                    if reason != "not_retryable":
+                        self._record(gave_up=1)
+                    if on_give_up:
+                        on_give_up(e, reason)
+                    raise
+
+                delay = self.next_delay(delay)
+                retry_after = getattr(e, "retry_after", None)
+                if retry_after:
+                    delay = min(self.max_delay, max(delay, retry_after))
+
+                with self._lock:
+                    self.stats.retries += 1
+                    self.stats.backoff_seconds += delay
+                    name = type(e).__name__
+                    self.stats.by_error[name] = self.stats.by_error.get(name, 0) + 1
+                if on_retry:
+                    on_retry(attempt, e, delay)
+                self.sleep(delay)
+                attempt += 1
+                continue
+
+            if attempt > 1:
+                self._record(recovered=1)
+            return result
+
+    def reset_stats(self):
+        """Reset statistik retry"""
+        with self._lock:
+            self.stats = RetryStats()
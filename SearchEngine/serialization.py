@@ -0,0 +1,166 @@
+"""
+Serialisasi streaming untuk Multi Search Engine Library
+
+Menulis hasil pencarian ke file-like object satu per satu (NDJSON atau
+JSON array), tanpa membangun seluruh list of dict dan string JSON di memori.
+Backend JSON bisa diganti; orjson dipakai otomatis jika terpasang
+(dideteksi saat serialisasi pertama, bukan saat import).
+"""
+
+from typing import Optional, Dict, Any, Iterable, Callable, List
+import io
+import json
+
+from .exceptions import ConfigurationException
+
+
+def _stdlib_dumps(obj: Any, indent: Optional[int] = None) -> str:
+    return json.dumps(obj, ensure_ascii=False, indent=indent)
+
+
+def _make_orjson_dumps() -> Optional[Callable[..., str]]:
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    def dumps(obj: Any, indent: Optional[int] = None) -> str:
+        if indent not in (None, 2):
+            return _stdlib_dumps(obj, indent)
+        try:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            return orjson.dumps(obj, option=option).decode("utf-8")
+        except TypeError:
+            return _stdlib_dumps(obj, indent)
+
+    return dumps
+
+
+_BACKENDS: Dict[str, Callable[..., str]] = {"json": _stdlib_dumps}
+_optional_loaded = False
+_active_backend: Optional[str] = None
+
+
+def _load_optional_backends():
+    """Daftarkan orjson (sekali) jika terpasang"""
+    global _optional_loaded
+    if not _optional_loaded:
+        _optional_loaded = True
+        orjson_dumps = _make_orjson_dumps()
+        if orjson_dumps is not None:
+            _BACKENDS.setdefault("orjson", orjson_dumps)
+
+
+def _active_dumps() -> Callable[..., str]:
+    """Fungsi dumps backend aktif (default: orjson jika ada, selain itu json)"""
+    global _active_backend
+    if _active_backend is None:
+        _load_optional_backends()
+        _active_backend = "orjson" if "orjson" in _BACKENDS else "json"
+    return _BACKENDS[_active_backend]
+
+
+def register_json_backend(name: str, dumps: Callable[..., str]):
+    """
+    Daftarkan backend JSON baru.
+
+    Args:
+        name: Nama backend
+        dumps: Fungsi dumps(obj, indent=None) -> str
+    """
+    _BACKENDS[name] = dumps
+
+
+def set_json_backend(name: str):
+    """Pilih backend JSON aktif ('json', 'orjson', atau yang didaftarkan)"""
+    global _active_backend
+    _load_optional_backends()
+    if name not in _BACKENDS:
+        available = ", ".join(_BACKENDS.keys())
+        raise ConfigurationException(f"JSON backend '{name}' tidak tersedia. Pilihan: {available}")
+    _active_backend = name
+
+
+def get_json_backend() -> str:
+    """Nama backend JSON yang sedang aktif"""
+    _active_dumps()
+    return _active_backend
+
+
+def available_json_backends() -> List[str]:
+    """Daftar backend JSON yang tersedia"""
+    _load_optional_backends()
+    return list(_BACKENDS.keys())
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """Serialisasi obj ke JSON string dengan backend aktif"""
+    return _active_dumps()(obj, indent)
+
+
+def _as_dict(result: Any) -> Dict[str, Any]:
+    return result if isinstance(result, dict) else result.to_dict()
+
+
+def _writer(fp) -> Callable[[str], Any]:
+    """Fungsi write yang menerima str untuk file teks maupun biner"""
+    if isinstance(fp, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(fp, "mode", ""):
+        return lambda text: fp.write(text.encode("utf-8"))
+    return fp.write
+
+
+def write_ndjson(results: Iterable[Any], fp) -> int:
+    """
+    Tulis hasil sebagai NDJSON (satu objek JSON per baris) secara bertahap.
+
+    Args:
+        results: Iterable SearchResult, CompactResult, ResultView atau dict
+        fp: File-like object (teks atau biner)
+
+    Returns:
+        int: Jumlah hasil yang ditulis
+
+    Contoh:
+        >>> with open("hasil.ndjson", "w", encoding="utf-8") as f:
+        ...     write_ndjson(results, f)
+    """
+    write = _writer(fp)
+    backend = _active_dumps()
+    count = 0
+    for result in results:
+        write(backend(_as_dict(result)) + "\n")
+        count += 1
+    return count
+
+
+def write_json_array(results: Iterable[Any], fp, indent: Optional[int] = None) -> int:
+    """
+    Tulis hasil sebagai JSON array secara bertahap.
+
+    Dengan backend 'json', output identik dengan json.dumps(list, indent=indent).
+
+    Args:
+        results: Iterable SearchResult, CompactResult, ResultView atau dict
+        fp: File-like object (teks atau biner)
+        indent: Indentasi (None = compact)
+
+    Returns:
+        int: Jumlah hasil yang ditulis
+    """
+    write = _writer(fp)
+    backend = _active_dumps()
+    if indent is None:
+        opening, separator, closing, pad = "[", ", ", "]", ""
+    else:
+        opening, separator, closing, pad = "[\n", ",\n", "\n]", " " * indent
+
+    count = 0
+    for result in results:
+        text = backend(_as_dict(result), indent)
+        if pad:
+            text = pad + text.replace("\n", "\n" + pad)
+        write((opening if count == 0 else separator) + text)
+        count += 1
+
+    write(closing if count else "[]")
+    return count
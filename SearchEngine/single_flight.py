@@ -0,0 +1,79 @@
+"""
+Penggabungan request identik (single-flight) untuk Multi Search Engine Library
+
+Jika beberapa thread memanggil SingleFlight.do dengan key yang sama selagi
+panggilan pertama masih berjalan, hanya panggilan pertama yang dieksekusi;
+thread lain menunggu dan menerima hasil (atau exception) yang sama.
+SearchEngine memakai key dari query ter-normalisasi (lihat query.py).
+"""
+
+from threading import Event, Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    __slots__ = ("event", "value", "error", "waiters")
+
+    def __init__(self):
+        self.event = Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalescer untuk panggilan yang sedang berjalan.
+
+    Contoh:
+        >>> flight = SingleFlight()
+        >>> value, shared = flight.do(("bing", "python"), lambda: fetch())
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Jalankan func sekali untuk semua pemanggil dengan key yang sama.
+
+        Returns:
+            Tuple (hasil, shared); shared True jika hasil berasal dari panggilan thread lain
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+
+        try:
+            call.value = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.value, False
+
+    def in_flight(self) -> int:
+        """Jumlah key yang sedang dieksekusi"""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        return {"executed": self.executed, "coalesced": self.coalesced, "in_flight": self.in_flight()}
@@ -0,0 +1,336 @@
+"""
+Snapshot cache untuk Multi Search Engine Library
+
+MemoryCache hilang saat restart, dan membaca FileCache berarti satu open +
+decode per key. Snapshot menyimpan semua entry yang masih berlaku dalam
+satu file ringkas:
+
+    header: b"SESS" | versi (1 byte) | panjang nama codec (1 byte) | jumlah entry (uint64)
+            | nama codec (ASCII)
+    entry:  expires_at (double, 0 = tanpa expiry) | panjang key (uint32)
+            | panjang nilai (uint32) | key (UTF-8) | nilai (bytes codec)
+
+- dump_snapshot: tulis snapshot (atomik, lewat file sementara + os.replace)
+- load_snapshot: muat ke cache dengan satu read sekuensial; entry expired
+  dilewati tanpa decode key maupun nilai, dan MemoryCache dengan codec yang
+  sama menerima bytes nilai apa adanya
+- SnapshotCache: cache read-only di atas mmap; beberapa proses yang
+  membuka file yang sama berbagi page cache, dan nilai di-decode saat get
+- PeriodicSnapshot: dump berkala di thread latar dan saat interpreter keluar
+
+Contoh:
+    >>> cache = MemoryCache(codec=BinaryResultCodec())
+    >>> load_snapshot("cache.snap", cache)          # saat startup
+    >>> PeriodicSnapshot(cache, "cache.snap", interval=300).start()
+"""
+
+from threading import Event, Thread, Lock
+from typing import Optional, Any, Dict, Iterator, Tuple
+import os
+import struct
+import time
+
+from .cache import CacheInterface, MemoryCache
+from .cache_codecs import CacheCodec, BinaryResultCodec
+from .exceptions import CacheException
+
+
+MAGIC = b"SESS"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sBBQ")
+_ENTRY = struct.Struct("<dII")
+
+
+def _default_codec(codec: Optional[CacheCodec]) -> CacheCodec:
+    return codec if codec is not None else BinaryResultCodec()
+
+
+def _same_codec(cache: Any, codec: CacheCodec) -> bool:
+    """Cek apakah cache adalah MemoryCache yang menyimpan bytes dengan codec yang sama"""
+    cache_codec = getattr(cache, "codec", None)
+    return isinstance(cache, MemoryCache) and cache_codec is not None and cache_codec.name == codec.name
+
+
+def _read_header(data, codec: CacheCodec) -> Tuple[int, int]:
+    """Validasi header; return (jumlah entry, offset entry pertama)"""
+    try:
+        magic, version, name_len, count = _HEADER.unpack_from(data, 0)
+    except struct.error:
+        raise CacheException("Snapshot cache terpotong")
+    if magic != MAGIC or version != VERSION:
+        raise CacheException("Format snapshot cache tidak dikenal")
+    offset = _HEADER.size
+    codec_name = bytes(data[offset:offset + name_len]).decode("ascii")
+    if codec_name != codec.name:
+        raise CacheException(f"Snapshot ditulis dengan codec '{codec_name}'")
+    return count, offset + name_len
+
+
+def _iter_entries(data, codec: CacheCodec, now: float) -> Iterator[Tuple[str, Optional[float], int, int]]:
+    """
+    Iterasi entry yang masih berlaku.
+
+    Yields:
+        Tuple (key, expires_at, offset nilai, panjang nilai); entry expired
+        dilewati tanpa decode
+    """
+    count, offset = _read_header(data, codec)
+    size = len(data)
+    for _ in range(count):
+        if offset + _ENTRY.size > size:
+            raise CacheException("Snapshot cache terpotong")
+        expires_at, key_len, value_len = _ENTRY.unpack_from(data, offset)
+        offset += _ENTRY.size
+        end = offset + key_len + value_len
+        if end > size:
+            raise CacheException("Snapshot cache terpotong")
+        if not expires_at or expires_at >= now:
+            key = bytes(data[offset:offset + key_len]).decode("utf-8")
+            yield key, expires_at or None, offset + key_len, value_len
+        offset = end
+
+
+def dump_snapshot(cache: Any, path: str, codec: Optional[CacheCodec] = None) -> int:
+    """
+    Tulis semua entry yang masih berlaku ke snapshot.
+
+    Args:
+        cache: Sumber dengan items() -> (key, value, expires_at), mis.
+               MemoryCache, FileCache atau SnapshotCache
+        path: Path file snapshot
+        codec: Codec nilai (default: BinaryResultCodec); MemoryCache dengan
+               codec yang sama ditulis tanpa encode ulang
+
+    Returns:
+        Jumlah entry yang ditulis
+    """
+    codec = _default_codec(codec)
+    if _same_codec(cache, codec):
+        entries = cache.items(encoded=True)
+    else:
+        entries = ((key, codec.encode(value), expires_at) for key, value, expires_at in cache.items())
+
+    chunks = []
+    count = 0
+    for key, value, expires_at in entries:
+        key_bytes = key.encode("utf-8")
+        chunks.append(_ENTRY.pack(expires_at or 0.0, len(key_bytes), len(value)))
+        chunks.append(key_bytes)
+        chunks.append(value)
+        count += 1
+
+    codec_name = codec.name.encode("ascii")
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(codec_name), count))
+            f.write(codec_name)
+            f.write(b"".join(chunks))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise CacheException(f"Gagal menulis snapshot cache: {str(e)}")
+    return count
+
+
+def load_snapshot(path: str, cache: CacheInterface, codec: Optional[CacheCodec] = None) -> int:
+    """
+    Muat snapshot ke cache dengan satu read sekuensial.
+
+    Entry expired dilewati tanpa decode; nilai untuk MemoryCache dengan
+    codec yang sama disalin sebagai bytes, selain itu di-decode dan
+    disimpan dengan sisa TTL-nya.
+
+    Returns:
+        Jumlah entry yang dimuat (0 jika file tidak ada)
+    """
+    codec = _default_codec(codec)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return 0
+    except OSError as e:
+        raise CacheException(f"Gagal membaca snapshot cache: {str(e)}")
+
+    now = time.time()
+    raw = _same_codec(cache, codec)
+    view = memoryview(data)
+    loaded = 0
+    for key, expires_at, offset, length in _iter_entries(view, codec, now):
+        value = view[offset:offset + length]
+        if raw:
+            cache.set_encoded(key, bytes(value), expires_at)
+        else:
+            cache.set(key, codec.decode(bytes(value)), ttl=expires_at - now if expires_at else 0)
+        loaded += 1
+    return loaded
+
+
+class SnapshotCache(CacheInterface):
+    """
+    Cache read-only di atas snapshot yang di-mmap.
+
+    Index key -> (expires_at, offset, panjang) dibangun saat dibuka tanpa
+    decode nilai; get() men-decode slice mmap. set/delete/clear tidak
+    mengubah apa pun dan mengembalikan False, sehingga aman dipasang
+    sebagai cache engine (hasil baru tidak disimpan).
+    """
+
+    def __init__(self, path: str, codec: Optional[CacheCodec] = None):
+        import mmap
+
+        self.path = path
+        self.codec = _default_codec(codec)
+        self._index: Dict[str, Tuple[Optional[float], int, int]] = {}
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise CacheException("Snapshot cache kosong")
+        try:
+            for key, expires_at, offset, length in _iter_entries(self._mmap, self.codec, time.time()):
+                self._index[key] = (expires_at, offset, length)
+        except CacheException:
+            self.close()
+            raise
+
+    def _live(self, key: str) -> Optional[Tuple[Optional[float], int, int]]:
+        entry = self._index.get(key)
+        if entry is None or (entry[0] and entry[0] < time.time()):
+            return None
+        return entry
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._live(key)
+        if entry is None:
+            return None
+        _, offset, length = entry
+        try:
+            return self.codec.decode(self._mmap[offset:offset + length])
+        except CacheException:
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        return False
+
+    def delete(self, key: str) -> bool:
+        return False
+
+    def clear(self) -> bool:
+        return False
+
+    def has(self, key: str) -> bool:
+        return self._live(key) is not None
+
+    def items(self) -> Iterator[Tuple[str, Any, Optional[float]]]:
+        for key in list(self._index):
+            entry = self._live(key)
+            if entry is None:
+                continue
+            try:
+                value = self.codec.decode(self._mmap[entry[1]:entry[1] + entry[2]])
+            except CacheException:
+                continue
+            yield key, value, entry[0]
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def close(self):
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "SnapshotCache":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class PeriodicSnapshot:
+    """
+    Dump snapshot secara berkala dan saat interpreter keluar.
+
+    Contoh:
+        >>> snapshot = PeriodicSnapshot(cache, "cache.snap", interval=300)
+        >>> snapshot.start()
+        >>> ...
+        >>> snapshot.stop()     # dump terakhir
+    """
+
+    def __init__(
+        self,
+        cache: Any,
+        path: str,
+        interval: float = 300.0,
+        codec: Optional[CacheCodec] = None,
+        dump_on_exit: bool = True
+    ):
+        """
+        Args:
+            cache: Cache sumber (lihat dump_snapshot)
+            path: Path file snapshot
+            interval: Jarak antar dump (detik, 0 = hanya saat stop/exit)
+            codec: Codec nilai snapshot
+            dump_on_exit: Daftarkan dump terakhir ke atexit
+        """
+        self.cache = cache
+        self.path = path
+        self.interval = interval
+        self.codec = codec
+        self.dump_on_exit = dump_on_exit
+        self.dumps = 0
+        self.last_error: Optional[Exception] = None
+        self._stop = Event()
+        self._lock = Lock()
+        self._thread: Optional[Thread] = None
+        self._running = False
+
+    def dump(self) -> int:
+        """Dump sekarang; return jumlah entry (0 dan last_error diisi jika gagal)"""
+        with self._lock:
+            try:
+                count = dump_snapshot(self.cache, self.path, self.codec)
+            except CacheException as e:
+                self.last_error = e
+                return 0
+            self.dumps += 1
+            return count
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.dump()
+
+    def start(self) -> "PeriodicSnapshot":
+        if not self._running:
+            self._running = True
+            self._stop.clear()
+            if self.interval > 0:
+                self._thread = Thread(target=self._run, name="cache-snapshot", daemon=True)
+                self._thread.start()
+            if self.dump_on_exit:
+                import atexit
+
+                atexit.register(self.stop)
+        return self
+
+    def stop(self, dump: bool = True):
+        """Hentikan thread dan (default) lakukan dump terakhir"""
+        self._running = False
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+        if self.dump_on_exit:
+            import atexit
+
+            atexit.unregister(self.stop)
+        if dump:
+            self.dump()
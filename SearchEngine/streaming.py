@@ -0,0 +1,130 @@
+"""
+Parsing SERP secara inkremental untuk Multi Search Engine Library
+
+BlockSplitter menerima body respons per chunk (HTMLParser stdlib) dan
+mengembalikan potongan HTML setiap kali satu blok hasil (elemen terluar
+yang cocok dengan Strainer engine) selesai ditutup. Potongan tersebut
+di-parse dengan _parse_results engine, sehingga hasil pertama bisa
+diproses sebelum seluruh halaman selesai di-download.
+"""
+
+from html.parser import HTMLParser
+from typing import Optional, List
+
+from .extraction import Strainer
+
+
+# Jumlah karakter awal yang dicek detect_blocked_page sebelum hasil pertama di-yield
+HEAD_CHECK_SIZE = 16 * 1024
+
+
+class BlockSplitter(HTMLParser):
+    """
+    Pemecah HTML menjadi blok hasil secara inkremental.
+
+    Hanya blok terluar yang dilaporkan; elemen cocok di dalam blok yang
+    sedang terbuka dianggap bagian dari blok tersebut. Blok yang tidak
+    pernah ditutup dilaporkan sampai akhir dokumen saat close().
+
+    Chunk disimpan dalam list (digabung sekali lewat `text` bila perlu);
+    buffer kerja hanya memuat teks sejak blok terbuka atau posisi parser,
+    sehingga biaya per chunk tidak tumbuh dengan ukuran dokumen.
+
+    Tanpa Strainer (block None) chunk hanya dikumpulkan dan tidak ada blok
+    yang dilaporkan; pemanggil mem-parse `text` setelah close().
+    """
+
+    def __init__(self, block: Optional[Strainer]):
+        super().__init__(convert_charrefs=True)
+        self.block = block
+        self.length = 0
+        self._chunks: List[str] = []
+        self._buffer = ""
+        self._buffer_start = 0
+        self._line_starts = [0]
+        self._block_tag: Optional[str] = None
+        self._block_start = 0
+        self._depth = 0
+        self._ready: List[str] = []
+
+    def _offset(self) -> int:
+        line, column = self.getpos()
+        return self._line_starts[line - 1] + column
+
+    @property
+    def text(self) -> str:
+        """Seluruh teks yang sudah di-feed"""
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def head(self, size: int) -> str:
+        """Maksimal `size` karakter pertama dokumen"""
+        parts = []
+        remaining = size
+        for chunk in self._chunks:
+            if remaining <= 0:
+                break
+            parts.append(chunk[:remaining])
+            remaining -= len(chunk)
+        return "".join(parts)
+
+    def _slice(self, start: int, end: Optional[int] = None) -> str:
+        """Potongan teks dengan offset absolut (harus masih ada di buffer)"""
+        offset = self._buffer_start
+        return self._buffer[start - offset:None if end is None else end - offset]
+
+    def feed(self, data: str) -> List[str]:
+        """Tambahkan chunk; return potongan HTML blok yang selesai di chunk ini"""
+        base = self.length
+        self._chunks.append(data)
+        if self.block is None:
+            self.length += len(data)
+            return []
+        self._buffer += data
+        self.length += len(data)
+        index = data.find("\n")
+        while index != -1:
+            self._line_starts.append(base + index + 1)
+            index = data.find("\n", index + 1)
+        super().feed(data)
+        # Teks sebelum blok terbuka (atau sebelum posisi parser) tidak dibutuhkan lagi
+        keep = self._block_start if self._block_tag is not None else self._offset()
+        if keep > self._buffer_start:
+            self._buffer = self._buffer[keep - self._buffer_start:]
+            self._buffer_start = keep
+        ready, self._ready = self._ready, []
+        return ready
+
+    def close(self) -> List[str]:
+        """Akhiri dokumen; return blok tersisa (termasuk blok yang tidak ditutup)"""
+        if self.block is None:
+            return []
+        super().close()
+        if self._block_tag is not None:
+            self._ready.append(self._slice(self._block_start))
+            self._block_tag = None
+        ready, self._ready = self._ready, []
+        return ready
+
+    def handle_starttag(self, tag, attrs):
+        if self._block_tag is None:
+            if self.block.matches(tag, dict(attrs)):
+                self._block_tag = tag
+                self._block_start = self._offset()
+                self._depth = 1
+        elif tag == self._block_tag:
+            self._depth += 1
+
+    def handle_startendtag(self, tag, attrs):
+        # Elemen self-closing tidak membuka blok maupun menambah kedalaman
+        pass
+
+    def handle_endtag(self, tag):
+        if self._block_tag is None or tag != self._block_tag:
+            return
+        self._depth -= 1
+        if self._depth == 0:
+            end = self._buffer.index(">", self._offset() - self._buffer_start) + 1 + self._buffer_start
+            self._ready.append(self._slice(self._block_start, end))
+            self._block_tag = None
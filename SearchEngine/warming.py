@@ -0,0 +1,295 @@
+"""
+Cache warming untuk Multi Search Engine Library
+
+Setelah deploy, MemoryCache mulai kosong dan semua traffic awal langsung
+menuju engine sehingga rate limit cepat tercapai. Modul ini mengisi cache
+sebelum traffic diterima:
+
+- read_query_log / rank_queries: baca query log (satu query per baris atau
+  NDJSON dengan field "query"), normalisasi dan urutkan berdasarkan frekuensi
+- warm_cache: fetch (atau revalidate) N query teratas; setiap engine punya
+  satu worker dengan RateLimiter sesuai requests_per_minute di registry,
+  engine berbeda berjalan paralel
+- preload_cache: salin semua entry yang masih berlaku dari FileCache (atau
+  sumber lain dengan items()) ke cache lain dalam satu pass
+
+CLI:
+    python -m SearchEngine.warming queries.log --engines duckduckgo,brave --top 200 --cache-dir .cache
+
+Contoh:
+    >>> cache = MemoryCache(max_size=5000)
+    >>> preload_cache(cache, FileCache(".cache"))
+    >>> report = warm_cache("queries.log", engines=["duckduckgo"], cache=cache, top_n=100)
+    >>> report.fetched, report.cached
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field, asdict
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple, Union
+import json
+import os
+import time
+
+from .cache import CacheInterface
+from .query import QueryNormalizer, NormalizedQuery, DEFAULT_NORMALIZER
+from .exceptions import BlockedException, SearchEngineException
+
+
+def read_query_log(source: Union[str, Iterable[str]], field_name: str = "query") -> Iterator[str]:
+    """
+    Baca query dari log.
+
+    Args:
+        source: Path file atau iterable baris
+        field_name: Field query untuk baris NDJSON (baris yang diawali "{")
+
+    Yields:
+        Query mentah (baris kosong dan baris JSON tanpa field dilewati)
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "r", encoding="utf-8") as f:
+            yield from read_query_log(f, field_name)
+        return
+
+    for line in source:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            try:
+                value = json.loads(line).get(field_name)
+            except (ValueError, AttributeError):
+                continue
+            if isinstance(value, str) and value.strip():
+                yield value
+        else:
+            yield line
+
+
+def rank_queries(
+    queries: Iterable[str],
+    top_n: Optional[int] = None,
+    normalizer: Optional[QueryNormalizer] = None
+) -> List[Tuple[NormalizedQuery, int]]:
+    """
+    Kelompokkan query berdasarkan key ter-normalisasi dan urutkan dari yang paling sering.
+
+    Bentuk pertama yang muncul dipakai sebagai wakil; frekuensi sama
+    diurutkan berdasarkan kemunculan pertama.
+
+    Returns:
+        List (NormalizedQuery, jumlah) sepanjang maksimal top_n
+    """
+    normalizer = normalizer or DEFAULT_NORMALIZER
+    counts: Counter = Counter()
+    first: Dict[str, NormalizedQuery] = {}
+    for query in queries:
+        normalized = normalizer.normalize(query)
+        if not normalized.key:
+            continue
+        first.setdefault(normalized.key, normalized)
+        counts[normalized.key] += 1
+    return [(first[key], count) for key, count in counts.most_common(top_n)]
+
+
+@dataclass
+class EngineWarmStats:
+    """Hasil warming satu engine"""
+    fetched: int = 0
+    cached: int = 0
+    failed: int = 0
+    skipped: int = 0
+    error: Optional[str] = None
+
+
+@dataclass
+class WarmReport:
+    """
+    Ringkasan warm_cache.
+
+    Attributes:
+        queries: Query yang di-warm (urut frekuensi)
+        engines: Statistik per engine (fetched, cached = sudah ada di cache,
+                 failed, skipped = dilewati karena engine terblokir)
+        elapsed: Durasi total (detik)
+    """
+    queries: List[str] = field(default_factory=list)
+    engines: Dict[str, EngineWarmStats] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    @property
+    def fetched(self) -> int:
+        return sum(stats.fetched for stats in self.engines.values())
+
+    @property
+    def cached(self) -> int:
+        return sum(stats.cached for stats in self.engines.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "queries": self.queries,
+            "engines": {name: asdict(stats) for name, stats in self.engines.items()},
+            "fetched": self.fetched,
+            "cached": self.cached,
+            "elapsed": round(self.elapsed, 3),
+        }
+
+
+def _build_engine(name: str, cache: Optional[CacheInterface], engine_options: Dict[str, Any]):
+    """Instance engine dengan rate budget sesuai EngineInfo di registry"""
+    from .helpers import ENGINES
+    from .rate_limiter import RateLimiter
+
+    info = ENGINES.info(name)
+    options = {
+        "cache": cache,
+        "delay": 0,
+        "rate_limiter": RateLimiter(requests_per_minute=info.requests_per_minute, min_delay=info.min_delay),
+    }
+    options.update(engine_options)
+    return ENGINES[name](**options)
+
+
+def _warm_engine(engine, queries: List[str], num_results: int, refresh: bool, search_options: Dict[str, Any]) -> EngineWarmStats:
+    stats = EngineWarmStats()
+    for index, query in enumerate(queries):
+        try:
+            response = engine.execute(query, num_results=num_results, force_refresh=refresh, **search_options)
+        except BlockedException as e:
+            # Jangan perdalam blokir: sisa query untuk engine ini dilewati
+            stats.failed += 1
+            stats.skipped = len(queries) - index - 1
+            stats.error = str(e)
+            break
+        except SearchEngineException as e:
+            stats.failed += 1
+            stats.error = str(e)
+            continue
+        if response.from_cache:
+            stats.cached += 1
+        else:
+            stats.fetched += 1
+    return stats
+
+
+def warm_cache(
+    queries: Union[str, Iterable[str]],
+    engines: Iterable[Any] = ("duckduckgo",),
+    cache: Optional[CacheInterface] = None,
+    top_n: Optional[int] = 100,
+    num_results: int = 10,
+    refresh: bool = False,
+    normalizer: Optional[QueryNormalizer] = None,
+    engine_options: Optional[Dict[str, Any]] = None,
+    **search_options: Any
+) -> WarmReport:
+    """
+    Isi cache dengan N query teratas dari query log sebelum traffic diterima.
+
+    Query yang sudah ada di cache dihitung sebagai cached tanpa request
+    (kecuali refresh=True, yang mem-fetch ulang untuk revalidasi). Setiap
+    engine diproses berurutan oleh satu worker dengan RateLimiter sesuai
+    requests_per_minute di registry; engine yang terblokir berhenti dan
+    sisa query-nya dilewati.
+
+    Args:
+        queries: Path query log atau iterable query mentah
+        engines: Nama engine di registry atau instance SearchEngine
+                 (instance dipakai apa adanya, dengan cache miliknya)
+        cache: Cache tujuan untuk engine yang dibuat dari nama
+        top_n: Jumlah query teratas (None = semua)
+        num_results: Jumlah hasil per query
+        refresh: Fetch ulang query yang sudah ada di cache
+        normalizer: QueryNormalizer untuk pengelompokan (default: normalizer standar)
+        engine_options: Argumen tambahan constructor engine yang dibuat dari nama
+        **search_options: Argumen tambahan execute() (language, country, ...)
+
+    Returns:
+        WarmReport
+    """
+    start = time.perf_counter()
+    if isinstance(queries, (str, os.PathLike)):
+        queries = read_query_log(queries)
+    ranked = [normalized.text for normalized, _ in rank_queries(queries, top_n, normalizer)]
+
+    instances = {}
+    for engine in engines:
+        if isinstance(engine, str):
+            instances[engine.lower()] = _build_engine(engine.lower(), cache, engine_options or {})
+        else:
+            instances[engine.ENGINE_NAME] = engine
+
+    report = WarmReport(queries=ranked)
+    if len(instances) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(instances)) as executor:
+            futures = {
+                name: executor.submit(_warm_engine, engine, ranked, num_results, refresh, search_options)
+                for name, engine in instances.items()
+            }
+            report.engines = {name: future.result() for name, future in futures.items()}
+    else:
+        report.engines = {
+            name: _warm_engine(engine, ranked, num_results, refresh, search_options)
+            for name, engine in instances.items()
+        }
+
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def preload_cache(target: CacheInterface, source: Any) -> int:
+    """
+    Salin semua entry yang masih berlaku dari source ke target.
+
+    Args:
+        target: Cache tujuan (mis. MemoryCache)
+        source: Objek dengan items() -> (key, value, expires_at), mis. FileCache
+
+    Returns:
+        Jumlah entry yang disalin (sisa TTL dipertahankan)
+    """
+    now = time.time()
+    copied = 0
+    for key, value, expires_at in source.items():
+        if expires_at and expires_at <= now:
+            continue
+        target.set(key, value, ttl=expires_at - now if expires_at else 0)
+        copied += 1
+    return copied
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+    from .cache import FileCache
+
+    parser = argparse.ArgumentParser(description="Warm cache dari query log")
+    parser.add_argument("log", help="Query log (satu query per baris atau NDJSON)")
+    parser.add_argument("--engines", default="duckduckgo", help="Nama engine, dipisah koma")
+    parser.add_argument("--top", type=int, default=100, help="Jumlah query teratas (0 = semua)")
+    parser.add_argument("--num-results", type=int, default=10)
+    parser.add_argument("--field", default="query", help="Field query untuk baris NDJSON")
+    parser.add_argument("--cache-dir", default=".cache", help="Direktori FileCache tujuan")
+    parser.add_argument("--ttl", type=int, default=3600, help="TTL entry cache (detik)")
+    parser.add_argument("--refresh", action="store_true", help="Fetch ulang query yang sudah ada di cache")
+    parser.add_argument("--language")
+    parser.add_argument("--country")
+    args = parser.parse_args(argv)
+
+    search_options = {key: value for key, value in (("language", args.language), ("country", args.country)) if value}
+    report = warm_cache(
+        read_query_log(args.log, args.field),
+        engines=[name.strip() for name in args.engines.split(",") if name.strip()],
+        cache=FileCache(args.cache_dir, default_ttl=args.ttl),
+        top_n=args.top or None,
+        num_results=args.num_results,
+        refresh=args.refresh,
+        **search_options
+    )
+    print(json.dumps(report.to_dict(), indent=2, ensure_ascii=False))
+    return 1 if report.engines and all(stats.error for stats in report.engines.values()) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,114 @@
+"""
+Benchmark codec cache: JSON (format file lama) vs BinaryResultCodec
+
+Mengukur waktu encode/decode per entry, ukuran bytes, dan waktu
+FileCache.get untuk list hasil yang di-parse dari fixture SERP.
+
+Jalankan dari root repo:
+    python benchmarks/bench_cache_codecs.py [--iterations 2000] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SearchEngine import FileCache
+from SearchEngine.cache_codecs import JSONCodec, BinaryResultCodec
+from SearchEngine.helpers import ENGINES
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "fixtures")
+
+
+def load_values():
+    """List hasil (format cache) untuk setiap fixture engine"""
+    values = []
+    for name, engine_class in ENGINES.items():
+        with open(os.path.join(FIXTURES_DIR, f"{name}.html"), encoding="utf-8") as f:
+            results = engine_class()._parse_results(f.read())
+        for i, result in enumerate(results):
+            result.position = i + 1
+            result.engine = name
+        values.append([r.to_dict() for r in results])
+    return values
+
+
+def bench_codec(codec, values, iterations):
+    encoded = [codec.encode(v) for v in values]
+    rounds = max(1, iterations // len(values))
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for value in values:
+            codec.encode(value)
+    encode_us = (time.perf_counter() - start) / (rounds * len(values)) * 1e6
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for data in encoded:
+            codec.decode(data)
+    decode_us = (time.perf_counter() - start) / (rounds * len(values)) * 1e6
+
+    return {
+        "encode_us": round(encode_us, 2),
+        "decode_us": round(decode_us, 2),
+        "bytes": round(sum(map(len, encoded)) / len(encoded), 1),
+    }
+
+
+def bench_file_get(codec, values, iterations):
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = FileCache(tmp, codec=codec)
+        for i, value in enumerate(values):
+            cache.set(f"k{i}", value)
+        file_bytes = sum(os.path.getsize(os.path.join(tmp, f)) for f in os.listdir(tmp)) / len(values)
+
+        rounds = max(1, iterations // len(values))
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for i in range(len(values)):
+                cache.get(f"k{i}")
+        get_us = (time.perf_counter() - start) / (rounds * len(values)) * 1e6
+
+    return {"file_get_us": round(get_us, 2), "file_bytes": round(file_bytes, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--json", action="store_true", help="Output JSON saja")
+    args = parser.parse_args()
+
+    values = load_values()
+    codecs = {
+        "json-file-legacy": None,
+        "json-indent2": JSONCodec(indent=2),
+        "json-compact": JSONCodec(),
+        "binary": BinaryResultCodec(),
+        "binary-zlib": BinaryResultCodec(compress=True),
+    }
+
+    report = {}
+    for name, codec in codecs.items():
+        row = bench_codec(codec, values, args.iterations) if codec else {}
+        row.update(bench_file_get(codec, values, args.iterations))
+        report[name] = row
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{'codec':<18}{'encode us':>11}{'decode us':>11}{'bytes':>9}{'get us':>9}{'file B':>9}")
+    for name, row in report.items():
+        print(
+            f"{name:<18}{row.get('encode_us', '-'):>11}{row.get('decode_us', '-'):>11}"
+            f"{row.get('bytes', '-'):>9}{row['file_get_us']:>9}{row['file_bytes']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark waktu import (cold start) Multi Search Engine Library
+
+Setiap skenario dijalankan di interpreter baru (subprocess) beberapa kali;
+dilaporkan median waktu statement, total waktu proses, dan dependency berat
+(bs4, requests, soupsieve, concurrent.futures, orjson) yang ikut ter-import.
+
+Jalankan dari root repo:
+    python benchmarks/bench_import.py [--runs 15] [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    "import_package": "import SearchEngine",
+    "cache_only": "from SearchEngine import MemoryCache, FileCache",
+    "one_engine": "from SearchEngine import BingSearch",
+    "quick_search": "from SearchEngine import quick_search",
+    "first_parse": (
+        "from SearchEngine import BingSearch\n"
+        "BingSearch()._parse_results('<li class=\"b_algo\"><h2><a href=\"https://a.com\">A</a></h2></li>')"
+    ),
+    "everything": "from SearchEngine import *",
+}
+
+HEAVY_MODULES = ("bs4", "requests", "soupsieve", "concurrent.futures", "orjson")
+
+PROBE = """
+import sys, time, json
+start = time.perf_counter()
+exec(compile({code!r}, "<scenario>", "exec"))
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def run_scenario(code, runs):
+    statement_ms, process_ms, heavy = [], [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(code=code, heavy=HEAVY_MODULES)],
+            capture_output=True, text=True, check=True, cwd=ROOT
+        ).stdout
+        process_ms.append((time.perf_counter() - start) * 1000)
+        data = json.loads(output.strip().splitlines()[-1])
+        statement_ms.append(data["ms"])
+        heavy = data["heavy"]
+    return {
+        "statement_ms": round(statistics.median(statement_ms), 2),
+        "process_ms": round(statistics.median(process_ms), 2),
+        "heavy_modules": heavy,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--json", action="store_true", help="Output JSON saja")
+    args = parser.parse_args()
+
+    baseline = run_scenario("pass", args.runs)
+    report = {"interpreter_ms": baseline["process_ms"]}
+    report.update({name: run_scenario(code, args.runs) for name, code in SCENARIOS.items()})
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"interpreter kosong: {report['interpreter_ms']} ms")
+    print(f"{'skenario':<16}{'import ms':>11}{'proses ms':>11}  dependency berat")
+    for name in SCENARIOS:
+        row = report[name]
+        print(f"{name:<16}{row['statement_ms']:>11}{row['process_ms']:>11}  {', '.join(row['heavy_modules']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
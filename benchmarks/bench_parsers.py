@@ -0,0 +1,241 @@
+"""
+Harness micro-benchmark dan regresi untuk _parse_results
+
+Menjalankan parser setiap engine atas korpus SERP (tests/fixtures, direktori
+tambahan berisi <engine>*.html, atau SerpArchive) dengan beberapa backend
+parser, lalu melaporkan results/sec, MB/sec, alokasi (tracemalloc) dan peak
+memory. Gagal (exit code 1) jika hasil antar backend berbeda atau throughput
+turun melebihi threshold dibandingkan baseline yang disimpan.
+
+Backend:
+    spec   RESULT_SPEC dengan SoupStrainer (default engine; DDG tanpa fast path)
+    full   RESULT_SPEC tanpa pruning (seluruh dokumen di-parse)
+    fast   Fast-path HTMLParser DuckDuckGo (FAST_PARSE)
+    lxml   RESULT_SPEC dengan parser lxml (jika lxml terpasang)
+
+Jalankan dari root repo:
+    python benchmarks/bench_parsers.py --write-baseline benchmarks/parser_baseline.json
+    python benchmarks/bench_parsers.py --baseline benchmarks/parser_baseline.json --threshold 0.3
+"""
+
+import argparse
+import dataclasses
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SearchEngine.archive import SerpArchive
+from SearchEngine.helpers import ENGINES
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "fixtures")
+
+
+def _has_lxml():
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def make_parser(engine_name, backend):
+    """Instance engine yang dikonfigurasi untuk satu backend, atau None jika tidak berlaku"""
+    engine = ENGINES[engine_name]()
+    has_fast_path = hasattr(engine, "FAST_PARSE")
+
+    if backend == "fast":
+        if not has_fast_path:
+            return None
+        engine.FAST_PARSE = True
+        return engine
+
+    if has_fast_path:
+        engine.FAST_PARSE = False
+    if backend == "full":
+        engine.RESULT_SPEC = dataclasses.replace(engine.RESULT_SPEC, prune=None)
+    elif backend == "lxml":
+        engine.RESULT_SPEC = dataclasses.replace(engine.RESULT_SPEC, features="lxml")
+    return engine
+
+
+def available_backends():
+    backends = ["spec", "full", "fast"]
+    if _has_lxml():
+        backends.append("lxml")
+    return backends
+
+
+def load_corpus(fixtures_dir=FIXTURES_DIR, extra_dirs=(), archive_dir=None):
+    """Korpus per engine: nama engine -> list (label, html)"""
+    corpus = {name: [] for name in ENGINES}
+
+    for directory in (fixtures_dir,) + tuple(extra_dirs):
+        for filename in sorted(os.listdir(directory)):
+            if not filename.endswith(".html"):
+                continue
+            engine_name = next((name for name in ENGINES if filename.startswith(name)), None)
+            if engine_name:
+                with open(os.path.join(directory, filename), encoding="utf-8") as f:
+                    corpus[engine_name].append((filename, f.read()))
+
+    if archive_dir:
+        archive = SerpArchive(archive_dir)
+        for entry in archive.entries():
+            if entry.engine in corpus:
+                corpus[entry.engine].append((os.path.basename(entry.path), archive.load(entry)))
+
+    return {name: pages for name, pages in corpus.items() if pages}
+
+
+def measure(engine, pages, min_time):
+    """Ukur throughput dan memori satu parser atas list halaman"""
+    total_bytes = sum(len(html.encode("utf-8")) for _, html in pages)
+    results_per_round = sum(len(engine._parse_results(html)) for _, html in pages)
+
+    rounds = 0
+    start = time.perf_counter()
+    while True:
+        for _, html in pages:
+            engine._parse_results(html)
+        rounds += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        base_current, _ = tracemalloc.get_traced_memory()
+        kept = [engine._parse_results(html) for _, html in pages]
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    diff = after.compare_to(before, "filename")
+    del kept
+
+    return {
+        "pages": len(pages),
+        "results": results_per_round,
+        "ms_per_page": round(elapsed / (rounds * len(pages)) * 1000, 3),
+        "results_per_sec": round(results_per_round * rounds / elapsed, 1),
+        "mb_per_sec": round(total_bytes * rounds / elapsed / 1e6, 3),
+        "alloc_blocks": sum(stat.count_diff for stat in diff),
+        "retained_kb": round(sum(stat.size_diff for stat in diff) / 1024, 1),
+        "peak_kb": round((peak - base_current) / 1024, 1),
+    }
+
+
+def check_consistency(corpus, backends):
+    """Bandingkan output semua backend per halaman; return list pesan perbedaan"""
+    problems = []
+    for engine_name, pages in corpus.items():
+        parsers = {b: make_parser(engine_name, b) for b in backends}
+        parsers = {b: p for b, p in parsers.items() if p is not None}
+        for label, html in pages:
+            outputs = {b: [r.to_dict() for r in p._parse_results(html)] for b, p in parsers.items()}
+            reference_backend = "spec"
+            reference = outputs[reference_backend]
+            for backend, output in outputs.items():
+                if output != reference:
+                    problems.append(
+                        f"{engine_name}/{label}: backend '{backend}' ({len(output)} hasil) "
+                        f"berbeda dari '{reference_backend}' ({len(reference)} hasil)"
+                    )
+    return problems
+
+
+def run(corpus, backends, min_time):
+    report = {}
+    for engine_name, pages in corpus.items():
+        for backend in backends:
+            engine = make_parser(engine_name, backend)
+            if engine is None:
+                continue
+            report.setdefault(engine_name, {})[backend] = measure(engine, pages, min_time)
+    return report
+
+
+def check_baseline(report, baseline, threshold):
+    """Return list regresi throughput (turun lebih dari threshold, mis. 0.3 = 30%)"""
+    regressions = []
+    for engine_name, backends in report.items():
+        for backend, row in backends.items():
+            previous = baseline.get("results", {}).get(engine_name, {}).get(backend)
+            if not previous or not previous.get("results_per_sec"):
+                continue
+            ratio = row["results_per_sec"] / previous["results_per_sec"]
+            if ratio < 1 - threshold:
+                regressions.append(
+                    f"{engine_name}/{backend}: {row['results_per_sec']} results/sec, "
+                    f"baseline {previous['results_per_sec']} ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--corpus", action="append", default=[], help="Direktori tambahan berisi <engine>*.html")
+    parser.add_argument("--archive", help="Direktori SerpArchive sebagai korpus tambahan")
+    parser.add_argument("--engines", help="Daftar engine dipisah koma (default: semua)")
+    parser.add_argument("--backends", help=f"Daftar backend dipisah koma (default: {','.join(available_backends())})")
+    parser.add_argument("--min-time", type=float, default=0.5, help="Durasi minimum pengukuran per parser (detik)")
+    parser.add_argument("--baseline", help="File JSON baseline untuk cek regresi")
+    parser.add_argument("--threshold", type=float, default=0.3, help="Penurunan throughput maksimum (0.3 = 30%%)")
+    parser.add_argument("--write-baseline", help="Simpan hasil sebagai baseline baru")
+    parser.add_argument("--json", action="store_true", help="Output JSON saja")
+    args = parser.parse_args()
+
+    corpus = load_corpus(extra_dirs=tuple(args.corpus), archive_dir=args.archive)
+    if args.engines:
+        wanted = [e.strip() for e in args.engines.split(",")]
+        corpus = {name: pages for name, pages in corpus.items() if name in wanted}
+    backends = [b.strip() for b in args.backends.split(",")] if args.backends else available_backends()
+    if "spec" not in backends:
+        backends.insert(0, "spec")
+
+    problems = check_consistency(corpus, backends)
+    report = {"backends": backends, "results": run(corpus, backends, args.min_time)}
+
+    if args.write_baseline:
+        with open(args.write_baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = check_baseline(report["results"], json.load(f), args.threshold)
+
+    report["mismatches"] = problems
+    report["regressions"] = regressions
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        header = f"{'engine':<12}{'backend':<8}{'ms/page':>9}{'results/s':>11}{'MB/s':>8}{'blocks':>8}{'peak KB':>9}"
+        print(header)
+        for engine_name, rows in report["results"].items():
+            for backend, row in rows.items():
+                print(
+                    f"{engine_name:<12}{backend:<8}{row['ms_per_page']:>9}{row['results_per_sec']:>11}"
+                    f"{row['mb_per_sec']:>8}{row['alloc_blocks']:>8}{row['peak_kb']:>9}"
+                )
+        for message in problems:
+            print(f"BEDA: {message}")
+        for message in regressions:
+            print(f"REGRESI: {message}")
+
+    if problems or regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
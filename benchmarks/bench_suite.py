@@ -0,0 +1,290 @@
+"""
+Benchmark suite offline: parse, search end-to-end, fan-out, cache dan rate limiter
+
+Semua request dilayani oleh StandInServer lokal (SERP rekaman dari
+tests/fixtures), sehingga tidak ada request ke search engine asli.
+Hasil ditulis sebagai JSON agar bisa dibandingkan antar commit.
+
+Jalankan dari root repo:
+    python benchmarks/bench_suite.py [--quick] [--output hasil.json] [--compare baseline.json]
+    python benchmarks/bench_suite.py --sections parse,cache_hit
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SearchEngine import FileCache, MemoryCache, RateLimiter, RetryPolicy, RetryBudget, BinaryResultCodec
+from SearchEngine.exceptions import SearchEngineException
+from SearchEngine.helpers import ENGINES, search_all_engines
+from SearchEngine.health import HealthTracker
+
+from stand_in import StandInServer, load_fixtures
+
+SECTIONS = ("parse", "search", "stream", "fanout", "cache_hit", "rate_limiter", "faults")
+
+
+def _latency_stats(samples):
+    """Ringkasan latency (ms) dari list durasi (detik)"""
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "mean_ms": round(statistics.mean(ordered) * 1000, 3),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def bench_parse(iterations):
+    """Throughput _parse_results per engine"""
+    fixtures = load_fixtures()
+    report = {}
+    for name, engine_class in ENGINES.items():
+        html = fixtures[name].decode("utf-8")
+        engine = engine_class()
+        count = len(engine._parse_results(html))
+        start = time.perf_counter()
+        for _ in range(iterations):
+            engine._parse_results(html)
+        elapsed = time.perf_counter() - start
+        report[name] = {
+            "ms_per_page": round(elapsed / iterations * 1000, 3),
+            "results_per_sec": round(count * iterations / elapsed, 1),
+            "results": count,
+        }
+    return report
+
+
+def bench_search(server, iterations):
+    """Latency search() end-to-end per engine (tanpa cache, delay=0)"""
+    report = {}
+    for name, engine_class in ENGINES.items():
+        engine = server.route(engine_class(delay=0))
+        samples = []
+        for i in range(iterations):
+            start = time.perf_counter()
+            engine.search(f"query {i}", use_cache=False)
+            samples.append(time.perf_counter() - start)
+        report[name] = _latency_stats(samples)
+    return report
+
+
+def bench_stream(server, iterations):
+    """Time-to-first-result search_stream() dibanding search() penuh per engine"""
+    report = {}
+    for name, engine_class in ENGINES.items():
+        engine = server.route(engine_class(delay=0))
+        first, full = [], []
+        for i in range(iterations):
+            start = time.perf_counter()
+            stream = engine.search_stream(f"query {i}", use_cache=False)
+            next(stream, None)
+            first.append(time.perf_counter() - start)
+            for _ in stream:
+                pass
+            full.append(time.perf_counter() - start)
+        report[name] = {"first_result": _latency_stats(first), "all_results": _latency_stats(full)}
+    return report
+
+
+def bench_fanout(server, iterations):
+    """search_all_engines paralel vs sekuensial (tanpa Google)"""
+    engines = [name for name in ENGINES if name != "google"]
+    report = {}
+    with server.routed_classes(ENGINES.values()):
+        for parallel in (True, False):
+            samples = []
+            for i in range(iterations):
+                start = time.perf_counter()
+                result = search_all_engines(
+                    f"query {i}", engines=engines, parallel=parallel, health=HealthTracker()
+                )
+                samples.append(time.perf_counter() - start)
+                if result.has_errors():
+                    raise RuntimeError(f"Fan-out gagal: {result.errors}")
+            report["parallel" if parallel else "sequential"] = _latency_stats(samples)
+    return report
+
+
+def bench_cache_hit(server, iterations):
+    """Latency search() saat cache hit untuk beberapa backend cache"""
+    report = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        caches = {
+            "memory": (MemoryCache(), False),
+            "memory_views": (MemoryCache(), True),
+            "file_json": (FileCache(os.path.join(tmp, "json")), False),
+            "file_binary": (FileCache(os.path.join(tmp, "bin"), codec=BinaryResultCodec()), False),
+        }
+        for label, (cache, views) in caches.items():
+            engine = server.route(ENGINES["bing"](delay=0, cache=cache, cache_views=views))
+            engine.search("cached query")
+            samples = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                engine.search("cached query")
+                samples.append(time.perf_counter() - start)
+            report[label] = _latency_stats(samples)
+    return report
+
+
+def bench_rate_limiter(server, iterations):
+    """Overhead RateLimiter.wait() dan search() dengan/tanpa rate limiter"""
+    limiter = RateLimiter(requests_per_minute=10 ** 9, min_delay=0)
+    start = time.perf_counter()
+    for _ in range(iterations * 100):
+        limiter.wait()
+    wait_us = (time.perf_counter() - start) / (iterations * 100) * 1e6
+
+    report = {"wait_us": round(wait_us, 3)}
+    for label, rate_limiter in (("without", None), ("with", RateLimiter(10 ** 9, 0))):
+        engine = server.route(ENGINES["duckduckgo"](delay=0, rate_limiter=rate_limiter))
+        samples = []
+        for i in range(iterations):
+            start = time.perf_counter()
+            engine.search(f"query {i}", use_cache=False)
+            samples.append(time.perf_counter() - start)
+        report[f"search_{label}"] = _latency_stats(samples)
+    return report
+
+
+def bench_faults(iterations):
+    """search() dengan injeksi 429 dan captcha, dengan dan tanpa RetryPolicy"""
+    report = {}
+    for label, retry in (
+        ("no_retry", None),
+        ("retry", RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=0.01,
+                              budget=RetryBudget(ratio=0.5, min_retries=1))),
+    ):
+        with StandInServer(rate_limit_every=4, captcha_every=7, retry_after=0) as server:
+            engine = server.route(ENGINES["brave"](delay=0, retry=retry))
+            ok = 0
+            samples = []
+            for i in range(iterations):
+                start = time.perf_counter()
+                try:
+                    engine.search(f"query {i}", use_cache=False)
+                    ok += 1
+                except SearchEngineException:
+                    pass
+                samples.append(time.perf_counter() - start)
+            row = _latency_stats(samples)
+            row["success_rate"] = round(ok / iterations, 3)
+            row["responses"] = {str(k): v for k, v in sorted(server.responses.items())}
+            if retry is not None:
+                row["retry_stats"] = retry.stats.to_dict()
+            report[label] = row
+    return report
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sections, iterations, latency):
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.time(),
+            "iterations": iterations,
+            "latency": latency,
+        },
+        "results": {},
+    }
+    results = report["results"]
+
+    if "parse" in sections:
+        results["parse"] = bench_parse(iterations)
+
+    with StandInServer(latency=latency) as server:
+        if "search" in sections:
+            results["search"] = bench_search(server, iterations)
+        if "stream" in sections:
+            results["stream"] = bench_stream(server, iterations)
+        if "fanout" in sections:
+            results["fanout"] = bench_fanout(server, max(1, iterations // 5))
+        if "cache_hit" in sections:
+            results["cache_hit"] = bench_cache_hit(server, iterations * 10)
+        if "rate_limiter" in sections:
+            results["rate_limiter"] = bench_rate_limiter(server, iterations)
+
+    if "faults" in sections:
+        results["faults"] = bench_faults(iterations)
+
+    return report
+
+
+def _flatten(prefix, value, out):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            _flatten(f"{prefix}.{key}" if prefix else key, item, out)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        out[prefix] = value
+    return out
+
+
+def compare(report, baseline):
+    """Bandingkan metric waktu/throughput dengan baseline; return list baris (metric, baseline, sekarang, rasio)"""
+    current = _flatten("", report["results"], {})
+    previous = _flatten("", baseline.get("results", {}), {})
+    rows = []
+    for key in sorted(current):
+        if key in previous and previous[key] and key.rsplit(".", 1)[-1] in (
+            "mean_ms", "p50_ms", "p95_ms", "ms_per_page", "results_per_sec", "wait_us", "success_rate"
+        ):
+            rows.append((key, previous[key], current[key], current[key] / previous[key]))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--quick", action="store_true", help="Iterasi sedikit (smoke run)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Latency buatan server (detik)")
+    parser.add_argument("--sections", default=",".join(SECTIONS), help=f"Pilihan: {','.join(SECTIONS)}")
+    parser.add_argument("--output", help="Tulis hasil JSON ke file")
+    parser.add_argument("--compare", help="File JSON baseline untuk dibandingkan")
+    args = parser.parse_args()
+
+    sections = [s.strip() for s in args.sections.split(",") if s.strip()]
+    unknown = set(sections) - set(SECTIONS)
+    if unknown:
+        parser.error(f"Section tidak dikenal: {', '.join(sorted(unknown))}")
+
+    report = run(sections, 5 if args.quick else args.iterations, args.latency)
+    text = json.dumps(report, indent=2)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"\n{'metric':<45}{'baseline':>12}{'sekarang':>12}{'rasio':>8}", file=sys.stderr)
+        for key, before, after, ratio in compare(report, baseline):
+            print(f"{key:<45}{before:>12g}{after:>12g}{ratio:>8.2f}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
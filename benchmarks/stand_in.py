@@ -0,0 +1,174 @@
+"""
+Server HTTP lokal pengganti search engine untuk benchmark
+
+Melayani SERP rekaman dari tests/fixtures/<engine>.html pada path
+/<engine>/..., dengan latency buatan dan injeksi respons 429 / halaman
+captcha. Engine diarahkan ke server ini dengan mengganti BASE_URL.
+
+Contoh:
+    >>> with StandInServer(latency=0.02, rate_limit_every=10) as server:
+    ...     bing = BingSearch(delay=0)
+    ...     server.route(bing)
+    ...     bing.search("python")
+"""
+
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread, Lock
+from typing import Optional, Dict, Iterator
+import os
+import random
+import time
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "fixtures")
+
+CAPTCHA_PAGE = (
+    "<html><head><title>Verify</title></head><body>"
+    "<div id=\"captcha\">Please solve the captcha</div></body></html>"
+).encode("utf-8")
+
+
+def load_fixtures(fixtures_dir: str = FIXTURES_DIR) -> Dict[str, bytes]:
+    """Baca semua fixture SERP: nama engine -> HTML (bytes)"""
+    fixtures = {}
+    for filename in sorted(os.listdir(fixtures_dir)):
+        if filename.endswith(".html"):
+            with open(os.path.join(fixtures_dir, filename), "rb") as f:
+                fixtures[filename[:-len(".html")]] = f.read()
+    return fixtures
+
+
+class StandInServer:
+    """
+    Server stand-in berbasis ThreadingHTTPServer.
+
+    Args:
+        latency: Latency tetap per request (detik)
+        jitter: Tambahan latency acak 0..jitter (detik)
+        rate_limit_every: Setiap request ke-N dijawab 429 (0 = tidak pernah)
+        captcha_every: Setiap request ke-N dijawab halaman captcha (0 = tidak pernah)
+        retry_after: Nilai header Retry-After pada respons 429
+        fixtures_dir: Direktori fixture SERP
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit_every: int = 0,
+        captcha_every: int = 0,
+        retry_after: Optional[float] = None,
+        fixtures_dir: str = FIXTURES_DIR
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_every = rate_limit_every
+        self.captcha_every = captcha_every
+        self.retry_after = retry_after
+        self.fixtures = load_fixtures(fixtures_dir)
+        self.requests = 0
+        self.responses: Dict[int, int] = {}
+        self._lock = Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url_for(self, engine_name: str) -> str:
+        """BASE_URL pengganti untuk satu engine"""
+        return f"{self.base_url}/{engine_name}/search"
+
+    def route(self, engine):
+        """Arahkan instance engine ke server ini (mengganti BASE_URL instance)"""
+        engine.BASE_URL = self.url_for(engine.ENGINE_NAME)
+        return engine
+
+    @contextmanager
+    def routed_classes(self, engine_classes) -> Iterator[None]:
+        """
+        Arahkan class engine ke server ini selama blok berjalan.
+
+        Dipakai untuk quick_search/search_all_engines yang membuat instance sendiri.
+        """
+        original = {cls: cls.__dict__.get("BASE_URL") for cls in engine_classes}
+        for cls in engine_classes:
+            cls.BASE_URL = self.url_for(cls.ENGINE_NAME)
+        try:
+            yield
+        finally:
+            for cls, url in original.items():
+                if url is None:
+                    del cls.BASE_URL
+                else:
+                    cls.BASE_URL = url
+
+    def reset_counters(self):
+        with self._lock:
+            self.requests = 0
+            self.responses = {}
+
+    def _next_response(self, path: str):
+        with self._lock:
+            self.requests += 1
+            n = self.requests
+        engine_name = path.lstrip("/").split("/", 1)[0]
+
+        if self.rate_limit_every and n % self.rate_limit_every == 0:
+            status, body = 429, b"Too Many Requests"
+        elif self.captcha_every and n % self.captcha_every == 0:
+            status, body = 200, CAPTCHA_PAGE
+        elif engine_name in self.fixtures:
+            status, body = 200, self.fixtures[engine_name]
+        else:
+            status, body = 404, b"not found"
+
+        with self._lock:
+            self.responses[status] = self.responses.get(status, 0) + 1
+        return status, body
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                delay = server.latency + (random.uniform(0, server.jitter) if server.jitter else 0)
+                if delay > 0:
+                    time.sleep(delay)
+                status, body = server._next_response(self.path)
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                if status == 429 and server.retry_after is not None:
+                    self.send_header("Retry-After", str(server.retry_after))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "StandInServer":
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = Thread(target=self._server.serve_forever, name="StandInServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
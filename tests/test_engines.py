@@ -2,7 +2,12 @@
 Unit tests untuk Multi Search Engine Library
 """
 
+import json
+import os
+import time
+import threading
 import pytest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock, patch
 from multi_search_engine import (
     GoogleSearch,
@@ -17,8 +22,50 @@ from multi_search_engine import (
     RateLimiter,
     NetworkException,
     ParseException,
-    BlockedException
+    BlockedException,
+    ProxyPoolExhaustedException,
+    SerpArchive,
+    CompactResult,
+    ResultSet,
+    ResultView,
+    compact_results,
+    write_ndjson,
+    write_json_array,
+    set_json_backend,
+    get_json_backend,
+    EventBus,
+    MetricsAggregator,
+    TraceRecorder,
+    to_prometheus,
+    HealthTracker,
+    CircuitBreaker,
+    quick_search,
+    search_all_engines,
+    RetryPolicy,
+    RetryBudget,
+    RateLimitException,
+    ProxyPool,
+    EngineRegistry,
+    get_available_engines,
+    SearchResponse,
+    ParseExecutor,
+    QueryNormalizer,
+    SingleFlight,
+    dedupe_queries,
+    NegativeCache,
+    warm_cache,
+    preload_cache
 )
+from multi_search_engine.extraction import ResultSpec, FieldSpec, Strainer
+from multi_search_engine.engines.duckduckgo import fast_extract
+from multi_search_engine.cache_codecs import JSONCodec, BinaryResultCodec
+from multi_search_engine.exceptions import CacheException, ConfigurationException
+from multi_search_engine.metrics import MetricEvent, to_otlp_metrics, to_otlp_traces
+from multi_search_engine.decoding import decode_html, sniff_encoding
+from multi_search_engine.result_window import ResultWindow, plan_fetch
+from multi_search_engine.streaming import BlockSplitter
+from multi_search_engine.snapshot import dump_snapshot, load_snapshot, SnapshotCache, PeriodicSnapshot
+from multi_search_engine.warming import read_query_log, rank_queries, main as warming_main
 
 
 class TestSearchResult:
@@ -51,6 +98,90 @@ class TestSearchResult:
         assert d["engine"] == "google"
 
 
+class TestCompactResult:
+    """Test CompactResult"""
+    
+    def test_to_dict_matches_search_result(self):
+        result = SearchResult(
+            title="Test", url="https://Docs.Example.com/x", description="Desc",
+            position=3, engine="bing", extra={"k": 1}
+        )
+        compact = result.compact()
+        assert compact.to_dict() == result.to_dict()
+        assert compact.to_result() == result
+        assert compact.domain == "docs.example.com"
+    
+    def test_slots_and_lazy_extra(self):
+        compact = CompactResult(title="T", url="https://a.com", description="")
+        assert not hasattr(compact, "__dict__")
+        assert compact._extra is None
+        assert compact.to_dict()["extra"] == {}
+        compact.extra["k"] = "v"
+        assert compact.to_dict()["extra"] == {"k": "v"}
+    
+    def test_engine_and_domain_interned(self):
+        a, b = compact_results([
+            {"title": "A", "url": "https://github.com/a", "description": "", "engine": "brave"},
+            SearchResult(title="B", url="https://github.com/b", description="", engine="brave"),
+        ])
+        assert a.engine is b.engine
+        assert a.domain is b.domain
+    
+    def test_pickle_roundtrip(self):
+        import pickle
+        compact = CompactResult(title="T", url="https://a.com", description="d", position=2, engine="yahoo")
+        assert pickle.loads(pickle.dumps(compact)) == compact
+
+
+class TestResultSet:
+    """Test ResultSet kolumnar"""
+    
+    def make_set(self):
+        return ResultSet.from_searches(
+            [
+                SearchResult(title="Python Tutorial", url="https://docs.python.org/3/", description="Learn", engine="bing"),
+                SearchResult(title="Java Guide", url="https://github.com/java", description="Python-free", engine="bing"),
+            ],
+            [
+                {"title": "Advanced", "url": "https://www.python.org/x", "description": "", "engine": "brave"},
+            ],
+        )
+    
+    def test_filter_keyword(self):
+        rs = self.make_set()
+        assert [r.title for r in rs.filter_keyword("PYTHON")] == ["Python Tutorial", "Java Guide"]
+        assert len(rs.filter_keyword("python", fields=("title",))) == 1
+    
+    def test_filter_domain_and_engine(self):
+        rs = self.make_set()
+        assert len(rs.filter_domain("python.org")) == 2
+        assert len(rs.filter_domain("python.org", include_subdomains=False)) == 0
+        assert [r.engine for r in rs.filter_engine("brave")] == ["brave"]
+    
+    def test_filter_regex_and_chaining(self):
+        rs = self.make_set()
+        assert len(rs.filter_regex(r"/3/$", fields=("url",))) == 1
+        assert len(rs.filter_keyword("python").filter_domain("github.com").limit(5)) == 1
+    
+    def test_indexing_and_dicts(self):
+        rs = self.make_set()
+        assert rs[-1].title == "Advanced"
+        assert len(rs[:2]) == 2
+        assert rs.to_dict_list()[0] == rs[0].to_dict()
+    
+    def test_to_csv(self):
+        import csv, io
+        buf = io.StringIO()
+        assert self.make_set().to_csv(buf) == 3
+        rows = list(csv.DictReader(io.StringIO(buf.getvalue())))
+        assert rows[2]["domain"] == "www.python.org"
+    
+    def test_engine_result_set(self):
+        ddg = DuckDuckGoSearch()
+        ddg._results = [SearchResult(title="T", url="https://a.com", description="")]
+        assert len(ddg.result_set()) == 1
+
+
 class TestMemoryCache:
     """Test MemoryCache"""
     
@@ -80,6 +211,53 @@ class TestMemoryCache:
         assert cache.get("key2") is None
 
 
+class TestCacheCodecs:
+    """Test codec nilai cache"""
+    
+    RESULTS = [
+        {"title": "Judul é", "url": "https://a.com", "description": "Desc", "position": 1, "engine": "bing", "extra": {}},
+        {"title": "", "url": "https://b.com", "description": "🐍", "position": -2, "engine": "bing", "extra": {"k": [1]}},
+    ]
+    
+    @pytest.mark.parametrize("codec", [JSONCodec(), BinaryResultCodec(), BinaryResultCodec(compress=True, min_compress_size=0)])
+    @pytest.mark.parametrize("value", [RESULTS, [], {"data": "value"}, "text"])
+    def test_roundtrip(self, codec, value):
+        assert codec.decode(codec.encode(value)) == value
+    
+    def test_binary_rejects_unknown_schema(self):
+        codec = BinaryResultCodec()
+        data = bytearray(codec.encode(self.RESULTS))
+        data[3] = 99
+        with pytest.raises(CacheException):
+            codec.decode(bytes(data))
+    
+    def test_file_cache_with_codec(self, tmp_path):
+        cache = FileCache(str(tmp_path), codec=BinaryResultCodec(compress=True))
+        cache.set("key1", self.RESULTS)
+        assert cache.get("key1") == self.RESULTS
+        assert os.listdir(str(tmp_path))[0].endswith(".bin")
+        
+        cache.set("old", self.RESULTS, ttl=1)
+        with patch("time.time", return_value=__import__("time").time() + 5):
+            assert cache.get("old") is None
+        assert cache.clear()
+        assert cache.get("key1") is None
+    
+    def test_file_cache_ignores_other_codec(self, tmp_path):
+        FileCache(str(tmp_path), codec=BinaryResultCodec()).set("key1", self.RESULTS)
+        
+        class OtherCodec(BinaryResultCodec):
+            name = "other"
+        
+        assert FileCache(str(tmp_path), codec=OtherCodec()).get("key1") is None
+    
+    def test_memory_cache_with_codec(self):
+        cache = MemoryCache(codec=BinaryResultCodec())
+        cache.set("key1", self.RESULTS)
+        assert isinstance(cache._cache["key1"]["value"], bytes)
+        assert cache.get("key1") == self.RESULTS
+
+
 class TestRateLimiter:
     """Test RateLimiter"""
     
@@ -170,6 +348,68 @@ class TestSearchEngineWithMock:
             ddg.search("test query", use_cache=False)
 
 
+class TestStreamingSerialization:
+    """Test writer NDJSON/JSON streaming"""
+    
+    def make_results(self):
+        return [
+            SearchResult(title=f"Hasil {i} é", url=f"https://example.com/{i}", description="Desc", position=i)
+            for i in range(3)
+        ]
+    
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_json_array_matches_json_dumps(self, indent):
+        import io, json
+        previous = get_json_backend()
+        set_json_backend("json")
+        try:
+            buf = io.StringIO()
+            results = self.make_results()
+            assert write_json_array(results, buf, indent=indent) == 3
+            expected = json.dumps([r.to_dict() for r in results], indent=indent, ensure_ascii=False)
+            assert buf.getvalue() == expected
+            
+            empty = io.StringIO()
+            write_json_array([], empty, indent=indent)
+            assert empty.getvalue() == "[]"
+        finally:
+            set_json_backend(previous)
+    
+    def test_ndjson_binary_file(self, tmp_path):
+        import json
+        path = tmp_path / "hasil.ndjson"
+        with open(path, "wb") as f:
+            assert write_ndjson(self.make_results(), f) == 3
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["position"] for line in lines] == [0, 1, 2]
+    
+    def test_engine_write_json(self):
+        import io, json
+        ddg = DuckDuckGoSearch()
+        ddg._results = self.make_results()
+        buf = io.StringIO()
+        ddg.write_json(buf, indent=2)
+        assert json.loads(buf.getvalue()) == json.loads(ddg.to_json())
+    
+    @patch('requests.get')
+    def test_cache_views_on_hit(self, mock_get):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.text = load_fixture("bing")
+        mock_get.return_value = mock_response
+        
+        bing = BingSearch(delay=0, cache=MemoryCache(), cache_views=True)
+        fresh = bing.search("python")
+        cached = bing.search("python")
+        
+        assert mock_get.call_count == 1
+        assert isinstance(cached[0], ResultView)
+        assert [r.to_dict() for r in cached] == [r.to_dict() for r in fresh]
+        assert cached[0].engine == "bing"
+        with pytest.raises(AttributeError):
+            cached[0].title = "x"
+
+
 class TestFilterMethods:
     """Test filter methods"""
     
@@ -231,3 +471,1416 @@ class TestExportMethods:
         parsed = json.loads(json_str)
         assert len(parsed) == 1
         assert parsed[0]["title"] == "Test"
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+ALL_ENGINES = [GoogleSearch, BingSearch, DuckDuckGoSearch, YahooSearch, MojeekSearch, BraveSearch]
+
+
+def load_fixture(engine_name):
+    with open(os.path.join(FIXTURES_DIR, f"{engine_name}.html"), encoding="utf-8") as f:
+        return f.read()
+
+
+def mock_response(text="", status_code=200, headers=None):
+    """Response requests palsu dengan content (bytes UTF-8) dan header Content-Type"""
+    response = Mock()
+    response.status_code = status_code
+    response.text = text
+    response.content = text.encode("utf-8")
+    response.headers = {"Content-Type": "text/html; charset=utf-8", **(headers or {})}
+    return response
+
+
+class TestResultSpec:
+    """Test declarative result extraction"""
+    
+    @pytest.mark.parametrize("engine_class", ALL_ENGINES)
+    def test_pruned_parse_matches_full_parse(self, engine_class):
+        html = load_fixture(engine_class.ENGINE_NAME)
+        spec = engine_class.RESULT_SPEC
+        assert spec.extract(html, prune=True) == spec.extract(html, prune=False)
+    
+    @pytest.mark.parametrize("engine_class", ALL_ENGINES)
+    def test_fixture_parses(self, engine_class):
+        results = engine_class()._parse_results(load_fixture(engine_class.ENGINE_NAME))
+        assert results
+        assert all(r.title and r.url.startswith("http") for r in results)
+    
+    def test_duckduckgo_skips_ads_and_reads_snippet(self):
+        results = DuckDuckGoSearch()._parse_results(load_fixture("duckduckgo"))
+        assert len(results) == 10
+        assert not any("y.js" in r.url for r in results)
+        assert all(r.description for r in results)
+    
+    def test_required_field_skips_block(self):
+        spec = ResultSpec(
+            containers=("div.r",),
+            fields={
+                "url": FieldSpec(("a",), attr="href", required=True),
+                "description": FieldSpec(("p",)),
+            },
+        )
+        records = spec.extract('<div class="r"><p>no link</p></div><div class="r"><a href="u">x</a></div>')
+        assert records == [{"url": "u", "description": None}]
+
+
+DDG_DIFFERENTIAL_CORPUS = [
+    '''<a class="result__a" href="//duckduckgo.com/l/?uddg=https%3A%2F%2Fexample.com">
+        Test Result
+    </a>
+    <div class="result__snippet">Test description</div>''',
+    '''<div class="result"><div class="result__body">
+    <span class="extra snippet">first</span>
+    <a class="result__snippet" href="#">second</a>
+    <h2><a class="result__a" href="https://a.example/">A <b>bold</b> title</a></h2>
+    </div></div>''',
+    '''<div class="result"><h2><a class="result__a" href="https://b.example/?x=1&amp;y=2">
+    Tom &amp; Jerry &copy 2024 &foo; &#8212; &#x27;quoted&#x27;</a></h2>
+    <div class="result__snippet">Line<br>break &lt;tag&gt;</div></div>''',
+    '''<div class="results"><div class="result"><p>unclosed <a class="result__a" href="https://c.example/">C
+    </div></span><div class="result__snippet"/><a class="result__a other" href="https://d.example/">D</a>
+    <div class="snippet-x">tail</div></div>''',
+    '''<div class="result"><!-- comment -->
+    <a href="https://e.example/" class="result__a">E<img class="snippet" src="i.png"></a></div>''',
+]
+
+DDG_FALLBACK_CORPUS = [
+    '<div class="result"><a class="result__a" href="https://a.example/">A<script>var x;</script></a></div>',
+    '<div class="result"><a class="result__a" href="https://a.example/"><![CDATA[A]]></a></div>',
+    '<div class="result"><a class=result__a href="https://a.example/">A</a></div>',
+    '<div class="result"><a class="result__a" href="https://a.example/">A &#150; B</a></div>',
+    '<div class="result"><!-- <a class="result__a" href="x">hidden</a> --></div>',
+]
+
+
+class TestDuckDuckGoFastPath:
+    """Differential test: fast-path DuckDuckGo vs parser bs4"""
+    
+    @pytest.mark.parametrize("html", DDG_DIFFERENTIAL_CORPUS + [load_fixture("duckduckgo")])
+    def test_fast_path_matches_bs4(self, html):
+        fast = fast_extract(html)
+        assert fast is not None
+        assert fast == DuckDuckGoSearch.RESULT_SPEC.extract(html, prune=False)
+    
+    @pytest.mark.parametrize("html", DDG_FALLBACK_CORPUS)
+    def test_fast_path_declines_ambiguous_markup(self, html):
+        assert fast_extract(html) is None
+    
+    @pytest.mark.parametrize("html", DDG_DIFFERENTIAL_CORPUS + DDG_FALLBACK_CORPUS)
+    def test_parse_results_identical_with_and_without_fast_path(self, html):
+        ddg = DuckDuckGoSearch()
+        fast = [r.to_dict() for r in ddg._parse_results(html)]
+        ddg.FAST_PARSE = False
+        assert fast == [r.to_dict() for r in ddg._parse_results(html)]
+
+
+class TestSerpArchive:
+    """Test arsip SERP mentah dan reparse"""
+    
+    def test_store_and_load(self, tmp_path):
+        archive = SerpArchive(str(tmp_path))
+        entry = archive.store("bing", "python", {"page": 1, "num_results": 10}, "<html>x</html>")
+        assert entry.path.endswith(".html.gz")
+        
+        entries = list(archive.entries(engine="bing"))
+        assert len(entries) == 1
+        assert entries[0].query == "python"
+        assert archive.load(entries[0]) == "<html>x</html>"
+    
+    @patch('requests.get')
+    def test_search_archives_raw_page(self, mock_get, tmp_path):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.text = load_fixture("bing")
+        mock_get.return_value = mock_response
+        
+        archive = SerpArchive(str(tmp_path))
+        results = BingSearch(delay=0, archive=archive).search("python", use_cache=False)
+        
+        entries = list(archive.entries())
+        assert len(entries) == 1
+        assert entries[0].params["num_results"] == 10
+        assert archive.load(entries[0]) == mock_response.text
+        
+        reparsed = list(archive.reparse(parallel=False))
+        assert reparsed[0].success
+        assert [r.to_dict() for r in reparsed[0].results] == [r.to_dict() for r in results]
+    
+    def test_reparse_process_pool(self, tmp_path):
+        archive = SerpArchive(str(tmp_path))
+        for name in ("duckduckgo", "brave"):
+            archive.store(name, "python", {"page": 2, "num_results": 10}, load_fixture(name))
+        archive.store("yahoo", "python", {"page": 1}, "<title>Access Denied</title>")
+        
+        reparsed = {r.entry.engine: r for r in archive.reparse(max_workers=2)}
+        assert reparsed["duckduckgo"].results[0].position == 11
+        assert reparsed["brave"].results[0].engine == "brave"
+        assert not reparsed["yahoo"].success
+
+
+class TestMetrics:
+    """Test untuk EventBus, MetricsAggregator dan exporter"""
+    
+    @patch('requests.get')
+    def test_search_emits_stage_timings(self, mock_get):
+        mock_get.return_value = mock_response(load_fixture("bing"))
+        bus = EventBus()
+        stats = bus.subscribe(MetricsAggregator())
+        recorder = bus.subscribe(TraceRecorder())
+        
+        engine = BingSearch(delay=0, cache=MemoryCache(), rate_limiter=RateLimiter(100, 0), metrics=bus)
+        engine.search("python")
+        engine.search("python")
+        
+        summary = stats.summary()["bing"]
+        for stage in ("rate_limit_wait", "delay", "fetch", "block_detect", "parse"):
+            assert summary[stage]["count"] == 1
+        assert summary["cache_lookup"]["count"] == 2
+        assert summary["total"]["count"] == 2
+        assert summary["fetch"]["p50"] <= summary["fetch"]["p99"]
+        assert stats.counter("cache_miss", "bing") == 1
+        assert stats.counter("cache_hit", "bing") == 1
+        assert stats.counter("http_status", status=200) == 1
+        assert stats.counter("bytes_downloaded") == len(load_fixture("bing").encode("utf-8"))
+        
+        trace_ids = {span.trace_id for span in recorder.spans()}
+        assert len(trace_ids) == 2 and None not in trace_ids
+    
+    @patch('requests.get')
+    def test_blocked_and_error_outcomes(self, mock_get):
+        mock_get.return_value = mock_response("<title>Access Denied</title>")
+        bus = EventBus()
+        stats = bus.subscribe(MetricsAggregator())
+        
+        with pytest.raises(BlockedException):
+            DuckDuckGoSearch(delay=0, metrics=bus).search("python", use_cache=False)
+        
+        assert stats.counter("blocked", "duckduckgo", reason="page") == 1
+        assert stats.summary()["duckduckgo"]["total"]["errors"] == 1
+    
+    def test_subscriber_errors_are_isolated(self):
+        bus = EventBus()
+        
+        def broken(event):
+            raise RuntimeError("boom")
+        
+        bus.subscribe(broken)
+        stats = bus.subscribe(MetricsAggregator())
+        with bus.timer("parse", "bing"):
+            pass
+        bus.unsubscribe(broken)
+        assert stats.summary()["bing"]["parse"]["count"] == 1
+    
+    def test_exporters(self):
+        bus = EventBus()
+        stats = bus.subscribe(MetricsAggregator())
+        recorder = bus.subscribe(TraceRecorder())
+        for _ in range(3):
+            with bus.timer("fetch", "brave"):
+                pass
+        bus.count("http_status", "brave", status=200)
+        
+        text = to_prometheus(stats)
+        assert 'searchengine_stage_seconds{engine="brave",stage="fetch",quantile="0.95"}' in text
+        assert 'searchengine_stage_seconds_count{engine="brave",stage="fetch"} 3' in text
+        assert 'searchengine_http_status_total{engine="brave",status="200"} 1' in text
+        
+        metrics = to_otlp_metrics(stats)["resourceMetrics"][0]["scopeMetrics"][0]["metrics"]
+        assert metrics[0]["summary"]["dataPoints"][0]["count"] == "3"
+        spans = to_otlp_traces(recorder)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        assert len(spans) == 3 and spans[0]["name"] == "brave.fetch"
+    
+    def test_reserved_tag_names(self):
+        bus = EventBus()
+        stats = bus.subscribe(MetricsAggregator())
+        recorder = bus.subscribe(TraceRecorder())
+        bus.emit(MetricEvent("counter", "blocked", "brave", 1, {"engine": "other", "event": "x"}))
+        bus.emit(MetricEvent("stage", "fetch", "brave", 0.1, {"engine": "other"}))
+        
+        assert 'searchengine_blocked_total{engine="brave",tag_engine="other",event="x"} 1' in to_prometheus(stats)
+        points = to_otlp_metrics(stats)["resourceMetrics"][0]["scopeMetrics"][0]["metrics"][1]["sum"]["dataPoints"]
+        keys = [attribute["key"] for attribute in points[0]["attributes"]]
+        assert keys == ["event", "engine", "tag_engine", "tag_event"]
+        span = to_otlp_traces(recorder)["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        assert [attribute["key"] for attribute in span["attributes"]][:2] == ["engine", "tag_engine"]
+
+
+class TestEngineHealth:
+    """Test untuk HealthTracker, CircuitBreaker dan quick_search(engine='auto')"""
+    
+    def test_circuit_breaker_opens_and_probes(self):
+        breaker = CircuitBreaker(failure_threshold=2, cooldown=60)
+        breaker.record_failure()
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow_request()
+        
+        breaker.opened_at -= 61
+        assert breaker.allow_request()
+        assert breaker.state == "half_open"
+        assert not breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == "closed"
+    
+    def test_only_blocks_and_network_errors_trip(self):
+        health = HealthTracker(failure_threshold=2)
+        health.record("bing", 0.1, ValueError("parse"))
+        health.record("bing", 0.1, ValueError("parse"))
+        assert health.is_available("bing")
+        health.record("bing", 0.1, BlockedException("captcha"))
+        health.record("bing", 0.1, BlockedException("captcha"))
+        assert not health.is_available("bing")
+        
+        report = health.report()["bing"]
+        assert report["error_rate"] == 1.0
+        assert report["block_rate"] == 0.5
+        assert report["state"] == "open"
+    
+    def test_ranking_prefers_fast_successful_engines(self):
+        health = HealthTracker()
+        health.record("brave", 0.2)
+        health.record("mojeek", 3.0)
+        health.record("yahoo", 0.2, ValueError("x"))
+        assert health.ranked(["yahoo", "mojeek", "brave", "bing"]) == ["bing", "brave", "mojeek", "yahoo"]
+    
+    def test_persistence(self, tmp_path):
+        path = str(tmp_path / "health.json")
+        health = HealthTracker(failure_threshold=1, path=path)
+        health.record("brave", 0.5, NetworkException("down"))
+        
+        restored = HealthTracker(failure_threshold=1, path=path)
+        assert restored.state("brave") == "open"
+        assert restored.report()["brave"]["requests"] == 1
+    
+    def test_probe_settled_by_other_errors(self):
+        health = HealthTracker(failure_threshold=1, cooldown=60)
+        health.record("bing", 0.1, NetworkException("down"))
+        health._breakers["bing"].opened_at -= 61
+        assert health.allow_request("bing")
+        health.record("bing", 0.1, ParseException("layout"))
+        assert health.state("bing") == "open"
+        
+        health._breakers["bing"].opened_at -= 61
+        assert health.is_available("bing") and health.allow_request("bing")
+        health.record("bing", 0.1)
+        assert health.state("bing") == "closed"
+    
+    def test_concurrent_saves(self, tmp_path):
+        path = str(tmp_path / "health.json")
+        health = HealthTracker(path=path, save_interval=0)
+        errors = []
+        
+        def worker(index):
+            try:
+                for _ in range(50):
+                    health.record(f"engine{index}", 0.1)
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert os.listdir(tmp_path) == ["health.json"]
+        assert len(HealthTracker(path=path).report()) == 8
+    
+    @patch('requests.get')
+    def test_auto_fails_over_and_opens_circuit(self, mock_get):
+        def fake_get(url, **kwargs):
+            response = Mock()
+            response.status_code = 200
+            if "brave" in url:
+                response.text = load_fixture("brave")
+            else:
+                response.text = "<title>Access Denied</title>"
+            return response
+        
+        mock_get.side_effect = fake_get
+        health = HealthTracker(failure_threshold=1)
+        
+        with patch('time.sleep'):
+            results = quick_search("python", engine="auto", health=health)
+            assert results[0].engine == "brave"
+            assert health.state("duckduckgo") == "open"
+            assert health.ranked(["duckduckgo", "yahoo", "brave"]) == ["brave"]
+            
+            combined = search_all_engines("python", engines=None, parallel=False, health=health)
+        assert set(combined.errors) == {"duckduckgo", "yahoo", "mojeek"}
+        assert "brave" in combined.results
+
+
+class TestRetryPolicy:
+    """Test untuk RetryPolicy dan RetryBudget"""
+    
+    @patch('requests.get')
+    def test_recovers_from_timeout(self, mock_get):
+        import requests as requests_lib
+        mock_get.side_effect = [requests_lib.exceptions.Timeout(), mock_response(text=load_fixture("bing"))]
+        sleeps = []
+        policy = RetryPolicy(max_attempts=3, sleep=sleeps.append)
+        bus = EventBus()
+        stats = bus.subscribe(MetricsAggregator())
+        
+        results = BingSearch(delay=0, retry=policy, metrics=bus).search("python", use_cache=False)
+        assert len(results) > 0
+        assert policy.stats.retries == 1
+        assert policy.stats.recovered == 1
+        assert policy.stats.by_error == {"NetworkException": 1}
+        assert len(sleeps) == 1
+        assert stats.counter("retry", "bing") == 1
+    
+    @patch('requests.get')
+    def test_rate_limit_honours_retry_after(self, mock_get):
+        mock_get.side_effect = [
+            mock_response(status_code=429, headers={"Retry-After": "7"}),
+            mock_response(text=load_fixture("bing"))
+        ]
+        sleeps = []
+        limiter = RateLimiter(100, 0.001)
+        engine = BingSearch(delay=0, rate_limiter=limiter, retry=RetryPolicy(sleep=sleeps.append))
+        engine.search("python", use_cache=False)
+        assert sleeps[0] >= 7
+        assert limiter.current_delay == 0.002
+    
+    @patch('requests.get')
+    def test_blocks_and_client_errors_are_not_retried(self, mock_get):
+        policy = RetryPolicy(sleep=lambda s: None)
+        engine = BingSearch(delay=0, retry=policy)
+        
+        mock_get.return_value = mock_response(status_code=403)
+        with pytest.raises(BlockedException):
+            engine.search("python", use_cache=False)
+        
+        import requests as requests_lib
+        not_found = mock_response(status_code=404)
+        not_found.raise_for_status.side_effect = requests_lib.exceptions.HTTPError("404")
+        mock_get.return_value = not_found
+        with pytest.raises(NetworkException) as exc_info:
+            engine.search("python", use_cache=False)
+        assert exc_info.value.status_code == 404
+        assert mock_get.call_count == 2
+        assert policy.stats.retries == 0
+    
+    def test_budget_limits_retries(self):
+        budget = RetryBudget(ratio=0.1, min_retries=1, window=60)
+        policy = RetryPolicy(max_attempts=5, budget=budget, sleep=lambda s: None)
+        
+        def failing():
+            raise NetworkException("down")
+        
+        with pytest.raises(NetworkException):
+            policy.call(failing)
+        assert policy.stats.retries == 1
+        assert policy.stats.budget_exhausted == 1
+        
+        for _ in range(20):
+            budget.record_request()
+        assert budget.available == 1
+    
+    def test_decorrelated_jitter_bounds(self):
+        policy = RetryPolicy(base_delay=0.5, max_delay=4.0)
+        delay = policy.base_delay
+        for _ in range(50):
+            delay = policy.next_delay(delay)
+            assert 0.5 <= delay <= 4.0
+        assert issubclass(RateLimitException, BlockedException)
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    """Proxy HTTP lokal: melayani fixture Bing, atau halaman captcha jika query berisi 'blocked'"""
+    
+    def do_GET(self):
+        if self.path.endswith("/health"):
+            body = b"ok"
+        elif "blocked" in self.path:
+            body = b"<html><div id='captcha'></div></html>"
+        else:
+            body = load_fixture("bing").encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_proxy():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ProxyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestProxyPool:
+    """Test untuk ProxyPool"""
+    
+    def test_strategies(self):
+        pool = ProxyPool(["http://a:1", "http://b:1", "http://c:1"], min_delay=0)
+        assert [pool.acquire("bing").url for _ in range(4)] == ["http://a:1", "http://b:1", "http://c:1", "http://a:1"]
+        
+        sticky = ProxyPool(["http://a:1", "http://b:1"], strategy="sticky")
+        assert sticky.acquire("bing").url == sticky.acquire("bing").url
+        assert sticky.acquire("brave").url != sticky.acquire("bing").url
+        
+        least = ProxyPool(["http://a:1", "http://b:1"], strategy="least_loaded")
+        first = least.acquire()
+        assert least.acquire().url != first.url
+        
+        with pytest.raises(ConfigurationException):
+            ProxyPool(["http://a:1"], strategy="random")
+    
+    def test_eviction_after_blocks(self):
+        pool = ProxyPool(["http://a:1", "http://b:1"], max_blocks=2)
+        proxy = pool.proxies[0]
+        for _ in range(2):
+            pool.release(pool.acquire(), blocked=True)
+            pool.acquire()
+        assert proxy.evicted
+        assert [p.url for p in pool.available] == ["http://b:1"]
+        
+        pool.release(pool.proxies[1], blocked=True, rate_limited=True)
+        assert pool.proxies[1].rate_limiter.current_delay == 2.0
+    
+    def test_health_check_and_search_through_pool(self, local_proxy):
+        pool = ProxyPool([local_proxy, "http://127.0.0.1:9"], min_delay=0, max_blocks=1,
+                         health_check_timeout=2)
+        assert pool.check_health("http://health.test/health") == {local_proxy: True, "http://127.0.0.1:9": False}
+        assert [p.url for p in pool.available] == [local_proxy]
+        
+        engine = BingSearch(delay=0, proxy=pool)
+        engine.BASE_URL = "http://bing.test/search"
+        results = engine.search("python", use_cache=False)
+        assert len(results) > 0
+        assert pool.proxies[0].to_dict()["requests"] == 1
+        
+        with pytest.raises(BlockedException):
+            engine.search("blocked", use_cache=False)
+        assert pool.proxies[0].evicted
+        with pytest.raises(BlockedException):
+            engine.search("python", use_cache=False)
+        pool.close()
+    
+    def test_environment_proxies_ignored_and_tags_redacted(self, local_proxy, monkeypatch):
+        monkeypatch.setenv("HTTP_PROXY", "http://127.0.0.1:9")
+        credentialed = local_proxy.replace("http://", "http://user:secret@")
+        pool = ProxyPool([credentialed], min_delay=0)
+        assert pool.proxies[0].label == local_proxy[len("http://"):]
+        assert pool.stats()[0]["proxy"] == pool.proxies[0].label
+        assert "secret" not in json.dumps(pool.stats())
+        assert pool.stats(include_url=True)[0]["url"] == credentialed
+        
+        bus = EventBus()
+        recorder = bus.subscribe(TraceRecorder())
+        engine = BingSearch(delay=0, proxy=pool, metrics=bus)
+        engine.BASE_URL = "http://bing.test/search"
+        assert len(engine.search("python", use_cache=False)) > 0
+        tags = [span.tags["proxy"] for span in recorder.spans() if span.name == "rate_limit_wait"]
+        assert tags == [pool.proxies[0].label]
+        pool.close()
+
+
+class TestLazyImports:
+    """Test bahwa import package tidak memuat engine dan dependency berat"""
+    
+    def _probe(self, code):
+        import json
+        import subprocess
+        import sys
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+        probe = (
+            f"{code}\nimport sys, json\n"
+            "print(json.dumps(sorted(m for m in ('bs4', 'requests', 'soupsieve', 'concurrent.futures', "
+            "'multi_search_engine.engines.bing', 'multi_search_engine.engines.google') if m in sys.modules)))"
+        )
+        output = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, env=env, check=True)
+        return json.loads(output.stdout.strip().splitlines()[-1])
+    
+    def test_package_import_is_lazy(self):
+        assert self._probe("import multi_search_engine") == []
+        assert self._probe("from multi_search_engine import MemoryCache, quick_search") == []
+    
+    def test_engine_loaded_on_demand(self):
+        loaded = self._probe("from multi_search_engine import BingSearch")
+        assert loaded == ["multi_search_engine.engines.bing"]
+        loaded = self._probe("from multi_search_engine import BingSearch\nBingSearch()._parse_results('<li></li>')")
+        assert "bs4" in loaded and "requests" not in loaded
+    
+    def test_engines_registry_resolves_on_first_use(self):
+        from multi_search_engine.helpers import ENGINES
+        assert "bing" in ENGINES and len(ENGINES) == 6
+        assert ENGINES["bing"] is BingSearch
+        assert "BingSearch" in dir(__import__("multi_search_engine"))
+
+
+class TestEngineRegistry:
+    """Test untuk EngineRegistry dan entry point plugin"""
+    
+    def _entry_point(self, name, value):
+        entry_point = Mock()
+        entry_point.name = name
+        entry_point.value = value
+        return entry_point
+    
+    def test_builtins_are_lazy_with_capabilities(self):
+        registry = EngineRegistry(entry_point_group=None)
+        assert registry.names() == ["google", "bing", "duckduckgo", "yahoo", "mojeek", "brave"]
+        assert not registry.is_loaded("mojeek")
+        assert registry.info("mojeek").supports_language is False
+        assert registry["mojeek"] is MojeekSearch
+        assert registry.is_loaded("mojeek")
+        assert registry.names(fan_out=True, requires_api_key=False) == ["duckduckgo", "yahoo", "mojeek", "brave"]
+    
+    def test_register_class_and_string_target(self):
+        class IntranetSearch(BraveSearch):
+            ENGINE_NAME = "intranet"
+            CAPABILITIES = {"supports_country": True, "requests_per_minute": 60}
+        
+        registry = EngineRegistry(builtins=False, entry_point_group=None)
+        info = registry.register("intranet", IntranetSearch, fan_out=False)
+        assert info.supports_country and info.requests_per_minute == 60 and not info.fan_out
+        assert info.min_delay == 1.0
+        
+        registry.register("bing2", "multi_search_engine.engines.bing:BingSearch", supports_pagination=False)
+        assert not registry.is_loaded("bing2")
+        assert registry["bing2"] is BingSearch
+        
+        with pytest.raises(ConfigurationException):
+            registry.register("x", IntranetSearch, warp_speed=True)
+        registry.register("broken", "multi_search_engine.engines.bing:Missing")
+        with pytest.raises(ConfigurationException):
+            registry["broken"]
+    
+    def test_entry_points_discovered_lazily(self):
+        entry_points = [
+            self._entry_point("plugin", "multi_search_engine.engines.yahoo:YahooSearch"),
+            self._entry_point("bing", "somewhere.else:Bing"),
+        ]
+        with patch("multi_search_engine.registry._entry_points", return_value=entry_points) as discover:
+            registry = EngineRegistry()
+            assert "bing" in registry
+            discover.assert_not_called()
+            
+            assert registry.names()[-1] == "plugin"
+            assert registry.info("plugin").source == "entry_point"
+            assert registry["plugin"] is YahooSearch
+            assert registry["bing"] is BingSearch
+            discover.assert_called_once_with("searchengine.engines")
+    
+    @patch('requests.get')
+    def test_helpers_use_registry(self, mock_get):
+        from multi_search_engine.helpers import ENGINES
+        
+        class PluginSearch(BraveSearch):
+            ENGINE_NAME = "plugin"
+        
+        response = Mock()
+        response.status_code = 200
+        response.text = load_fixture("brave")
+        mock_get.return_value = response
+        
+        ENGINES.register("plugin", PluginSearch, fan_out=False, supports_country=False)
+        try:
+            assert "plugin" in get_available_engines()
+            assert "plugin" not in get_available_engines(supports_country=True)
+            with patch('time.sleep'):
+                results = quick_search("python", engine="plugin", health=HealthTracker())
+            assert results and results[0].engine == "plugin"
+        finally:
+            ENGINES.unregister("plugin")
+        assert "plugin" not in get_available_engines()
+
+
+class TestReentrantSearch:
+    """Test untuk SearchEngine.execute dan SearchResponse"""
+    
+    @patch('requests.get')
+    def test_execute_leaves_instance_untouched(self, mock_get):
+        import dataclasses
+        mock_get.return_value = mock_response(load_fixture("brave"))
+        engine = BraveSearch(delay=0, cache=MemoryCache())
+        
+        response = engine.execute("python")
+        assert isinstance(response, SearchResponse)
+        assert isinstance(response.results, tuple) and len(response) > 0
+        assert response.cache_status == "miss" and response.raw_html
+        assert {"cache_lookup", "delay", "fetch", "block_detect", "parse", "total"} <= set(response.timings)
+        assert response.elapsed >= response.timings["parse"]
+        assert engine.get_results() == [] and engine.get_raw_html() == ""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            response.results = ()
+        
+        cached = engine.execute("python")
+        assert cached.from_cache and cached.raw_html == "" and cached.url is None
+        assert [r.url for r in cached] == [r.url for r in response]
+        assert engine.execute("python", use_cache=False).cache_status == "bypass"
+        assert BraveSearch(delay=0).execute("python").cache_status == "bypass"
+    
+    @patch('requests.get')
+    def test_search_wrapper_keeps_legacy_state(self, mock_get):
+        mock_get.return_value = mock_response(load_fixture("brave"))
+        engine = BraveSearch(delay=0)
+        results = engine.search("python")
+        assert engine.get_results() is results
+        assert engine.get_raw_html() == load_fixture("brave")
+        assert engine.filter_by_domain(results[0].url.split("/")[2])
+    
+    @patch('requests.get')
+    def test_shared_instance_across_threads(self, mock_get):
+        from concurrent.futures import ThreadPoolExecutor
+        
+        def fake_get(url, **kwargs):
+            return mock_response(load_fixture("brave") if "alpha" in url else load_fixture("mojeek"))
+        
+        mock_get.side_effect = fake_get
+        engine = BraveSearch(delay=0)
+        queries = ["alpha", "beta"] * 8
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(engine.execute, queries))
+        
+        for query, response in zip(queries, responses):
+            assert response.query == query
+            assert bool(response.results) == (query == "alpha")
+    
+    def test_delay_slots_are_reserved_across_threads(self):
+        engine = BraveSearch(delay=1.0)
+        sleeps = []
+        with patch('time.sleep', side_effect=sleeps.append), patch('random.uniform', return_value=0.0):
+            threads = [threading.Thread(target=engine._apply_delay) for _ in range(3)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        assert len(sleeps) == 2
+        assert sorted(sleeps)[-1] > sorted(sleeps)[0] + 0.9
+
+
+class TestParseExecutor:
+    """Test untuk ParseExecutor (parsing di process pool)"""
+    
+    def test_small_pages_parse_inline(self):
+        executor = ParseExecutor(inline_threshold=10 ** 9)
+        results = executor.parse(BingSearch(), load_fixture("bing"))
+        assert results
+        assert executor.stats() == {"inline": 1, "offloaded": 0, "inline_threshold": 10 ** 9, "started": False}
+    
+    def test_offloaded_parse_matches_inline(self):
+        html = load_fixture("bing")
+        expected = [r.to_dict() for r in BingSearch()._parse_results(html)]
+        with ParseExecutor(max_workers=1, inline_threshold=0, warm_engines=["bing"]) as executor:
+            assert [r.to_dict() for r in executor.parse(BingSearch(), html)] == expected
+            
+            import asyncio
+            results = asyncio.run(executor.parse_async(BingSearch(), html))
+            assert [r.to_dict() for r in results] == expected
+            assert executor.stats()["offloaded"] == 2
+        assert not executor.stats()["started"]
+    
+    @patch('requests.get')
+    def test_engine_option_and_async_execute(self, mock_get):
+        import asyncio
+        response = Mock()
+        response.status_code = 200
+        response.text = load_fixture("brave")
+        mock_get.return_value = response
+        
+        with ParseExecutor(max_workers=1, inline_threshold=0, warm_engines=[]) as executor:
+            engine = BraveSearch(delay=0, parse_executor=executor)
+            sync = engine.execute("python")
+            async_response = asyncio.run(engine.execute_async("python"))
+            assert executor.stats()["offloaded"] == 2
+        assert [r.to_dict() for r in sync] == [r.to_dict() for r in async_response]
+        assert sync.results[0].engine == "brave" and sync.results[0].position == 1
+
+
+class TestSearchStream:
+    """Test untuk search_stream (parsing inkremental)"""
+    
+    def _streaming_response(self, html, chunk_size=512, progress=None):
+        data = html.encode("utf-8")
+        
+        def iter_content(chunk_size=chunk_size):
+            for i in range(0, len(data), chunk_size):
+                if progress is not None:
+                    progress.append(i)
+                yield data[i:i + chunk_size]
+        
+        response = Mock()
+        response.status_code = 200
+        response.encoding = "utf-8"
+        response.iter_content = iter_content
+        return response
+    
+    @pytest.mark.parametrize("engine_class", [BingSearch, BraveSearch, DuckDuckGoSearch, YahooSearch, GoogleSearch])
+    def test_stream_matches_search(self, engine_class):
+        name = engine_class.ENGINE_NAME
+        html = load_fixture(name)
+        with patch('requests.get') as mock_get:
+            mock_get.return_value = self._streaming_response(html)
+            cache = MemoryCache()
+            engine = engine_class(delay=0, cache=cache)
+            streamed = [r.to_dict() for r in engine.search_stream("python", chunk_size=300)]
+            assert mock_get.call_args.kwargs["stream"] is True
+            
+            mock_get.return_value = Mock(status_code=200, text=html)
+            expected = [r.to_dict() for r in engine_class(delay=0).search("python")]
+        
+        assert streamed == expected
+        assert [r.to_dict() for r in engine.search_stream("python")] == expected
+        assert mock_get.call_count == 2
+    
+    def test_splitter_buffer_stays_bounded(self):
+        html = load_fixture("bing")
+        whole = BlockSplitter(Strainer('li', class_='b_algo'))
+        expected = whole.feed(html) + whole.close()
+        
+        splitter = BlockSplitter(Strainer('li', class_='b_algo'))
+        fragments = []
+        largest = 0
+        for i in range(0, len(html), 7):
+            fragments.extend(splitter.feed(html[i:i + 7]))
+            largest = max(largest, len(splitter._buffer))
+        fragments.extend(splitter.close())
+        assert fragments == expected and len(expected) > 0
+        assert splitter.text == html and splitter.head(20) == html[:20]
+        assert largest <= max(len(f) for f in expected) + 1024
+    
+    @patch('requests.get')
+    def test_first_result_before_download_completes(self, mock_get):
+        html = load_fixture("bing")
+        progress = []
+        mock_get.return_value = self._streaming_response(html, progress=progress)
+        stream = BingSearch(delay=0).search_stream("python")
+        first = next(stream)
+        assert first.position == 1 and first.engine == "bing"
+        assert len(progress) < len(html.encode("utf-8")) // 512
+        stream.close()
+        mock_get.return_value.close.assert_called_once()
+    
+    @patch('requests.get')
+    def test_engine_without_strainer(self, mock_get):
+        import dataclasses
+        
+        class UnprunedBrave(BraveSearch):
+            RESULT_SPEC = dataclasses.replace(BraveSearch.RESULT_SPEC, prune=None)
+        
+        assert BlockSplitter(None).feed("<div>x</div>") == []
+        html = load_fixture("brave")
+        mock_get.return_value = self._streaming_response(html, chunk_size=300)
+        streamed = [r.to_dict() for r in UnprunedBrave(delay=0).search_stream("python")]
+        mock_get.return_value = Mock(status_code=200, text=html)
+        assert streamed == [r.to_dict() for r in BraveSearch(delay=0).search("python")]
+        assert len(streamed) > 0
+    
+    @pytest.mark.parametrize("status, error", [(429, RateLimitException), (403, BlockedException), (500, NetworkException)])
+    def test_failed_stream_open_closes_response(self, status, error):
+        import requests
+        
+        response = self._streaming_response("")
+        response.status_code = status
+        response.headers = {}
+        response.raise_for_status = Mock(side_effect=requests.exceptions.HTTPError("boom"))
+        with patch('requests.get', return_value=response):
+            with pytest.raises(error):
+                list(BraveSearch(delay=0).search_stream("python"))
+        response.close.assert_called()
+    
+    @patch('requests.get')
+    def test_blocked_page_raises_before_results(self, mock_get):
+        html = "<html><head><title>Access Denied</title></head><body>" + load_fixture("bing")
+        mock_get.return_value = self._streaming_response(html)
+        with pytest.raises(BlockedException):
+            next(BingSearch(delay=0).search_stream("python"))
+
+
+class TestDecoding:
+    """Test untuk decoding bytes-first (header -> meta -> default engine -> sniff)"""
+    
+    def test_encoding_sources(self):
+        body = "<html><head><meta charset='iso-8859-2'></head><body>Łódź</body></html>"
+        assert decode_html(body.encode("iso-8859-2"))[1:] == ("iso8859-2", "meta")
+        assert decode_html(body.encode("iso-8859-2"))[0].endswith("Łódź</body></html>")
+        
+        text, encoding, source = decode_html("żółw".encode("utf-8"), "text/html; charset=UTF-8")
+        assert (text, encoding, source) == ("żółw", "utf-8", "header")
+        assert decode_html(b"caf\xe9", "text/html; charset=ISO-8859-1")[1] == "cp1252"
+        assert decode_html("café".encode("utf-8"), "text/html", "utf-8")[1:] == ("utf-8", "default")
+        assert decode_html(b"\xef\xbb\xbfhi")[0:3] == ("hi", "utf-8", "bom")
+    
+    def test_sniff_is_bounded(self):
+        assert sniff_encoding(("a" * 8191 + "é").encode("utf-8"), limit=8192) == "utf-8"
+        assert decode_html("café".encode("utf-8"))[1:] == ("utf-8", "sniff")
+        assert decode_html(b"caf\xe9 " * 10)[1] != "utf-8"
+    
+    @patch('requests.get')
+    def test_fetch_decodes_content_and_emits_metrics(self, mock_get):
+        html = load_fixture("bing").replace("</h2>", "</h2><!-- é -->", 1)
+        response = Mock()
+        response.status_code = 200
+        response.content = html.encode("utf-8")
+        response.headers = {"Content-Type": "text/html"}
+        type(response).text = property(lambda self: pytest.fail("response.text tidak boleh dipakai"))
+        mock_get.return_value = response
+        
+        bus = EventBus()
+        aggregator = bus.subscribe(MetricsAggregator())
+        engine = BingSearch(delay=0, metrics=bus)
+        result = engine.execute("python")
+        
+        assert result.raw_html == html and len(result.results) == 10
+        assert "decode" in result.timings
+        assert aggregator.counter("decode", source="meta", encoding="utf-8") == 1
+        assert aggregator.summary()["bing"]["decode"]["count"] == 1
+    
+    @patch('requests.get')
+    def test_visit_uses_declared_charset(self, mock_get):
+        from multi_search_engine import visit_url
+        response = Mock()
+        response.status_code = 200
+        response.content = "<html><title>Señor</title><body>niño</body></html>".encode("cp1252")
+        response.headers = {"Content-Type": "text/html; charset=windows-1252"}
+        mock_get.return_value = response
+        
+        page = visit_url("https://example.com")
+        assert page.title == "Señor" and "niño" in page.text
+        assert page.encoding == "cp1252"
+
+
+class TestResultWindowCache:
+    """Test untuk cache per posisi (cache_windows=True)"""
+    
+    def test_window_ranges(self):
+        window = ResultWindow()
+        window.add(1, 5, [{"position": p} for p in range(1, 4)])
+        assert window.missing(1, 5) is None
+        assert window.missing(1, 10) == (6, 10)
+        window.add(11, 5, [{"position": 11}])
+        assert window.ranges == [[1, 5], [11, 15]]
+        assert window.missing(1, 20) == (6, 20)
+        assert window.slice(1, 11) == [{"position": p} for p in (1, 2, 3, 11)]
+        assert ResultWindow.from_payload(window.to_payload()).ranges == window.ranges
+    
+    def test_window_keeps_expiry_and_is_capped(self):
+        window = ResultWindow()
+        assert window.remaining_ttl(600) == pytest.approx(600, abs=1)
+        expires_at = window.expires_at
+        restored = ResultWindow.from_payload(window.to_payload())
+        with patch("time.time", return_value=expires_at - 100):
+            assert restored.remaining_ttl(600) == pytest.approx(100)
+        with patch("time.time", return_value=expires_at + 1):
+            assert restored.remaining_ttl(600) is None
+        assert ResultWindow().remaining_ttl(0) == 0
+        
+        window = ResultWindow()
+        for first in range(1, 101, 10):
+            window.add(first, 10, [{"position": p} for p in range(first, first + 10)])
+            window.trim(first + 9, max_positions=30)
+        assert window.ranges == [[71, 100]]
+        assert sorted(window.results) == list(range(71, 101))
+    
+    def test_plan_fetch_covers_gap(self):
+        assert plan_fetch(6, 10, 10) == (2, 5)
+        assert plan_fetch(4, 10, 10) == (1, 10)
+        assert plan_fetch(21, 30, 10) == (3, 10)
+    
+    @patch('requests.get')
+    def test_subwindows_and_partial_hits(self, mock_get):
+        response = Mock()
+        response.status_code = 200
+        response.text = load_fixture("brave")
+        mock_get.return_value = response
+        
+        engine = BraveSearch(delay=0, cache=MemoryCache(), cache_windows=True)
+        first = engine.execute("python", num_results=10)
+        assert first.cache_status == "miss" and len(first.results) == 10
+        
+        second = engine.execute("python", page=2, num_results=5)
+        assert second.cache_status == "hit"
+        assert [r.position for r in second.results] == [6, 7, 8, 9, 10]
+        assert [r.url for r in second.results] == [r.url for r in first.results[5:]]
+        assert mock_get.call_count == 1
+        
+        partial = engine.execute("python", page=2, num_results=10)
+        assert partial.cache_status == "miss"
+        third = engine.execute("python", page=1, num_results=15)
+        assert third.cache_status == "hit" and len(third.results) == 15
+        
+        engine = BraveSearch(delay=0, cache=MemoryCache(), cache_windows=True)
+        engine.execute("python", page=2, num_results=10)
+        partial = engine.execute("python", num_results=15)
+        assert partial.cache_status == "partial"
+        assert "offset=0&count=10" in mock_get.call_args.args[0]
+        assert [r.position for r in partial.results] == list(range(1, 16))
+        
+        assert engine.execute("Python", num_results=3, language="id").cache_status == "miss"
+        
+        cache = MemoryCache(default_ttl=600)
+        engine = BraveSearch(delay=0, cache=cache, cache_windows=True)
+        engine.execute("python", num_results=5)
+        key = next(iter(cache._cache))
+        expires_at = cache._cache[key]["expires_at"]
+        with patch("time.time", return_value=time.time() + 300):
+            engine.execute("python", page=2, num_results=5)
+        assert cache._cache[key]["expires_at"] == pytest.approx(expires_at, abs=1e-3)
+
+
+class TestQueryNormalization:
+    """Test untuk normalisasi query, cache key dan coalescing"""
+    
+    def test_normalizer(self):
+        normalizer = QueryNormalizer()
+        normalized = normalizer.normalize("  Python\u3000 Ｔｕｔｏｒｉａｌ ")
+        assert normalized.text == "Python Tutorial"
+        assert normalized.key == "python tutorial"
+        assert normalizer.normalize(normalized) is normalized
+        assert QueryNormalizer(casefold=False).normalize("Python  X").key == "Python X"
+        
+        operators = QueryNormalizer(operators=True)
+        key = operators.normalize('site:WWW.Python.org  "Async   IO" OR Tasks').key
+        assert key == '"async io" OR tasks site:python.org'
+        assert operators.normalize('tasks OR "async io" site:python.org').key != key
+        assert operators.normalize('"Async IO" OR tasks site:python.org').key == key
+        assert [q.text for q in dedupe_queries(["Python", " python ", "Rust"])] == ["Python", "Rust"]
+    
+    @patch('requests.get')
+    def test_equivalent_queries_share_cache(self, mock_get):
+        response = Mock()
+        response.status_code = 200
+        response.text = load_fixture("brave")
+        mock_get.return_value = response
+        
+        engine = BraveSearch(delay=0, cache=MemoryCache())
+        first = engine.execute("Python  Tutorial")
+        assert first.query == "Python  Tutorial" and first.query_key == "python tutorial"
+        assert "Python+Tutorial" in mock_get.call_args.args[0]
+        for query in ("python tutorial", " python tutorial ", "PYTHON TUTORIAL"):
+            assert engine.execute(query).cache_status == "hit"
+        assert mock_get.call_count == 1
+        assert list(engine.search_stream("python   tutorial")) == list(first.results)
+        assert mock_get.call_count == 1
+    
+    def test_single_flight_shares_result(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "value"
+        
+        outcomes = []
+        leader = threading.Thread(target=lambda: outcomes.append(flight.do("k", slow)))
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=lambda: outcomes.append(flight.do("k", slow)))
+        follower.start()
+        while flight.stats()["coalesced"] == 0:
+            time.sleep(0.001)
+        release.set()
+        leader.join(5)
+        follower.join(5)
+        assert sorted(outcomes) == [("value", False), ("value", True)]
+        assert len(calls) == 1 and flight.in_flight() == 0
+        
+        with pytest.raises(ValueError):
+            flight.do("k", lambda: (_ for _ in ()).throw(ValueError("boom")))
+        assert flight.in_flight() == 0
+    
+    @patch('requests.get')
+    def test_engine_coalesces_concurrent_searches(self, mock_get):
+        release = threading.Event()
+        response = Mock()
+        response.status_code = 200
+        response.text = load_fixture("brave")
+        
+        def slow_get(*args, **kwargs):
+            release.wait(5)
+            return response
+        
+        mock_get.side_effect = slow_get
+        engine = BraveSearch(delay=0, coalesce=True)
+        responses = []
+        threads = [
+            threading.Thread(target=lambda q=q: responses.append(engine.execute(q)))
+            for q in ("Python", "python ", " PYTHON")
+        ]
+        for thread in threads:
+            thread.start()
+        while engine.single_flight.stats()["coalesced"] < 2:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        assert mock_get.call_count == 1
+        assert sorted(r.coalesced for r in responses) == [False, True, True]
+        assert len({r.query_key for r in responses}) == 1
+
+
+class TestNegativeCache:
+    """Test untuk negative caching dan penanda blokir per engine"""
+    
+    @patch('requests.get')
+    def test_empty_results_are_cached_briefly(self, mock_get):
+        response = Mock()
+        response.status_code = 200
+        response.text = "<html><body>No results</body></html>"
+        mock_get.return_value = response
+        
+        metrics = EventBus()
+        stats = MetricsAggregator()
+        metrics.subscribe(stats)
+        engine = BraveSearch(delay=0, negative_cache=NegativeCache(empty_ttl=60), metrics=metrics)
+        assert engine.execute("nothing here").results == ()
+        second = engine.execute("Nothing  Here")
+        assert second.cache_status == "negative" and second.results == ()
+        assert list(engine.search_stream("nothing here")) == []
+        assert mock_get.call_count == 1
+        assert stats.counter("negative_cache_hit", "brave", outcome="empty") == 2
+        
+        engine.search("nothing here", force_refresh=True)
+        assert mock_get.call_count == 2
+        assert engine.execute("nothing here", page=2).cache_status == "bypass"
+        
+        engine = BraveSearch(delay=0, negative_cache=NegativeCache(empty_ttl=0))
+        engine.execute("nothing here")
+        engine.execute("nothing here")
+        assert mock_get.call_count == 5
+    
+    def test_exhausted_proxy_pool_does_not_block_engine(self):
+        pool = ProxyPool(["http://a:1"])
+        pool.proxies[0].evicted = True
+        negative = NegativeCache(engine_block_ttl=120)
+        engine = BraveSearch(delay=0, proxy=pool, negative_cache=negative)
+        with pytest.raises(ProxyPoolExhaustedException) as excinfo:
+            engine.search("python")
+        assert isinstance(excinfo.value, BlockedException)
+        assert negative.blocked_until("brave") is None
+        assert negative.store._cache == {}
+    
+    @patch('requests.get')
+    def test_blocked_engine_short_circuits(self, mock_get):
+        response = Mock()
+        response.status_code = 200
+        response.text = "<html><div id='captcha'></div></html>"
+        mock_get.return_value = response
+        
+        negative = NegativeCache(engine_block_ttl=120)
+        engine = BraveSearch(delay=0, negative_cache=negative)
+        with pytest.raises(BlockedException):
+            engine.search("python")
+        assert negative.blocked_until("brave") > time.time() + 100
+        assert negative.blocked_until("bing") is None
+        
+        with pytest.raises(BlockedException, match="cached blocked outcome"):
+            BraveSearch(delay=0, negative_cache=negative).search("rust")
+        with pytest.raises(BlockedException):
+            list(engine.search_stream("go"))
+        assert mock_get.call_count == 1
+        
+        response.text = load_fixture("brave")
+        assert len(engine.search("rust", force_refresh=True)) > 0
+        assert mock_get.call_count == 2
+        negative.unblock_engine("brave")
+        with pytest.raises(BlockedException):
+            engine.search("python")
+        assert len(engine.search("rust")) > 0
+        assert mock_get.call_count == 3
+    
+    @patch('requests.get')
+    def test_rate_limit_and_errors(self, mock_get):
+        import requests as requests_lib
+        
+        response = Mock()
+        response.status_code = 429
+        response.headers = {"Retry-After": "600"}
+        mock_get.return_value = response
+        
+        negative = NegativeCache(engine_block_ttl=30, error_ttl=60)
+        engine = BraveSearch(delay=0, negative_cache=negative)
+        with pytest.raises(RateLimitException):
+            engine.search("python")
+        assert negative.blocked_until("brave") > time.time() + 500
+        with pytest.raises(RateLimitException) as info:
+            engine.search("python")
+        assert info.value.retry_after > 500
+        
+        response.status_code = 500
+        response.raise_for_status.side_effect = requests_lib.exceptions.HTTPError("500")
+        engine = BingSearch(delay=0, negative_cache=negative)
+        for _ in range(2):
+            with pytest.raises(NetworkException):
+                engine.search("python")
+        assert mock_get.call_count == 2
+        assert negative.blocked_until("bing") is None
+
+
+class TestCacheWarming:
+    """Test untuk cache warming dari query log dan preload cache"""
+    
+    def test_read_and_rank_query_log(self, tmp_path):
+        log = tmp_path / "queries.log"
+        log.write_text(
+            "Python tutorial\n"
+            '{"query": "rust", "ts": 1}\n'
+            "\n"
+            "python  TUTORIAL\n"
+            '{"other": "x"}\n'
+            "Rust\n"
+            "python tutorial\n"
+            "go\n",
+            encoding="utf-8"
+        )
+        assert list(read_query_log(str(log)))[:2] == ["Python tutorial", "rust"]
+        ranked = rank_queries(read_query_log(str(log)), top_n=2)
+        assert [(q.text, count) for q, count in ranked] == [("Python tutorial", 3), ("rust", 2)]
+    
+    @patch('requests.get')
+    def test_warm_cache_fetches_top_queries(self, mock_get):
+        response = Mock()
+        response.status_code = 200
+        response.text = load_fixture("brave")
+        mock_get.return_value = response
+        
+        cache = MemoryCache()
+        engine = BraveSearch(delay=0, cache=cache)
+        engine.execute("rust")
+        report = warm_cache(["python", "Python", "rust", "go", "java"], engines=[engine], top_n=3)
+        assert report.queries == ["python", "rust", "go"]
+        assert (report.fetched, report.cached) == (2, 1)
+        assert mock_get.call_count == 3
+        assert engine.execute("PYTHON").cache_status == "hit"
+        
+        report = warm_cache(["python"], engines=[engine], refresh=True)
+        assert report.fetched == 1 and mock_get.call_count == 4
+    
+    @patch('requests.get')
+    def test_warm_cache_stops_blocked_engine(self, mock_get):
+        response = Mock()
+        response.status_code = 200
+        response.text = "<html><div id='captcha'></div></html>"
+        mock_get.return_value = response
+        
+        report = warm_cache(
+            ["a", "b", "c"], engines=["brave", "mojeek"], cache=MemoryCache(),
+            engine_options={"rate_limiter": None}
+        )
+        stats = report.engines["brave"]
+        assert (stats.failed, stats.skipped) == (1, 2) and "Captcha" in stats.error
+        assert mock_get.call_count == 2
+    
+    def test_preload_from_file_cache(self, tmp_path):
+        source = FileCache(str(tmp_path / "cache"))
+        source.set("fresh", [{"title": "a"}], ttl=600)
+        source.set("forever", {"x": 1}, ttl=0)
+        source.set("stale", [1], ttl=600)
+        path = source._get_cache_path("stale")
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        data["expires_at"] = time.time() - 1
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        
+        target = MemoryCache()
+        assert preload_cache(target, source) == 2
+        assert target.get("fresh") == [{"title": "a"}] and target.get("forever") == {"x": 1}
+        assert target._cache["forever"]["expires_at"] is None
+        assert 590 < target._cache["fresh"]["expires_at"] - time.time() <= 600
+        assert target.get("stale") is None
+    
+    @patch('requests.get')
+    def test_cli(self, mock_get, tmp_path, capsys):
+        response = Mock()
+        response.status_code = 200
+        response.text = load_fixture("brave")
+        mock_get.return_value = response
+        
+        log = tmp_path / "queries.log"
+        log.write_text("python\npython\nrust\n", encoding="utf-8")
+        cache_dir = tmp_path / "cache"
+        with patch("multi_search_engine.rate_limiter.time.sleep"):
+            code = warming_main([str(log), "--engines", "brave", "--top", "1", "--cache-dir", str(cache_dir)])
+        assert code == 0
+        report = json.loads(capsys.readouterr().out)
+        assert report["queries"] == ["python"] and report["fetched"] == 1
+        assert len(list(FileCache(str(cache_dir)).items())) == 1
+
+
+class TestCacheSnapshot:
+    """Test untuk snapshot cache (dump/load, mmap read-only, dump berkala)"""
+    
+    RESULTS = [{"title": "T", "url": "https://a.com", "description": "d", "position": 1, "engine": "bing", "extra": {}}]
+    
+    def _source(self):
+        cache = MemoryCache(codec=BinaryResultCodec())
+        cache.set("results", self.RESULTS, ttl=600)
+        cache.set("forever", {"n": 1}, ttl=0)
+        cache.set("stale", [1], ttl=600)
+        cache._cache["stale"]["expires_at"] = time.time() - 1
+        return cache
+    
+    def test_round_trip_skips_expired(self, tmp_path):
+        path = str(tmp_path / "cache.snap")
+        assert dump_snapshot(self._source(), path) == 2
+        
+        raw = MemoryCache(codec=BinaryResultCodec())
+        with patch.object(BinaryResultCodec, "decode", side_effect=AssertionError("decoded")):
+            assert load_snapshot(path, raw) == 2
+        assert raw.get("results") == self.RESULTS and raw.get("forever") == {"n": 1}
+        assert 590 < raw._cache["results"]["expires_at"] - time.time() <= 600
+        
+        plain = MemoryCache()
+        assert load_snapshot(path, plain) == 2
+        assert plain.get("results") == self.RESULTS and plain._cache["forever"]["expires_at"] is None
+        assert load_snapshot(str(tmp_path / "missing.snap"), plain) == 0
+        with pytest.raises(CacheException):
+            load_snapshot(path, MemoryCache(), codec=JSONCodec())
+    
+    def test_expired_entries_are_not_decoded(self, tmp_path):
+        path = str(tmp_path / "cache.snap")
+        source = self._source()
+        source.delete("results")
+        source.delete("forever")
+        source._cache["stale"]["expires_at"] = time.time() + 0.05
+        dump_snapshot(source, path)
+        time.sleep(0.1)
+        with patch.object(BinaryResultCodec, "decode", side_effect=AssertionError("decoded")):
+            assert load_snapshot(path, MemoryCache()) == 0
+    
+    def test_mmap_cache_is_read_only(self, tmp_path):
+        path = str(tmp_path / "cache.snap")
+        dump_snapshot(self._source(), path, codec=JSONCodec())
+        with SnapshotCache(path, codec=JSONCodec()) as shared, SnapshotCache(path, codec=JSONCodec()) as other:
+            assert len(shared) == 2 and shared.has("results") and not shared.has("stale")
+            assert shared.get("results") == self.RESULTS == other.get("results")
+            assert shared.set("new", [1]) is False and shared.get("new") is None
+            assert shared.delete("results") is False and shared.has("results")
+            
+            copy = MemoryCache()
+            assert preload_cache(copy, shared) == 2 and copy.get("forever") == {"n": 1}
+        
+        (tmp_path / "bad.snap").write_bytes(b"nope")
+        with pytest.raises(CacheException):
+            SnapshotCache(str(tmp_path / "bad.snap"))
+    
+    @patch('requests.get')
+    def test_engine_reads_snapshot(self, mock_get, tmp_path):
+        response = Mock()
+        response.status_code = 200
+        response.text = load_fixture("brave")
+        mock_get.return_value = response
+        
+        cache = MemoryCache()
+        BraveSearch(delay=0, cache=cache).execute("python")
+        path = str(tmp_path / "cache.snap")
+        dump_snapshot(cache, path)
+        
+        engine = BraveSearch(delay=0, cache=SnapshotCache(path))
+        assert engine.execute("Python").cache_status == "hit"
+        assert mock_get.call_count == 1
+    
+    def test_periodic_dump(self, tmp_path):
+        path = str(tmp_path / "cache.snap")
+        cache = self._source()
+        snapshot = PeriodicSnapshot(cache, path, interval=0.01).start()
+        deadline = time.time() + 5
+        while snapshot.dumps == 0 and time.time() < deadline:
+            time.sleep(0.005)
+        cache.set("late", [2], ttl=600)
+        snapshot.stop()
+        assert snapshot.dumps >= 2 and snapshot.last_error is None
+        restored = MemoryCache(codec=BinaryResultCodec())
+        assert load_snapshot(path, restored) == 3 and restored.get("late") == [2]
+
+
+class TestFileCacheIndex:
+    """Test untuk index in-process FileCache"""
+    
+    def test_misses_and_has_without_filesystem(self, tmp_path):
+        cache = FileCache(str(tmp_path))
+        cache.set("hit", [1], ttl=0)
+        cache.set("old", [2], ttl=600)
+        
+        reader = FileCache(str(tmp_path))
+        assert reader.has("hit") and reader.has("old")
+        later = time.time() + 700
+        with patch("builtins.open", side_effect=AssertionError("open")), \
+                patch("os.path.exists", side_effect=AssertionError("exists")), \
+                patch("os.stat", side_effect=AssertionError("stat")), \
+                patch("time.time", return_value=later):
+            assert reader.get("missing") is None
+            assert reader.has("hit") and not reader.has("missing") and not reader.has("old")
+        with patch("time.time", return_value=later):
+            assert reader.get("old") is None
+        assert not os.path.exists(cache._get_cache_path("old"))
+        assert reader.get("hit") == [1]
+    
+    def test_expiry_read_from_payload_not_mtime(self, tmp_path):
+        cache = FileCache(str(tmp_path), codec=BinaryResultCodec())
+        cache.set("ttl", [1], ttl=600)
+        cache.set("forever", [2], ttl=0)
+        # cp/rsync tanpa -t, restore backup, filesystem yang membulatkan mtime
+        for name in os.listdir(tmp_path):
+            os.utime(os.path.join(str(tmp_path), name), (0, 0))
+        
+        reopened = FileCache(str(tmp_path), codec=BinaryResultCodec())
+        assert reopened.has("ttl") and reopened.get("ttl") == [1]
+        assert reopened.cleanup_expired() == 0
+        with patch("time.time", return_value=time.time() + 700):
+            assert reopened.cleanup_expired() == 1
+        assert reopened.get("forever") == [2] and not reopened.has("ttl")
+        assert cache.delete("forever") and not cache.delete("forever")
+    
+    def test_expired_entries_answered_from_index(self, tmp_path):
+        cache = FileCache(str(tmp_path))
+        cache.set("k", [1], ttl=60)
+        with patch("time.time", return_value=time.time() + 120), \
+                patch("builtins.open", side_effect=AssertionError("open")):
+            assert not cache.has("k") and cache.get("k") is None
+        assert not os.path.exists(cache._get_cache_path("k"))
+    
+    def test_index_built_without_parsing_json(self, tmp_path):
+        FileCache(str(tmp_path)).set("k", [1], ttl=600)
+        FileCache(str(tmp_path)).set("forever", [2], ttl=0)
+        reader = FileCache(str(tmp_path))
+        with patch("json.load", side_effect=AssertionError("load")), \
+                patch("json.loads", side_effect=AssertionError("loads")):
+            reader.refresh_index()
+        assert 590 < reader._index[reader._file_id("k")] - time.time() <= 600
+        assert reader._index[reader._file_id("forever")] is None
+        
+        legacy_path = reader._get_cache_path("legacy")
+        with open(legacy_path, "w", encoding="utf-8") as f:
+            json.dump({"key": "legacy", "value": [3], "created_at": 0, "expires_at": None}, f)
+        reader.refresh_index()
+        assert reader.get("legacy") == [3]
+    
+    def test_cleanup_never_deletes_rewritten_entry(self, tmp_path):
+        cache = FileCache(str(tmp_path))
+        cache.set("k", [1], ttl=60)
+        FileCache(str(tmp_path), index=False).set("k", [2], ttl=3600)
+        with patch("time.time", return_value=time.time() + 120):
+            assert not cache.has("k")
+            assert cache.cleanup_expired() == 0
+            assert cache.has("k") and cache.get("k") == [2]
+    
+    def test_unindexed_cache_sees_other_writers(self, tmp_path):
+        reader = FileCache(str(tmp_path), index=False)
+        indexed = FileCache(str(tmp_path))
+        assert reader.get("k") is None and indexed.get("k") is None
+        FileCache(str(tmp_path)).set("k", [1])
+        assert reader.get("k") == [1] and reader.has("k")
+        assert indexed.get("k") is None
+        indexed.refresh_index()
+        assert indexed.get("k") == [1]